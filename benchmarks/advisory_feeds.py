@@ -0,0 +1,108 @@
+# Standard classes / libraries
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import tempfile
+import argparse
+import pandas as pd
+
+# Custom classes / libraries
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from classes.advisories import ADVISORY_COLUMNS
+from classes.feeds import load_feeds, CACHE_DIRECTORY
+
+def write_csaf(path: str, vulnerabilities: int) -> None:
+    """ Writes a CSAF document with CUCM versions and vulnerabilities with long notes.
+
+    Parameters
+    ----------
+    path : str
+        The path of the document.
+    vulnerabilities : int
+        The number of vulnerabilities.
+
+    Return
+    ----------
+    None
+    """
+
+    versions = ["{}.{}.1.{}-1".format(major, minor, build) for major in [11, 12, 14, 15] for minor in [0, 5] for build in range(10000, 30000, 1000)]
+    product_tree = {"branches": [{"category": "vendor", "name": "Cisco", "branches": [{
+        "category": "product_name",
+        "name": "Cisco Unified Communications Manager",
+        "branches": [
+            {"category": "product_version", "name": version, "product": {"product_id": "CUCM-" + version, "name": version}}
+            for version in versions
+        ]
+    }]}]}
+
+    with open(path, "w") as file:
+        file.write('{"document": {"title": "Benchmark", "tracking": {"id": "cisco-sa-benchmark"}}, "vulnerabilities": [')
+        for number in range(vulnerabilities):
+            affected = sorted(random.sample(range(len(versions)), 3))
+            file.write(("," if number else "") + json.dumps({
+                "cve": "CVE-2024-{:05d}".format(number),
+                "title": "Vulnerability {}".format(number),
+                "notes": [{"category": "description", "text": "Lorem ipsum " * 200}],
+                "product_status": {
+                    "known_affected": ["CUCM-" + versions[index] for index in affected[:2]],
+                    "fixed": ["CUCM-" + versions[affected[2]]]
+                }
+            }))
+        file.write('], "product_tree": ' + json.dumps(product_tree) + "}")
+
+def write_csv(path: str, advisories: int) -> None:
+    """ Writes a CSV feed with random advisories.
+
+    Parameters
+    ----------
+    path : str
+        The path of the feed.
+    advisories : int
+        The number of advisories.
+
+    Return
+    ----------
+    None
+    """
+
+    pd.DataFrame({
+        "advisory" : ["SA-{:06d}".format(number) for number in range(advisories)],
+        "title" : "Advisory",
+        "product" : [random.choice(["cucm", "imp", "cuc", "exp"]) for _ in range(advisories)],
+        "first_affected" : "12.5.1.10000-1",
+        "fixed" : "12.5.1.20000-1",
+        "severity" : [random.choice(["low", "medium", "high", "critical"]) for _ in range(advisories)]
+    }, columns=ADVISORY_COLUMNS).to_csv(path, index=False)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compares parsing the advisory feeds with reading the parsed cache.")
+    parser.add_argument("--vulnerabilities", type=int, default=20000)
+    parser.add_argument("--advisories", type=int, default=200000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    directory = tempfile.mkdtemp()
+    try:
+        write_csaf(os.path.join(directory, "csaf.json"), args.vulnerabilities)
+        write_csv(os.path.join(directory, "feed.csv"), args.advisories)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+        start = time.perf_counter()
+        parsed = load_feeds(directory)
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached = load_feeds(directory)
+        second = time.perf_counter() - start
+        assert cached.equals(parsed)
+
+        print("{:.0f} MB of feeds, {} advisories".format(size / 2 ** 20, len(parsed)))
+        print("{:<38}{:>10.3f}".format("first load, parsed [s]", first))
+        print("{:<38}{:>10.3f}".format("restart, cached [s]", second))
+        print("cache files: {}".format(len(os.listdir(os.path.join(directory, CACHE_DIRECTORY)))))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,91 @@
+# Standard classes / libraries
+import os
+import sys
+import time
+import random
+import tempfile
+import argparse
+import pandas as pd
+
+# Custom classes / libraries
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from classes.schema import read_customers, format_dates
+
+def write_dataset(path: str, rows: int) -> None:
+    """ Writes a synthetic "dataset.csv" with the given number of customers.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    rows : int
+        The number of customers.
+
+    Return
+    ----------
+    None
+    """
+
+    random.seed(0)
+    uc_versions = ["11.5.1.18000-21", "12.5.1.17900-64", "12.5.1.15900-66", "14.0.1.10000-20", ""]
+    exp_versions = ["X12.7.0", "X14.0.9", "X14.3.1", ""]
+
+    with open(path, "w") as file:
+        file.write("id,name,number,cucm,imp,cuc,exp,contract-expire\n")
+        for row in range(1, rows + 1):
+            file.write("{},customer{},{},{},{},{},{},{}/{}/{}\n".format(
+                row, row, row,
+                random.choice(uc_versions), random.choice(uc_versions), random.choice(uc_versions),
+                random.choice(exp_versions),
+                random.randint(1, 28), random.randint(1, 12), random.randint(2023, 2029)
+            ))
+
+def measure(load, repeat: int) -> tuple:
+    """ Returns the best load time in seconds and the memory usage in MB of a loader.
+
+    Parameters
+    ----------
+    load : function
+        Loads the Dataframe.
+    repeat : int
+        The number of runs.
+
+    Return
+    ----------
+    tuple
+    """
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = load()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, df.memory_usage(deep=True).sum() / 1024 / 1024
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compares the untyped and the typed load of dataset.csv.")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dataset.csv")
+        write_dataset(path, args.rows)
+
+        # The untyped load, the views parse the expiry dates again for every table
+        untyped = measure(lambda: pd.read_csv(path), args.repeat)
+        untyped_dates = measure(
+            lambda: pd.to_datetime(pd.read_csv(path)["contract-expire"], format="%d/%m/%Y").to_frame(),
+            args.repeat
+        )
+        typed = measure(lambda: read_customers(path), args.repeat)
+        typed_display = measure(lambda: format_dates(read_customers(path)["contract-expire"]).to_frame(), args.repeat)
+
+    print("{} rows".format(args.rows))
+    print("{:<38}{:>10}{:>12}".format("", "load [s]", "memory [MB]"))
+    print("{:<38}{:>10.3f}{:>12.1f}".format("pandas.read_csv", *untyped))
+    print("{:<38}{:>10.3f}{:>12}".format("pandas.read_csv + parse dates", untyped_dates[0], "-"))
+    print("{:<38}{:>10.3f}{:>12.1f}".format("read_customers (typed)", *typed))
+    print("{:<38}{:>10.3f}{:>12}".format("read_customers + format dates", typed_display[0], "-"))
+    print("memory reduction: {:.0%}".format(1 - typed[1] / untyped[1]))
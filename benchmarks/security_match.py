@@ -0,0 +1,210 @@
+# Standard classes / libraries
+import os
+import sys
+import re
+import time
+import random
+import argparse
+import pandas as pd
+
+# Custom classes / libraries
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from classes.schema import apply_schema, VERSION_COLUMNS
+from classes.advisories import ADVISORY_COLUMNS, summarize_exposures
+from classes.versions import version_key, version_array, versions_in_range
+from classes.AdvisoryIndex import AdvisoryIndex
+from classes.CustomerModel import CustomerModel
+from classes.ExposureModel import ExposureModel
+
+def uc_version(major: int) -> str:
+    """ Returns a random version of a UC product, e.g. "12.5.1.17900-64".
+
+    Parameters
+    ----------
+    major : int
+        The major version.
+
+    Return
+    ----------
+    str
+    """
+
+    return "{}.{}.1.{}-{}".format(major, random.choice([0, 5]), random.randint(10000, 99999), random.randint(1, 99))
+
+def exp_version() -> str:
+    """ Returns a random version of Expressway, e.g. "X14.0.9".
+
+    Parameters
+    ----------
+    None
+
+    Return
+    ----------
+    str
+    """
+
+    return "X{}.{}.{}".format(random.randint(8, 15), random.randint(0, 9), random.randint(0, 20))
+
+def make_version(product: str, major: int = None) -> str:
+    """ Returns a random version of a product.
+
+    Parameters
+    ----------
+    product : str
+        The version column of the product, e.g. "cucm".
+    major : int
+        The major version of a UC product, a random one if None.
+
+    Return
+    ----------
+    str
+    """
+
+    if product == "exp":
+        return exp_version()
+    return uc_version(major or random.choice([11, 12, 14, 15]))
+
+def write_data(customers: int, advisories: int, versions: int) -> tuple:
+    """ Returns synthetic customers and advisories.
+
+    Parameters
+    ----------
+    customers : int
+        The number of customers.
+    advisories : int
+        The number of advisories.
+    versions : int
+        The number of distinct versions per product.
+
+    Return
+    ----------
+    tuple
+    """
+
+    random.seed(0)
+    releases = {product: [make_version(product) for _ in range(versions)] + [""] for product in VERSION_COLUMNS}
+
+    df = pd.DataFrame({
+        "id" : range(1, customers + 1),
+        "name" : ["customer{}".format(row) for row in range(1, customers + 1)],
+        "number" : range(1, customers + 1),
+        **{product: random.choices(releases[product], k=customers) for product in VERSION_COLUMNS},
+        "contract-expire" : "1/1/2030"
+    })
+
+    rows = []
+    for number in range(advisories):
+        # Advisories affect the builds of one release train, until the fix
+        product = random.choice(VERSION_COLUMNS)
+        first = make_version(product)
+        parts = [int(part) for part in re.findall(r"[0-9]+", first)]
+        if product == "exp":
+            fixed = "X{}.{}.{}".format(parts[0], parts[1], parts[2] + random.randint(1, 5))
+        else:
+            fixed = "{}.{}.{}.{}-{}".format(parts[0], parts[1], parts[2], parts[3] + random.randint(1000, 10000), parts[4])
+        bounds = [first, fixed]
+        # A few advisories affect all versions before the fix or all versions from the first affected one
+        if random.random() < 0.01:
+            bounds[random.randint(0, 1)] = ""
+        severity = random.choice(["low", "medium", "high", "critical"])
+        rows.append(["SA-{:05d}".format(number), "Advisory {}".format(number), product, bounds[0], bounds[1], severity])
+
+    return apply_schema(df), pd.DataFrame(rows, columns=ADVISORY_COLUMNS)
+
+def nested_scan(customers: pd.DataFrame, advisories: pd.DataFrame) -> set:
+    """ Matches every customer against every advisory, like a straight forward implementation would.
+    A missing first affected or fixed version leaves the range open.
+
+    Parameters
+    ----------
+    customers : pandas.DataFrame
+        The customer datasets.
+    advisories : pandas.DataFrame
+        The advisories.
+
+    Return
+    ----------
+    set
+        The affected products, (customer ID, version column, advisory).
+    """
+
+    matches = set()
+    for customer in customers.itertuples(index=False):
+        for advisory in advisories.itertuples(index=False):
+            version = version_key(getattr(customer, advisory.product))
+            first, fixed = version_key(advisory.first_affected), version_key(advisory.fixed)
+            if version is not None and (first is None or first <= version) and (fixed is None or version < fixed):
+                matches.add((customer.id, advisory.product, advisory.advisory))
+    return matches
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compares the indexed advisory matching with a nested scan.")
+    parser.add_argument("--customers", type=int, default=20000)
+    parser.add_argument("--advisories", type=int, default=500)
+    parser.add_argument("--versions", type=int, default=500)
+    parser.add_argument("--sample", type=int, default=20, help="customers of the nested scan, which is extrapolated")
+    parser.add_argument("--edits", type=int, default=20, help="edited customers, the refresh time is averaged over")
+    args = parser.parse_args()
+
+    customers, advisories = write_data(args.customers, args.advisories, args.versions)
+
+    start = time.perf_counter()
+    index = AdvisoryIndex(advisories)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exposures = index.match(customers)
+    match = time.perf_counter() - start
+
+    # Range check of a whole column, e.g. for a compliance report
+    closed = (advisories["product"] == "cucm") & (advisories["first_affected"] != "") & (advisories["fixed"] != "")
+    first, fixed = advisories.loc[closed, ["first_affected", "fixed"]].iloc[0]
+    start = time.perf_counter()
+    text_check = [version_key(first) <= (version_key(version) or ()) < version_key(fixed) for version in customers["cucm"].astype(object)]
+    text_range = time.perf_counter() - start
+
+    start = time.perf_counter()
+    array_check = versions_in_range(version_array(customers["cucm"]), version_key(first), version_key(fixed))
+    array_range = time.perf_counter() - start
+    assert array_check.tolist() == text_check
+
+    # Re-evaluation of single edited customers, like after "Update a customer", on average over several edits
+    exposure_model = ExposureModel(CustomerModel(customers), index)
+    refresh = 0
+    for row in range(args.edits):
+        changed = exposure_model.customer_model.customer_rows([int(customers["id"].iat[row])])
+        changed["cucm"] = make_version("cucm")
+        exposure_model.customer_model.update_customers(changed)
+        start = time.perf_counter()
+        exposure_model.refresh()
+        refresh += (time.perf_counter() - start) / args.edits
+
+    # Security issues of a clicked customer, filtered from all matches or looked up in the summary
+    customer_id = int(exposures["id"].iat[len(exposures) // 2])
+    start = time.perf_counter()
+    filtered = exposures[exposures["id"] == customer_id]
+    summarize_exposures(filtered)
+    filter_lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exposure_model.customer_summary(customer_id)
+    exposure_model.customer_exposures(customer_id)
+    summary_lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sample = customers.head(args.sample)
+    scanned = nested_scan(sample, advisories)
+    scan = (time.perf_counter() - start) * len(customers) / len(sample)
+    indexed = index.match(sample)
+    assert set(zip(indexed["id"], indexed["product"], indexed["advisory"])) == scanned
+
+    print("{} customers, {} advisories, {} versions per product".format(args.customers, args.advisories, args.versions))
+    print("{:<38}{:>10.3f}".format("build index [s]", build))
+    print("{:<38}{:>10.3f}".format("match all customers [s]", match))
+    print("{:<38}{:>10.1f}".format("nested scan, extrapolated [s]", scan))
+    print("{:<38}{:>10.3f}".format("refresh after editing a customer [s]", refresh))
+    print("{:<38}{:>10.4f}".format("customer issues, filtered [s]", filter_lookup))
+    print("{:<38}{:>10.4f}".format("customer issues, summary [s]", summary_lookup))
+    print("{:<38}{:>10.3f}".format("range check of a column, per row [s]", text_range))
+    print("{:<38}{:>10.3f}".format("range check of a column, arrays [s]", array_range))
+    print("affected products: {}".format(len(exposures)))
@@ -0,0 +1,208 @@
+# Standard classes / libraries
+import numpy as np
+import pandas as pd
+
+# Custom classes / libraries
+from classes.advisories import *
+from classes.versions import *
+
+class AdvisoryIndex:
+    """
+    A class used to look up the security advisories, which affect a product version.
+
+    The affected version ranges of every product are split at all first affected and
+    fixed versions into adjacent intervals. Every interval keeps the list of the
+    advisories covering it, so a version is looked up with a binary search over the
+    interval bounds, no matter how many advisories exist. The versions are compared as
+    integer arrays, see "classes.versions". Customers are matched per distinct version,
+    most customers share a few releases.
+
+    Methods
+    -------
+    index_product(str)
+        Builds the sorted intervals of a product.
+    intervals(str, numpy.ndarray)
+        Returns the intervals of a product, which contain the versions.
+    lookup(str, str)
+        Returns the advisories, which affect a product version.
+    product_advisories(str)
+        Returns the advisories of a product.
+    match(pandas.DataFrame, list)
+        Returns every affected product of every customer with the advisory.
+    """
+
+    def __init__(self, advisories: pd.DataFrame) -> None:
+        """
+        Parameters
+        ----------
+        advisories : pandas.DataFrame
+            The security advisories, see "read_advisories".
+        """
+
+        self.advisories = advisories.reset_index(drop=True)
+        self.products = {product: self.index_product(product) for product in VERSION_COLUMNS}
+
+    def index_product(self, product: str) -> dict:
+        """ Builds the sorted intervals of a product.
+
+        Parameters
+        ----------
+        product : str
+            The version column of the product, e.g. "cucm".
+
+        Return
+        ----------
+        dict
+        """
+
+        rows = np.flatnonzero((self.advisories["product"] == product).to_numpy())
+
+        # Unknown first affected versions affect all older versions, unknown fixed versions all newer ones
+        starts = version_array(self.advisories["first_affected"].iloc[rows])
+        starts[version_missing(starts)] = 0
+        ends = version_array(self.advisories["fixed"].iloc[rows])
+        ends[version_missing(ends)] = MAX_COMPONENT
+
+        # Interval i reaches from bounds[i] to bounds[i + 1], the upper bound is not included
+        first, last = version_ranks(starts, ends)
+        bounds = np.zeros((len(np.unique(np.concatenate([first, last]))), VERSION_PARTS), dtype=np.int32)
+        bounds[first] = starts
+        bounds[last] = ends
+        counts = np.maximum(last - first, 0)
+
+        # Intervals covered by every advisory, grouped by interval
+        intervals = expand_ranges(first, counts)
+        advisories = np.repeat(rows, counts)
+        order = np.argsort(intervals, kind="stable")
+
+        return {
+            "bounds" : bounds,
+            "interval_starts" : np.searchsorted(intervals[order], np.arange(len(bounds) + 1)),
+            "interval_advisories" : advisories[order]
+        }
+
+    def intervals(self, product: str, versions: np.ndarray) -> np.ndarray:
+        """ Returns the intervals of a product, which contain the versions.
+
+        Parameters
+        ----------
+        product : str
+            The version column of the product, e.g. "cucm".
+        versions : numpy.ndarray
+            The versions, see "version_array".
+
+        Return
+        ----------
+        numpy.ndarray
+            The interval of every version, -1 for missing versions and versions before the first interval.
+        """
+
+        index = self.products[product]
+        bound_ranks, ranks = version_ranks(index["bounds"], versions)
+        intervals = np.searchsorted(bound_ranks, ranks, side="right") - 1
+        intervals[version_missing(versions)] = -1
+        return intervals
+
+    def lookup(self, product: str, version: str) -> np.ndarray:
+        """ Returns the advisories, which affect a product version.
+
+        Parameters
+        ----------
+        product : str
+            The version column of the product, e.g. "cucm".
+        version : str
+            The version.
+
+        Return
+        ----------
+        numpy.ndarray
+            The rows of the advisories.
+        """
+
+        index = self.products[product]
+        interval = self.intervals(product, version_array([version]))[0]
+        if interval < 0:
+            return np.zeros(0, dtype=np.int64)
+        return index["interval_advisories"][index["interval_starts"][interval]:index["interval_starts"][interval + 1]]
+
+    def product_advisories(self, product: str) -> pd.DataFrame:
+        """ Returns the advisories of a product.
+
+        Parameters
+        ----------
+        product : str
+            The version column of the product, e.g. "cucm".
+
+        Return
+        ----------
+        pandas.DataFrame
+        """
+
+        return self.advisories[self.advisories["product"] == product].reset_index(drop=True)
+
+    def match(self, customers: pd.DataFrame, products: list = VERSION_COLUMNS) -> pd.DataFrame:
+        """ Returns every affected product of every customer with the advisory.
+
+        Parameters
+        ----------
+        customers : pandas.DataFrame
+            The customer datasets.
+        products : list
+            The version columns of the products, which are matched.
+
+        Return
+        ----------
+        pandas.DataFrame
+            The columns EXPOSURE_COLUMNS.
+        """
+
+        exposures = []
+        for product in products:
+            index = self.products[product]
+            codes, versions = pd.factorize(customers[product].astype(object))
+
+            # Every distinct version is looked up once, all of them with a single search
+            intervals = self.intervals(product, version_array(versions))
+            found = intervals >= 0
+            begins = np.where(found, index["interval_starts"][intervals], 0)
+            counts = np.where(found, index["interval_starts"][intervals + 1], 0) - begins
+            pairs = pd.DataFrame({
+                "code" : np.repeat(np.arange(len(versions)), counts),
+                "advisory_row" : index["interval_advisories"][expand_ranges(begins, counts)]
+            })
+
+            rows = pd.DataFrame({"code" : codes, "row" : np.arange(len(codes))}).merge(pairs, on="code")
+            advisories = self.advisories.iloc[rows["advisory_row"]]
+            exposures.append(pd.DataFrame({
+                "id" : customers["id"].to_numpy()[rows["row"]],
+                "name" : customers["name"].to_numpy()[rows["row"]],
+                "product" : product,
+                "version" : versions.to_numpy()[rows["code"]].astype(str),
+                "advisory" : advisories["advisory"].to_numpy(),
+                "title" : advisories["title"].to_numpy(),
+                "fixed" : advisories["fixed"].to_numpy(),
+                "severity" : advisories["severity"].to_numpy()
+            }))
+
+        if not exposures:
+            return pd.DataFrame(columns=EXPOSURE_COLUMNS)
+        return pd.concat(exposures, ignore_index=True).sort_values(["name", "product", "advisory"], kind="stable", ignore_index=True)
+
+def expand_ranges(begins: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """ Returns all numbers of several ranges, e.g. the begins [3, 7] and counts [2, 1] give [3, 4, 7].
+
+    Parameters
+    ----------
+    begins : numpy.ndarray
+        The first number of every range.
+    counts : numpy.ndarray
+        The length of every range.
+
+    Return
+    ----------
+    numpy.ndarray
+    """
+
+    counts = np.asarray(counts, dtype=np.int64)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(np.asarray(begins, dtype=np.int64), counts) + offsets
@@ -0,0 +1,138 @@
+# Standard classes / libraries
+from PyQt5.QtCore import Qt, QEvent, QModelIndex, QPersistentModelIndex, QSize, QMargins, pyqtSignal
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication, QPushButton
+
+class ButtonDelegate(QStyledItemDelegate):
+    """
+    A class used to paint a push button in every cell of a table column.
+
+    No widgets are created for the cells, the buttons are only painted and the
+    mouse clicks are mapped to the rows of the table.
+
+    Methods
+    -------
+    paint(QPainter, QStyleOptionViewItem, QModelIndex)
+        Paints the button of a table cell.
+    sizeHint(QStyleOptionViewItem, QModelIndex)
+        Returns the size of the button.
+    style(QStyleOptionViewItem)
+        Returns the style of the table view, which also contains the style sheet.
+    editorEvent(QEvent, QAbstractItemModel, QStyleOptionViewItem, QModelIndex)
+        Emits "clicked", when the button of a table cell is clicked.
+    """
+
+    clicked = pyqtSignal(QModelIndex)
+
+    def __init__(self, text: str, parent=None) -> None:
+        """
+        Parameters
+        ----------
+        text : str
+            The label of the buttons.
+        parent : PyQt5.QtWidgets.QWidget
+            The table view.
+        """
+
+        QStyledItemDelegate.__init__(self, parent)
+
+        self.text = text
+        # Cell of the button, which is held down
+        self.pressed = QPersistentModelIndex()
+        # Never shown, only lets the style sheet rules of "QPushButton" apply to the painted buttons
+        self.button = QPushButton(parent)
+        self.button.hide()
+
+    def paint(self, painter, option, index: QModelIndex) -> None:
+        """ Paints the button of a table cell.
+
+        Parameters
+        ----------
+        painter : PyQt5.QtGui.QPainter
+            The painter of the table view.
+        option : PyQt5.QtWidgets.QStyleOptionViewItem
+            The geometry and state of the table cell.
+        index : PyQt5.QtCore.QModelIndex
+            The table cell.
+
+        Return
+        ----------
+        None
+        """
+
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = self.text
+        button.state = QStyle.State_Enabled | (QStyle.State_Sunken if self.pressed == index else QStyle.State_Raised)
+
+        self.style(option).drawControl(QStyle.CE_PushButton, button, painter, self.button)
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        """ Returns the size of the button.
+
+        Parameters
+        ----------
+        option : PyQt5.QtWidgets.QStyleOptionViewItem
+            The geometry and state of the table cell.
+        index : PyQt5.QtCore.QModelIndex
+            The table cell.
+
+        Return
+        ----------
+        PyQt5.QtCore.QSize
+        """
+
+        button = QStyleOptionButton()
+        button.text = self.text
+        text_size = option.fontMetrics.size(Qt.TextShowMnemonic, self.text)
+
+        return self.style(option).sizeFromContents(QStyle.CT_PushButton, button, text_size, self.button).grownBy(QMargins(2, 2, 2, 2))
+
+    def style(self, option) -> QStyle:
+        """ Returns the style of the table view, which also contains the style sheet.
+
+        Parameters
+        ----------
+        option : PyQt5.QtWidgets.QStyleOptionViewItem
+            The geometry and state of the table cell.
+
+        Return
+        ----------
+        PyQt5.QtWidgets.QStyle
+        """
+
+        if option.widget is not None:
+            return option.widget.style()
+        return QApplication.style()
+
+    def editorEvent(self, event: QEvent, model, option, index: QModelIndex) -> bool:
+        """ Emits "clicked", when the button of a table cell is clicked.
+
+        Parameters
+        ----------
+        event : PyQt5.QtCore.QEvent
+            The mouse event.
+        model : PyQt5.QtCore.QAbstractItemModel
+            The model of the table view.
+        option : PyQt5.QtWidgets.QStyleOptionViewItem
+            The geometry and state of the table cell.
+        index : PyQt5.QtCore.QModelIndex
+            The table cell.
+
+        Return
+        ----------
+        bool
+            If the event was handled.
+        """
+
+        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            self.pressed = QPersistentModelIndex(index)
+            return True
+
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            clicked = self.pressed == index and option.rect.contains(event.pos())
+            self.pressed = QPersistentModelIndex()
+            if clicked:
+                self.clicked.emit(index)
+            return True
+
+        return False
@@ -1,418 +1,801 @@
-# Standard classes / libraries
-import pandas as pd
-from hashlib import sha256
-from PyQt5.QtWidgets import QMessageBox
-
-# Custom classes / libraries
-from classes.CsvFileAccess import *
-from classes.LoginView import *
-from classes.MainView import *
-from classes.ShowCustomersView import *
-from classes.AddCustomerView import *
-from classes.UpdateCustomerView import *
-from classes.DeleteCustomerView import *
-from classes.SecurityIssuesView import *
-from classes.helper import get_row_index
-
-class Controller:
-    """ A class used to represent Controller in an MVC architecture.
-
-    Methods
-    -------
-    raise_login_view()
-        Displays the login window.
-    raise_main_view()
-        Displays the main menu window.
-    raise_customers_view()
-        Displays the "Show all customers" window. 
-    raise_add_customer_view()
-        Displays the "Add a customer" window.
-    raise_update_customer_view()
-        Displays the "Update a customer" window.
-    raise_delete_customer_view()
-        Displays the "Delete customers" window.
-    validate_login(username=str, passwor=str)
-        Validates the login, when the "Login" button in the Login window is clicked.
-    add_new_customer(data=pandas.DataFrame)
-        Stores the new customer and it's information in the database.
-    update_customer(updated_customers=pandas.DataFrame)
-        Stores the updated customers table in the database.
-    delete_customer(row_data=list)
-        Deletes a customer from the database.
-    """
-
-    show_customers_view = 0
-    add_customer_view = 0
-    update_customer_view = 0
-    delete_customer_view = 0
-
-    def __init__(self, path: str) -> None:
-        """
-        Parameters
-        ----------
-        path : str
-            The absolute path of the working directory
-        """
-
-        self.db_access = CsvFileAccess()
-        self.db_access.path = path
-
-        self.login_view = LoginView(self.validate_login)
-        self.login_view.show()
-        self.path = path
-        self.security_view_raised = False
-
-    def raise_login_view(self) -> None:
-        """ Displays the login window.
-
-        Parameters
-        ----------
-        none
-
-        Return
-        ----------
-        none
-        """
-
-        self.login_view = LoginView(self.validate_login)
-
-        if self.main_view != 0:
-            self.main_view.close()
-        if self.show_customers_view != 0:
-            self.show_customers_view.close()
-        if self.add_customer_view != 0:
-            self.add_customer_view.close()
-        if self.update_customer_view != 0:
-            self.update_customer_view.close()
-        if self.delete_customer_view != 0:
-            self.delete_customer_view.close()
-        self.login_view.show()
-
-    def raise_main_view(self) -> None:
-        """ Displays the main menu window.
-
-        Parameters
-        ----------
-        none
-
-        Return
-        ----------
-        none
-        """
-
-        self.main_view = MainView(self.user_priv)
-        self.main_view.switch_show_customers.connect(self.raise_customers_view)
-        self.main_view.switch_add_customer.connect(self.raise_add_customer_view)
-        self.main_view.switch_update_customer.connect(self.raise_update_customer_view)
-        self.main_view.switch_delete_customer.connect(self.raise_delete_customer_view)
-        self.main_view.switch_logout.connect(self.raise_login_view)
-    
-        if self.login_view != 0:
-            self.login_view.close()
-        if self.show_customers_view != 0:
-            self.show_customers_view.close()
-        if self.add_customer_view != 0:
-            self.add_customer_view.close()
-        if self.update_customer_view != 0:
-            self.update_customer_view.close()
-        if self.delete_customer_view != 0:
-            self.delete_customer_view.close()
-
-        self.main_view.show()
-
-        if self.security_view_raised == False:
-            self.security_view_raised = True
-            self.security_view = SecurityIssuesView()
-            self.security_view.show()
-
-    def raise_customers_view(self) -> None:
-        """ Displays the "Show all customers" window.
-
-        Parameters
-        ----------
-        none
-
-        Return
-        ----------
-        none
-        """
-
-        self.show_customers_view = ShowCustomersView(self.db_access.read_all(self.path + "/data/dataset.csv"))
-        self.show_customers_view.switch_main.connect(self.raise_main_view)
-        self.show_customers_view.switch_logout.connect(self.raise_login_view)
-        self.main_view.close()
-        self.show_customers_view.show()
-
-    def raise_add_customer_view(self) -> None:
-        """ Displays the "Add a customer" window.
-
-        Parameters
-        ----------
-        none
-
-        Return
-        ----------
-        none
-        """
-
-        self.add_customer_view = AddCustomerView(self.add_new_customer)
-        self.add_customer_view.switch_main.connect(self.raise_main_view)
-        self.add_customer_view.switch_logout.connect(self.raise_login_view)
-        self.main_view.close()
-        self.add_customer_view.show()
-
-    def raise_update_customer_view(self) -> None:
-        """ Displays the "Update a customer" window.
-
-        Parameters
-        ----------
-        none
-
-        Return
-        ----------
-        none
-        """
-
-        self.update_customer_view = UpdateCustomerView(self.update_customer, self.db_access.read_all(self.path + "/data/dataset.csv"))
-        self.update_customer_view.switch_main.connect(self.raise_main_view)
-        self.update_customer_view.switch_logout.connect(self.raise_login_view)
-        self.main_view.close()
-        self.update_customer_view.show()
-
-    def raise_delete_customer_view(self) -> None:
-        """ Displays the "Delete customers" window.
-
-        Parameters
-        ----------
-        none
-
-        Return
-        ----------
-        none
-        """
-
-        self.delete_customer_view = DeleteCustomerView(self.delete_customer, self.db_access.read_all(self.path + "/data/dataset.csv"))
-        self.delete_customer_view.switch_main.connect(self.raise_main_view)
-        self.delete_customer_view.switch_logout.connect(self.raise_login_view)
-        self.main_view.close()
-        self.delete_customer_view.show()
-
-    def validate_login(self, username: str, password: str) -> None:
-        """ Validates the login, when the "Login" button in the Login window is clicked.
-        After successfull login, the Main window is raised.
-
-        Parameters
-        ----------
-        username : str
-            Contains the login username.
-        password : str
-            Contains the login password.
-
-        Return
-        ----------
-        none
-        """
-
-        df_users = self.db_access.read_all(self.path + "/data/users.csv")
-
-        # Get the row index of the user in the dataframe
-        row_index = get_row_index(df_users["username"].map(str).to_list(), username)
-
-        # Check if user exists and the passwords match for the given user
-        if (
-                username in df_users["username"].values and
-                sha256(bytes(password, "utf-8")).hexdigest() == df_users["password"][row_index]
-            ):
-            self.user_priv = df_users["privilege"][row_index]
-            self.raise_main_view()
-        else:
-            # Runs and displays the MessageBox, as long as the user acknowledges the popup window
-            ack = False
-            while not ack:
-                choice = QMessageBox.critical(
-                    None,
-                    " ",
-                    "Username oder Passwort falsch!",
-                    QMessageBox.Ok
-                )
-
-                if choice:
-                    ack = True
-
-    def add_new_customer(self, data: pd.DataFrame) -> bool:
-        """ Stores the new customer and it's information in the database.
-
-        Parameters
-        ----------
-        data : pandas.DataFrame
-            Contains the information of the new customer.
-
-        Return
-        ----------
-        status : bool
-            If the customer could be saved in the database or not.
-        """
-
-        # Represents the status of the addition of the customer to the database.
-        status = False
-
-        current_customers = self.db_access.read_all(self.path + "/data/dataset.csv")
-
-        # Customer name, customer numbers and a contract expiry date must be set
-        if data["name"][0] and data["number"][0] and data["contract-expire"][0]:
-
-            new_customer_name = str(data["name"][0])
-            new_customer_number = str(data["number"][0])
-            
-            # Check, if the new customer name is already used by any existing customer
-            if (
-                    new_customer_name in current_customers["name"].map(str).to_list() or
-                    new_customer_number in current_customers["number"].map(str).to_list()
-                ):
-                # Runs and displays the MessageBox, as long as the user acknowledges the popup window
-                ack = False
-                while not ack:
-                    choice = QMessageBox.critical(
-                        None,
-                        " ",
-                        "Kundenname und / oder Kundennummer existieren bereits!",
-                        QMessageBox.Ok
-                    )
-
-                    if choice:
-                        ack = True
-            else:
-                # Check for a new ID, which is not already used for an existing customer
-                unused_index = False
-                new_id = 1
-
-                while not unused_index:
-                    if new_id not in current_customers["id"].values:
-                        unused_index = True
-                    else:
-                        new_id += 1
-                data.at[0, "id"] = new_id
-
-                ack = False
-
-                result =  self.db_access.add(data)
-
-                # Runs and displays the MessageBox, so long till the user acknowledges the popup window
-                while not ack:
-                    if result[0]:
-                        choice = QMessageBox.information(
-                            None,
-                            " ",
-                            "Der Kunde wurde erfolgreich angelegt.",
-                            QMessageBox.Ok
-                        )
-                        status = True
-                    if not result[0] and result[1] == 0:
-                        choice = QMessageBox.critical(
-                            None,
-                            " ",
-                            "Der Kunde konnte nicht angelegt werden!\nDas File existiert nicht!",
-                            QMessageBox.Ok
-                        )
-
-                    if choice:
-                        ack = True
-        else:
-            ack = False
-            # Runs and displays the MessageBox, until the user acknowledges the popup window.
-            while not ack:
-                choice = QMessageBox.critical(
-                    None,
-                    " ",
-                    "Es wurde kein Kundenname, keine Kundennummer oder Vertragslaufzeit angegeben!",
-                    QMessageBox.Ok
-                )
-
-                if choice:
-                    ack = True
-
-        return status
-
-    def update_customer(self, updated_customers: pd.DataFrame) -> None:
-        """ Stores the updated customers table in the database.
-
-        Parameters
-        ----------
-        updated_customers : pandas.DataFrame
-            Contains the information of the Table widget.
-
-        Return
-        ----------
-        None
-        """
-
-        result = self.db_access.update(updated_customers)
-
-        ack = False
-
-        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
-        while not ack:
-            if result[0]:
-                choice = QMessageBox.information(
-                    None,
-                    " ",
-                    "Die Kundendaten wurden erfolgreich geändert.",
-                    QMessageBox.Ok
-                )
-            if not result[0] and result[1] == 0:
-                choice = QMessageBox.critical(
-                    None,
-                    " ",
-                    "Der Kundendaten konnten nicht geändert werden. Kein Zugriff auf die Datenbank!",
-                    QMessageBox.Ok
-                )
-
-            if choice:
-                break
-
-    def delete_customer(self, row_data: list) -> bool:
-        """ Deletes a customer from the database.
-
-        Parameters
-        ----------
-        row_data : list
-            Contains the row data (customer information) of the table widget, which should be deleted.
-
-        Return
-        ----------
-        status : bool
-            Represents the status, if the delete operation of the customer was successful or not.
-        """
-
-        current_customers = self.db_access.read_all(self.path + "/data/dataset.csv")
-        # Get the row index, which contains
-        row_id = get_row_index(current_customers["number"].map(str).to_list(), str(row_data[1]))
-        updated_customers = current_customers.drop(row_id)
-
-        result = self.db_access.delete(updated_customers)
-
-        ack = False
-        status = False
-
-        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
-        while not ack:
-            if result[0]:
-                choice = QMessageBox.information(
-                    None,
-                    " ",
-                    "Der Kunde wurde erfolgreich gelöscht.",
-                    QMessageBox.Ok
-                )
-                status = True
-            if not result[0] and result[1] == 0:
-                choice = QMessageBox.critical(
-                    None,
-                    " ",
-                    "Der Kunde konnte nicht gelöscht werden!\nDas File existiert nicht!",
-                    QMessageBox.Ok
-                )
-
-            if choice:
-                break
-        
-        return status
\ No newline at end of file
+# Standard classes / libraries
+from __future__ import annotations
+import configparser
+from hashlib import sha256
+from PyQt5.QtWidgets import QMessageBox
+
+# Custom classes / libraries
+# Only the login window is imported up front. Pandas, the storage backends and the
+# other views are imported in the background, while the login window is shown.
+from classes.LoginView import *
+from classes.StorageWorker import *
+from classes.startup import warm_up
+
+class Controller:
+    """ A class used to represent Controller in an MVC architecture.
+
+    Methods
+    -------
+    raise_login_view()
+        Displays the login window.
+    raise_main_view()
+        Displays the main menu window.
+    raise_customers_view()
+        Displays the "Show all customers" window. 
+    raise_add_customer_view()
+        Displays the "Add a customer" window.
+    raise_update_customer_view()
+        Displays the "Update a customer" window.
+    raise_delete_customer_view()
+        Displays the "Delete customers" window.
+    raise_security_view()
+        Displays the security issues of all customers.
+    security_view_loaded(advisory_index=AdvisoryIndex)
+        Shows the security issues, when the advisory feeds are read.
+    reload_advisories()
+        Reads the advisory feeds again in the background.
+    advisories_loaded(advisory_index=AdvisoryIndex)
+        Re-evaluates the security issues of the products, whose advisories changed.
+    show_view(name=str)
+        Displays a view of the registry and hides all other views.
+    prefetch_customers()
+        Reads and prepares the customer datasets in the background.
+    prefetch_done(prepared=dict)
+        Creates the shared customer model from the prefetched datasets.
+    shared_customer_model()
+        Returns the customer model, which is shared by all views.
+    validate_login(username=str, passwor=str)
+        Validates the login, when the "Login" button in the Login window is clicked.
+    add_new_customer(data=pandas.DataFrame)
+        Stores the new customer and it's information in the database.
+    update_customer(updated_customers=pandas.DataFrame)
+        Stores the updated customers in the database.
+    delete_customer(row_data=list)
+        Deletes a customer from the database.
+    delete_customers(numbers=list)
+        Deletes several customers from the database at once.
+    import_customers(path=str)
+        Imports the customers of a CSV or JSONL file into the database.
+    db_access
+        The storage backend of the datasets, created on first use.
+    """
+
+    # Customer datasets of all views, read once after the login
+    customer_model = None
+    # Background read of the customer datasets, started when the main menu is shown
+    prefetch_task = None
+    # Security advisories, which affect the customers, kept up to date with the customer model
+    exposure_model = None
+    # Background read of the advisory feeds
+    advisory_task = None
+
+    def __init__(self, path: str) -> None:
+        """
+        Parameters
+        ----------
+        path : str
+            The absolute path of the working directory
+        """
+
+        # Storage backend of the datasets, as configured in "config.ini"
+        self.config = configparser.ConfigParser()
+        self.config.read(path + "/config.ini")
+        self.backend = None
+        self.feed_directory = path + "/" + self.config.get("advisories", "feed_directory", fallback="data/advisories")
+
+        # Runs the storage calls in the background, one after another
+        self.storage = StorageWorker()
+
+        # Views of the logged in user, constructed when they are first raised: {name: view}
+        self.views = {}
+
+        self.login_view = LoginView(self.validate_login)
+        self.login_view.show()
+        self.path = path
+        self.security_view_raised = False
+
+        # Loads the modules of the other views, while the user types the password
+        self.storage.submit(warm_up, busy=False)
+
+    @property
+    def db_access(self):
+        """ The storage backend of the datasets, as configured in "config.ini".
+        The backend is created on first use, its module needs pandas.
+
+        Return
+        ----------
+        DatabaseAccess
+        """
+
+        if self.backend is None:
+            if self.config.get("database", "backend", fallback="csv") == "sqlite":
+                from classes.SqliteAccess import SqliteAccess
+                backend = SqliteAccess()
+                backend.database_file = self.config.get("database", "sqlite_file", fallback=SqliteAccess.database_file)
+            else:
+                from classes.CsvFileAccess import CsvFileAccess
+                backend = CsvFileAccess()
+            backend.path = self.path
+            self.backend = backend
+        return self.backend
+
+    def raise_login_view(self) -> None:
+        """ Displays the login window.
+        All views of the logged out user are freed.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        self.login_view.ent_pwd.setText("")
+        self.login_view.show()
+
+        # The views are deleted by Qt, after the signal, which called the logout, is handled
+        for view in self.views.values():
+            view.close()
+            view.deleteLater()
+        self.views = {}
+
+        if self.security_view_raised:
+            self.security_view.close()
+            self.security_view.deleteLater()
+            self.security_view_raised = False
+
+        # The next user reads the current datasets
+        if self.prefetch_task is not None:
+            self.storage.cancel(self.prefetch_task)
+            self.prefetch_task = None
+        if self.advisory_task is not None:
+            self.storage.cancel(self.advisory_task)
+            self.advisory_task = None
+        self.customer_model = None
+        self.exposure_model = None
+
+    def raise_main_view(self) -> None:
+        """ Displays the main menu window.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        if "main" not in self.views:
+            from classes.MainView import MainView
+            main_view = MainView(self.user_priv, self.import_customers)
+            main_view.switch_show_customers.connect(self.raise_customers_view)
+            main_view.switch_add_customer.connect(self.raise_add_customer_view)
+            main_view.switch_update_customer.connect(self.raise_update_customer_view)
+            main_view.switch_delete_customer.connect(self.raise_delete_customer_view)
+            main_view.switch_logout.connect(self.raise_login_view)
+            self.views["main"] = main_view
+
+        self.show_view("main")
+
+        # The customers are usually shown next, so they are read, while the user looks at the menu.
+        # The security issues are shown, when the customers are read.
+        if self.customer_model is None and self.prefetch_task is None:
+            self.prefetch_customers()
+        elif self.customer_model is not None and self.security_view_raised == False:
+            self.raise_security_view()
+        elif self.security_view_raised:
+            # New feeds are picked up, whenever the user returns to the menu
+            self.reload_advisories()
+
+    def raise_security_view(self) -> None:
+        """ Displays the security issues of all customers.
+        The advisory feeds are read in the background, the view is shown, when they are read.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        from classes.feeds import load_feeds
+        from classes.AdvisoryIndex import AdvisoryIndex
+
+        if self.advisory_task is not None:
+            return
+
+        self.advisory_task = self.storage.submit(
+            lambda directory: AdvisoryIndex(load_feeds(directory)),
+            self.feed_directory,
+            on_finished=self.security_view_loaded,
+            on_failed=lambda error: setattr(self, "advisory_task", None),
+            busy=False
+        )
+
+    def security_view_loaded(self, advisory_index) -> None:
+        """ Shows the security issues, when the advisory feeds are read.
+        The product versions of the customers are matched against the advisories.
+
+        Parameters
+        ----------
+        advisory_index : AdvisoryIndex
+            The advisories of the feeds.
+
+        Return
+        ----------
+        none
+        """
+
+        from classes.SecurityIssuesView import SecurityIssuesView, ExposureModel
+
+        self.advisory_task = None
+        if self.customer_model is None or self.security_view_raised:
+            return
+
+        # The matches follow the changes of the customer model, until the user logs out
+        self.exposure_model = ExposureModel(self.customer_model, advisory_index)
+
+        self.security_view_raised = True
+        self.security_view = SecurityIssuesView(self.exposure_model)
+        self.security_view.show()
+
+    def reload_advisories(self) -> None:
+        """ Reads the advisory feeds again in the background.
+        Unchanged feeds are read from the cache, so only new or changed feeds are parsed.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        from classes.feeds import load_feeds
+        from classes.AdvisoryIndex import AdvisoryIndex
+
+        if self.advisory_task is not None:
+            return
+
+        self.advisory_task = self.storage.submit(
+            lambda directory: AdvisoryIndex(load_feeds(directory)),
+            self.feed_directory,
+            on_finished=self.advisories_loaded,
+            on_failed=lambda error: setattr(self, "advisory_task", None),
+            busy=False
+        )
+
+    def advisories_loaded(self, advisory_index) -> None:
+        """ Re-evaluates the security issues of the products, whose advisories changed.
+
+        Parameters
+        ----------
+        advisory_index : AdvisoryIndex
+            The advisories of the feeds.
+
+        Return
+        ----------
+        none
+        """
+
+        self.advisory_task = None
+        if self.exposure_model is not None:
+            self.exposure_model.set_advisories(advisory_index)
+
+    def raise_customers_view(self) -> None:
+        """ Displays the "Show all customers" window.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        if "show_customers" not in self.views:
+            from classes.ShowCustomersView import ShowCustomersView
+            show_customers_view = ShowCustomersView(self.shared_customer_model())
+            show_customers_view.switch_main.connect(self.raise_main_view)
+            show_customers_view.switch_logout.connect(self.raise_login_view)
+            self.views["show_customers"] = show_customers_view
+
+        self.show_view("show_customers")
+
+    def raise_add_customer_view(self) -> None:
+        """ Displays the "Add a customer" window.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        if "add_customer" not in self.views:
+            from classes.AddCustomerView import AddCustomerView
+            add_customer_view = AddCustomerView(self.add_new_customer)
+            add_customer_view.switch_main.connect(self.raise_main_view)
+            add_customer_view.switch_logout.connect(self.raise_login_view)
+            self.views["add_customer"] = add_customer_view
+
+        self.show_view("add_customer")
+
+    def raise_update_customer_view(self) -> None:
+        """ Displays the "Update a customer" window.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        if "update_customer" not in self.views:
+            from classes.UpdateCustomerView import UpdateCustomerView
+            update_customer_view = UpdateCustomerView(self.update_customer, self.shared_customer_model())
+            update_customer_view.switch_main.connect(self.raise_main_view)
+            update_customer_view.switch_logout.connect(self.raise_login_view)
+            self.views["update_customer"] = update_customer_view
+
+        self.show_view("update_customer")
+
+    def raise_delete_customer_view(self) -> None:
+        """ Displays the "Delete customers" window.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        if "delete_customer" not in self.views:
+            from classes.DeleteCustomerView import DeleteCustomerView
+            delete_customer_view = DeleteCustomerView(
+                self.delete_customer,
+                self.shared_customer_model(),
+                self.delete_customers
+            )
+            delete_customer_view.switch_main.connect(self.raise_main_view)
+            delete_customer_view.switch_logout.connect(self.raise_login_view)
+            self.views["delete_customer"] = delete_customer_view
+
+        self.show_view("delete_customer")
+
+    def show_view(self, name: str) -> None:
+        """ Displays a view of the registry and hides the login window and all other views.
+        The hidden views are kept with their state, the shared customer model keeps their tables up to date.
+
+        Parameters
+        ----------
+        name : str
+            The name of the view in the registry, e.g. "main".
+
+        Return
+        ----------
+        none
+        """
+
+        # The new window is shown first, so the application never runs without a visible window
+        self.views[name].show()
+        self.views[name].raise_()
+
+        self.login_view.hide()
+        for other_name, view in self.views.items():
+            if other_name != name:
+                view.hide()
+
+    def shared_customer_model(self) -> CustomerModel:
+        """ Returns the customer model, which is shared by all views.
+        The datasets are read, when the first view needs them.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        CustomerModel
+        """
+
+        if self.customer_model is None:
+            if self.prefetch_task is None:
+                self.prefetch_customers()
+            # The model is created by "prefetch_done", before the wait returns
+            self.storage.wait(self.prefetch_task)
+        return self.customer_model
+
+    def prefetch_customers(self) -> None:
+        """ Reads and prepares the customer datasets in the background.
+        The table columns and the expiry classes are computed on the worker thread as well.
+
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        from classes.CustomerModel import prepare_customers
+
+        path = self.path + "/data/dataset.csv"
+        self.prefetch_task = self.storage.submit(
+            lambda: prepare_customers(self.db_access.read_all(path)),
+            on_finished=self.prefetch_done,
+            on_failed=lambda error: setattr(self, "prefetch_task", None),
+            busy=False
+        )
+
+    def prefetch_done(self, prepared: dict) -> None:
+        """ Creates the shared customer model from the prefetched datasets.
+
+        Parameters
+        ----------
+        prepared : dict
+            The prepared datasets, see "prepare_customers".
+
+        Return
+        ----------
+        none
+        """
+
+        from classes.CustomerModel import CustomerModel
+
+        self.prefetch_task = None
+        if self.customer_model is None:
+            self.customer_model = CustomerModel(**prepared)
+
+        if self.security_view_raised == False and "main" in self.views:
+            self.raise_security_view()
+
+    def validate_login(self, username: str, password: str) -> None:
+        """ Validates the login, when the "Login" button in the Login window is clicked.
+        After successfull login, the Main window is raised.
+
+        Parameters
+        ----------
+        username : str
+            Contains the login username.
+        password : str
+            Contains the login password.
+
+        Return
+        ----------
+        none
+        """
+
+        from classes.helper import find_first
+
+        # Streams the users file, until the user is found
+        user = self.storage.run(
+            lambda: find_first(self.db_access.iter_chunks(self.path + "/data/users.csv"), "username", username)
+        )
+
+        # Check if user exists and the passwords match for the given user
+        if (
+                user is not None and
+                sha256(bytes(password, "utf-8")).hexdigest() == user["password"]
+            ):
+            self.user_priv = user["privilege"]
+            self.raise_main_view()
+        else:
+            # Runs and displays the MessageBox, as long as the user acknowledges the popup window
+            ack = False
+            while not ack:
+                choice = QMessageBox.critical(
+                    None,
+                    " ",
+                    "Username oder Passwort falsch!",
+                    QMessageBox.Ok
+                )
+
+                if choice:
+                    ack = True
+
+    def add_new_customer(self, data: pd.DataFrame) -> bool:
+        """ Stores the new customer and it's information in the database.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Contains the information of the new customer.
+
+        Return
+        ----------
+        status : bool
+            If the customer could be saved in the database or not.
+        """
+
+        # Represents the status of the addition of the customer to the database.
+        status = False
+
+        # Customer name, customer numbers and a contract expiry date must be set
+        if data["name"][0] and data["number"][0] and data["contract-expire"][0]:
+
+            new_customer_name = str(data["name"][0])
+            new_customer_number = str(data["number"][0])
+            
+            # Check, if the new customer name is already used by any existing customer
+            if (
+                    not self.storage.run(self.db_access.read, "name", new_customer_name).empty or
+                    not self.storage.run(self.db_access.read, "number", new_customer_number).empty
+                ):
+                # Runs and displays the MessageBox, as long as the user acknowledges the popup window
+                ack = False
+                while not ack:
+                    choice = QMessageBox.critical(
+                        None,
+                        " ",
+                        "Kundenname und / oder Kundennummer existieren bereits!",
+                        QMessageBox.Ok
+                    )
+
+                    if choice:
+                        ack = True
+            else:
+                ack = False
+
+                # The database assigns the ID of the new customer
+                result = self.storage.run(self.db_access.add, data)
+
+                # Runs and displays the MessageBox, so long till the user acknowledges the popup window
+                while not ack:
+                    if result[0]:
+                        choice = QMessageBox.information(
+                            None,
+                            " ",
+                            "Der Kunde wurde erfolgreich angelegt.",
+                            QMessageBox.Ok
+                        )
+                        status = True
+                        if self.customer_model is not None:
+                            self.customer_model.insert_customers(data)
+                    if not result[0] and result[1] == 0:
+                        choice = QMessageBox.critical(
+                            None,
+                            " ",
+                            "Der Kunde konnte nicht angelegt werden!\nKein Zugriff auf die Datenbank!",
+                            QMessageBox.Ok
+                        )
+
+                    if choice:
+                        ack = True
+        else:
+            ack = False
+            # Runs and displays the MessageBox, until the user acknowledges the popup window.
+            while not ack:
+                choice = QMessageBox.critical(
+                    None,
+                    " ",
+                    "Es wurde kein Kundenname, keine Kundennummer oder Vertragslaufzeit angegeben!",
+                    QMessageBox.Ok
+                )
+
+                if choice:
+                    ack = True
+
+        return status
+
+    def update_customer(self, updated_customers: pd.DataFrame) -> bool:
+        """ Stores the updated customers in the database.
+
+        Parameters
+        ----------
+        updated_customers : pandas.DataFrame
+            Contains the edited rows of the Table widget.
+
+        Return
+        ----------
+        status : bool
+            If the customers could be saved in the database or not.
+        """
+
+        result = self.storage.run(self.db_access.update_rows, updated_customers)
+        if result[0] and self.customer_model is not None:
+            # The open views show the saved values
+            self.customer_model.update_customers(updated_customers)
+
+        ack = False
+
+        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
+        while not ack:
+            if result[0]:
+                choice = QMessageBox.information(
+                    None,
+                    " ",
+                    "Die Kundendaten wurden erfolgreich geändert.",
+                    QMessageBox.Ok
+                )
+            if not result[0] and result[1] == 0:
+                choice = QMessageBox.critical(
+                    None,
+                    " ",
+                    "Der Kundendaten konnten nicht geändert werden. Kein Zugriff auf die Datenbank!",
+                    QMessageBox.Ok
+                )
+
+            if choice:
+                break
+
+        return result[0]
+
+    def delete_customer(self, row_data: list) -> bool:
+        """ Deletes a customer from the database.
+
+        Parameters
+        ----------
+        row_data : list
+            Contains the row data (customer information) of the table widget, which should be deleted.
+
+        Return
+        ----------
+        status : bool
+            Represents the status, if the delete operation of the customer was successful or not.
+        """
+
+        # Looks up the customer by its customer number
+        deleted_customer = self.storage.run(self.db_access.read, "number", str(row_data[1]))
+
+        # The customer may have been deleted in the meantime, e.g. by another view
+        if deleted_customer.empty:
+            QMessageBox.critical(
+                None,
+                " ",
+                "Der Kunde konnte nicht gelöscht werden!\nDer Kunde existiert nicht mehr!",
+                QMessageBox.Ok
+            )
+            return False
+
+        result = self.storage.run(self.db_access.delete_rows, deleted_customer)
+        if result[0] and self.customer_model is not None:
+            # The open views remove the row of the customer
+            self.customer_model.remove_customers(deleted_customer["id"].to_list())
+
+        ack = False
+        status = False
+
+        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
+        while not ack:
+            if result[0]:
+                choice = QMessageBox.information(
+                    None,
+                    " ",
+                    "Der Kunde wurde erfolgreich gelöscht.",
+                    QMessageBox.Ok
+                )
+                status = True
+            if not result[0] and result[1] == 0:
+                choice = QMessageBox.critical(
+                    None,
+                    " ",
+                    "Der Kunde konnte nicht gelöscht werden!\nDas File existiert nicht!",
+                    QMessageBox.Ok
+                )
+
+            if choice:
+                break
+        
+        return status
+
+    def delete_customers(self, numbers: list) -> bool:
+        """ Deletes several customers from the database at once.
+
+        Parameters
+        ----------
+        numbers : list
+            The customer numbers of the customers, which should be deleted.
+
+        Return
+        ----------
+        status : bool
+            Represents the status, if the delete operation of the customers was successful or not.
+        """
+
+        # All customers are removed with a single write
+        result = self.storage.run(self.db_access.delete_values, "number", numbers)
+        if result[0] and self.customer_model is not None:
+            self.customer_model.remove_customers(self.customer_model.ids_of("number", numbers))
+
+        ack = False
+        status = False
+
+        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
+        while not ack:
+            if result[0]:
+                choice = QMessageBox.information(
+                    None,
+                    " ",
+                    "Die Kunden wurden erfolgreich gelöscht.",
+                    QMessageBox.Ok
+                )
+                status = True
+            if not result[0] and result[1] == 0:
+                choice = QMessageBox.critical(
+                    None,
+                    " ",
+                    "Die Kunden konnten nicht gelöscht werden!\nDas File existiert nicht!",
+                    QMessageBox.Ok
+                )
+
+            if choice:
+                break
+
+        return status
+
+    def import_customers(self, path: str) -> bool:
+        """ Imports the customers of a CSV or JSONL file into the database.
+        All valid customers are saved at once, the invalid ones are listed in a report file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the import file.
+
+        Return
+        ----------
+        status : bool
+            If the valid customers could be saved in the database or not.
+        """
+
+        import pandas as pd
+        from classes.importer import import_customers
+
+        try:
+            result, imported, report_path = self.storage.run(import_customers, self.db_access, path)
+        except Exception:
+            result, imported, report_path = [False, 1], pd.DataFrame(), None
+
+        if result[0] and not imported.empty and self.customer_model is not None:
+            self.customer_model.insert_customers(imported)
+
+        ack = False
+
+        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
+        while not ack:
+            if result[0]:
+                message = "Es wurden {} Kunden importiert.".format(len(imported))
+                if report_path:
+                    message += "\nFehlerhafte Zeilen wurden übersprungen, siehe:\n" + report_path
+                elif report_path == "":
+                    message += "\nFehlerhafte Zeilen wurden übersprungen, der Bericht konnte nicht gespeichert werden!"
+                choice = QMessageBox.information(
+                    None,
+                    " ",
+                    message,
+                    QMessageBox.Ok
+                )
+            if not result[0] and result[1] == 0:
+                choice = QMessageBox.critical(
+                    None,
+                    " ",
+                    "Die Kunden konnten nicht importiert werden!\nKein Zugriff auf die Datenbank!",
+                    QMessageBox.Ok
+                )
+            if not result[0] and result[1] == 1:
+                choice = QMessageBox.critical(
+                    None,
+                    " ",
+                    "Die Importdatei konnte nicht gelesen werden!",
+                    QMessageBox.Ok
+                )
+
+            if choice:
+                break
+
+        return result[0]
\ No newline at end of file
@@ -1,182 +1,1045 @@
-# Standard classes / libraries
-import pandas as pd
-import os
-
-# Custom classes / libraries
-from interfaces.DatabaseAccess import *
-
-class CsvFileAccess(DatabaseAccess):
-    """
-    A class used to provide database access objects.
-
-    Methods
-    -------
-    read()
-        Reads a single dataset.
-    read_all(str)
-        Reads all datasets from the given path and returns them in a Dataframe.
-    write()
-        Not used.
-    add(pandas.Dataframe)
-        Adds a new Customer dataset to the database.
-    update(pandas.Dataframe)
-        Updates the customer datasets in the database.
-    delete(pandas.Dataframe)
-        Stores the Customer dataset with the delete rows to the database.
-    """
-
-    def __new__(cls):
-        if not hasattr(cls, 'instance'):
-            cls.instance = super(CsvFileAccess, cls).__new__(cls)
-        return cls.instance
-
-    def read(self) -> None:
-        """ Reads a single dataset.
-
-        Parameters
-        ----------
-        None
-
-        Return
-        ----------
-        None
-        """
-
-        pass
-
-    def read_all(self, path: str) -> pd.DataFrame:
-        """ Reads all datasets from the given path and returns them in a Dataframe.
-
-        Parameters
-        ----------
-        path : str
-            The path of the file.
-        
-        Return
-        ----------
-        pandas.Dataframe
-        """
-
-        df = pd.DataFrame({})
-    
-        try:
-            df = pd.read_csv(path)
-        except:
-            print("no file")
-        finally:
-            return df
-
-    def write(self):
-        pass
-
-    def add(self, new_customer: pd.DataFrame) -> list:
-        """ Adds a new Customer dataset to the database.
-
-        Parameters
-        ----------
-        new_customer : pandas.Dataframe
-            A dataframe, containing the customer data.
-        
-        Return
-        ----------
-        list
-        """
-
-        current_customers = self.read_all(self.path + "/data/dataset.csv")
-
-        unused_index = False
-        new_id = 1
-
-        # Check for a new ID, which is not already used.
-        while not unused_index:
-            if new_id not in current_customers["id"].values:
-                unused_index = True
-            else:
-                new_id += 1
-        new_customer.at[0, "id"] = new_id
-
-        # Stores the result codes
-        # Element 0:
-        #   False, if an error happened
-        #   True, if no error happend
-        # Element 1:
-        #   Only used in conjunction with "False"
-        #   Defines the type of error
-        result = [False, -1]
-
-        try:
-            if not os.path.isfile(self.path + "/data/dataset.csv"):
-                # Set to 0 for file error
-                result[1] = 0
-                raise Exception("File doesn't exist")
-            else:
-                new_customer.to_csv(self.path + "/data/dataset.csv", mode="a", header=False, index=False)
-                result[0] = True
-        finally:
-            return result
-
-    def update(self, updated_customers: pd.DataFrame) -> list:
-        """ Updates the customer datasets in the database.
-
-        Parameters
-        ----------
-        updated_customers : pandas.Dataframe
-            A dataframe, containing the updated customer datasets.
-        
-        Return
-        ----------
-        list
-        """
-
-        # Stores the result codes
-        # Element 0:
-        #   False, if an error happened
-        #   True, if no error happend
-        # Element 1:
-        #   Only used in conjunction with "False"
-        #   Defines the type of error
-        result = [False, -1]
-
-        try:
-            if not os.path.isfile(self.path + "/data/dataset.csv"):
-                # Set to 0 for file error
-                result[1] = 0
-                raise Exception("File doesn't exist")
-            else:
-                updated_customers.to_csv(self.path + "/data/dataset.csv", mode="w", header=True, index=False)
-                result[0] = True
-        finally:
-            return result
-
-    def delete(self, updated_customers: pd.DataFrame) -> list:
-        """ Stores the Customer dataset with the delete rows to the database.
-
-        Parameters
-        ----------
-        updated_customers : pandas.Dataframe
-            A dataframe, containing the updated customer datasets.
-        
-        Return
-        ----------
-        list
-        """
-
-        # Stores the result codes
-        # Element 0:
-        #   False, if an error happened
-        #   True, if no error happend
-        # Element 1:
-        #   Only used in conjunction with "False"
-        #   Defines the type of error
-        result = [False, -1]
-
-        try:
-            if not os.path.isfile(self.path + "/data/dataset.csv"):
-                # Set to 0 for file error
-                result[1] = 0
-                raise Exception("File doesn't exist")
-            else:
-                updated_customers.to_csv(self.path + "/data/dataset.csv", mode="w", header=True, index=False)
-                result[0] = True
-        finally:
-            return result
\ No newline at end of file
+# Standard classes / libraries
+import pandas as pd
+import numpy as np
+import os
+import json
+import threading
+from contextlib import closing
+
+# Optional: binary snapshots of the parsed files
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+# Custom classes / libraries
+from interfaces.DatabaseAccess import *
+from classes.IdAllocator import *
+from classes.helper import changed_rows
+from classes.schema import *
+
+class CsvFileAccess(DatabaseAccess):
+    """
+    A class used to provide database access objects.
+
+    In journal mode, changes of the customer datasets are appended as records to
+    "<file>.journal" and replayed on load, instead of rewriting the whole file.
+    The journal is folded back into the file in the background, as soon as it
+    exceeds the compaction threshold.
+
+    If pyarrow is installed, every parsed file is also stored as a Feather snapshot
+    "<file>.feather". Later loads read the snapshot, as long as the file is unchanged.
+    The CSV file stays the source of truth, a stale snapshot is replaced on the next load.
+
+    Methods
+    -------
+    read(str, str)
+        Reads the customer datasets with the given value in the given column.
+    read_many(str, list)
+        Reads the customer datasets with any of the given values in the given column.
+    exists(str, list)
+        Checks for every value, if a customer dataset with this value in the given column exists.
+    read_all(str)
+        Reads all datasets from the given path and returns them in a Dataframe.
+        Parsed files are cached and only re-read if the file changed on disk.
+    write()
+        Not used.
+    add(pandas.Dataframe)
+        Adds a new Customer dataset to the database.
+    update(pandas.Dataframe)
+        Updates the customer datasets in the database.
+    update_rows(pandas.Dataframe)
+        Updates single customer datasets, identified by their "id", in the database.
+    delete(pandas.Dataframe)
+        Stores the Customer dataset with the delete rows to the database.
+    delete_rows(pandas.Dataframe)
+        Deletes single customer datasets, identified by their "id", from the database.
+    delete_values(str, list)
+        Deletes all customer datasets with any of the given values in the given column at once.
+    cached_frame(str)
+        Returns the cached Dataframe of a file, without copying it.
+    column_index(str, str)
+        Returns the hash index of a column of the cached Dataframe.
+    index_rows(str, pandas.Dataframe, set, bool)
+        Adds rows to or removes rows from the built hash indexes of a file.
+    file_signature(str)
+        Returns the modification time, size and inode of a file.
+    dataset_signature(str)
+        Returns the signatures of a file and its journal.
+    invalidate(str)
+        Removes a file from the read cache.
+    cache_stats()
+        Returns the hit and miss counters of the read cache.
+    append_journal(str, list)
+        Appends change records to the journal of a file.
+    apply_records(pandas.Dataframe, list)
+        Applies change records to a Dataframe.
+    replay(str, pandas.Dataframe)
+        Applies the records of the journal of a file to its Dataframe.
+    journal_records(str)
+        Reads the change records of the journal of a file.
+    iter_chunks(str, int)
+        Yields all datasets of the given file in Dataframes of at most "chunksize" rows.
+    compact(str)
+        Folds the journal of a file back into the file.
+    write_atomic(str, pandas.Dataframe)
+        Replaces a file with the given Dataframe, without leaving a torn file behind.
+    read_snapshot(str)
+        Reads the Feather snapshot of a file, memory-mapped.
+    write_snapshot(str, pandas.Dataframe, tuple)
+        Stores a Dataframe as Feather snapshot of a file.
+    id_allocator(str)
+        Returns the ID allocator of a file.
+    sync_allocator(str, tuple)
+        Stores the ID allocator of a file with the signature after a write.
+    """
+
+    # Appends changes to a journal, instead of rewriting the whole file
+    journal_enabled = True
+    # Size of the journal in bytes, from which on it is folded back into the file
+    compaction_threshold = 256 * 1024
+    # Stores binary snapshots of the parsed files, if pyarrow is installed
+    snapshot_enabled = True
+    # Columns of the customer datasets with a hash index for read()
+    indexed_columns = ["name", "number"]
+
+    def __new__(cls):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(CsvFileAccess, cls).__new__(cls)
+            # Parsed files, keyed by path: {path: (signature, dataframe)}
+            cls.instance.cache = {}
+            cls.instance.cache_hits = 0
+            cls.instance.cache_misses = 0
+            # Hash indexes of the cached Dataframes: {path: {column: {value: id}}}
+            cls.instance.indexes = {}
+            # ID allocators of the datasets, keyed by path
+            cls.instance.allocators = {}
+            # Serializes the journal writes and the background compaction
+            cls.instance.lock = threading.RLock()
+            cls.instance.compaction_thread = None
+        return cls.instance
+
+    def read(self, column: str, value: str) -> pd.DataFrame:
+        """ Reads the customer datasets with the given value in the given column.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "name" or "number".
+        value : str
+            The value to look for.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        with self.lock:
+            df = self.cached_frame(self.path + "/data/dataset.csv")
+
+            if column not in self.indexed_columns:
+                return df[text_keys(df[column]) == str(value)].reset_index(drop=True)
+
+            found = self.column_index(self.path + "/data/dataset.csv", column).get(str(value), ())
+            # An index entry holds a single ID or a tuple of IDs, if the value isn't unique
+            ids = list(found) if isinstance(found, tuple) else [found]
+            return df.loc[ids].reset_index(drop=True)
+
+    def read_many(self, column: str, values: list) -> pd.DataFrame:
+        """ Reads the customer datasets with any of the given values in the given column.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "name" or "number".
+        values : list
+            The values to look for.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        with self.lock:
+            df = self.cached_frame(self.path + "/data/dataset.csv")
+            values = set(str(value) for value in values)
+
+            if column not in self.indexed_columns:
+                return df[text_keys(df[column]).isin(values)].reset_index(drop=True)
+
+            index = self.column_index(self.path + "/data/dataset.csv", column)
+            ids = []
+            for value in values:
+                found = index.get(value, ())
+                # An index entry holds a single ID or a tuple of IDs, if the value isn't unique
+                ids.extend(found if isinstance(found, tuple) else [found])
+            return df.loc[ids].reset_index(drop=True)
+
+    def exists(self, column: str, values: list) -> np.ndarray:
+        """ Checks for every value, if a customer dataset with this value in the given column exists.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "name" or "number".
+        values : list
+            The values to look for.
+
+        Return
+        ----------
+        numpy.ndarray
+            A bool for every value.
+        """
+
+        with self.lock:
+            if column in self.indexed_columns:
+                stored = self.column_index(self.path + "/data/dataset.csv", column)
+            else:
+                stored = set(text_keys(self.cached_frame(self.path + "/data/dataset.csv")[column]))
+            return np.array([str(value) in stored for value in values], dtype=bool)
+
+    def read_all(self, path: str) -> pd.DataFrame:
+        """ Reads all datasets from the given path and returns them in a Dataframe.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        # The callers modify the returned Dataframe, so the cached one must not be handed out.
+        df = self.cached_frame(path).copy()
+        df.reset_index(drop=True, inplace=True)
+        return df
+
+    def cached_frame(self, path: str) -> pd.DataFrame:
+        """ Returns the cached Dataframe of a file, without copying it.
+        The file is only parsed, if it changed on disk. The returned Dataframe must not be modified.
+        Its rows are labeled with their "id", so single rows are found by a hash lookup.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        with self.lock:
+            signature = self.dataset_signature(path)
+
+            # Serve the cached Dataframe, as long as the file is unchanged.
+            if signature[0] is not None and path in self.cache and self.cache[path][0] == signature:
+                self.cache_hits += 1
+                return self.cache[path][1]
+
+            self.cache_misses += 1
+            self.indexes.pop(path, None)
+            df = pd.DataFrame({})
+
+            try:
+                # Only replaces the empty Dataframe, if the file was read completely
+                frame = self.read_snapshot(path)
+
+                if frame is None:
+                    # The customer datasets are parsed with their declared column types
+                    if os.path.basename(path) == "dataset.csv":
+                        frame = read_customers(path)
+                    else:
+                        frame = pd.read_csv(path)
+                    self.write_snapshot(path, frame, signature[0])
+
+                if "id" in frame.columns:
+                    frame.index = pd.Index(frame["id"].to_numpy())
+                df = self.replay(path, frame)
+                if signature[0] is not None:
+                    self.cache[path] = (signature, df)
+            except:
+                print("no file")
+            finally:
+                return df
+
+    def file_signature(self, path: str) -> tuple:
+        """ Returns the modification time, size and inode of a file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        tuple
+            None, if the file doesn't exist.
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def dataset_signature(self, path: str) -> tuple:
+        """ Returns the signatures of a file and its journal.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        tuple
+        """
+
+        return (self.file_signature(path), self.file_signature(path + ".journal"))
+
+    def invalidate(self, path: str) -> None:
+        """ Removes a file from the read cache.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        None
+        """
+
+        with self.lock:
+            self.cache.pop(path, None)
+            self.indexes.pop(path, None)
+
+    def cache_stats(self) -> dict:
+        """ Returns the hit and miss counters of the read cache.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        dict
+        """
+
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
+
+    def write(self):
+        pass
+
+    def add(self, new_customer: pd.DataFrame) -> list:
+        """ Adds a new Customer dataset to the database.
+
+        Parameters
+        ----------
+        new_customer : pandas.Dataframe
+            A dataframe, containing the customer data.
+
+        Return
+        ----------
+        list
+        """
+
+        # Stores the result codes
+        # Element 0:
+        #   False, if an error happened
+        #   True, if no error happend
+        # Element 1:
+        #   Only used in conjunction with "False"
+        #   Defines the type of error
+        result = [False, -1]
+
+        try:
+            if not os.path.isfile(self.path + "/data/dataset.csv"):
+                # Set to 0 for file error
+                result[1] = 0
+                raise Exception("File doesn't exist")
+
+            with self.lock:
+                signature = self.dataset_signature(self.path + "/data/dataset.csv")
+                allocator = self.id_allocator(self.path + "/data/dataset.csv")
+                new_ids = allocator.allocate(new_customer.shape[0])
+                rows = new_customer.assign(id=new_ids)
+
+                try:
+                    if self.journal_enabled:
+                        self.append_journal(self.path + "/data/dataset.csv", [
+                            {"op": "add", "id": int(row["id"]), "row": self.to_record(row)}
+                            for _, row in rows.iterrows()
+                        ])
+                    else:
+                        to_text(rows).to_csv(self.path + "/data/dataset.csv", mode="a", header=False, index=False)
+                        self.invalidate(self.path + "/data/dataset.csv")
+                        self.sync_allocator(self.path + "/data/dataset.csv", signature)
+                except Exception:
+                    if self.dataset_signature(self.path + "/data/dataset.csv") == signature:
+                        # Nothing was written, so the IDs are handed out again
+                        allocator.release(new_ids)
+                    else:
+                        # A part of the datasets may be stored, the allocator is rebuilt from the stored IDs
+                        self.allocators.pop(self.path + "/data/dataset.csv", None)
+                        self.invalidate(self.path + "/data/dataset.csv")
+                    # Set to 0 for file error
+                    result[1] = 0
+                    raise
+
+                # The caller only sees the IDs of stored datasets
+                new_customer["id"] = new_ids
+                result[0] = True
+        finally:
+            return result
+
+    def update(self, updated_customers: pd.DataFrame) -> list:
+        """ Updates the customer datasets in the database.
+        Only the rows, which differ from the stored datasets, are written.
+
+        Parameters
+        ----------
+        updated_customers : pandas.Dataframe
+            A dataframe, containing the updated customer datasets.
+
+        Return
+        ----------
+        list
+        """
+
+        current_customers = self.cached_frame(self.path + "/data/dataset.csv")
+        return self.update_rows(changed_rows(current_customers, updated_customers))
+
+    def update_rows(self, updated_rows: pd.DataFrame) -> list:
+        """ Updates single customer datasets, identified by their "id", in the database.
+        In journal mode, the costs depend on the number of rows and not on the size of the file.
+
+        Parameters
+        ----------
+        updated_rows : pandas.Dataframe
+            A dataframe, containing only the changed customer datasets.
+
+        Return
+        ----------
+        list
+        """
+
+        # Stores the result codes
+        # Element 0:
+        #   False, if an error happened
+        #   True, if no error happend
+        # Element 1:
+        #   Only used in conjunction with "False"
+        #   Defines the type of error
+        result = [False, -1]
+
+        records = [
+            {"op": "update", "id": int(row["id"]), "row": self.to_record(row)}
+            for _, row in updated_rows.iterrows()
+        ]
+
+        try:
+            if not os.path.isfile(self.path + "/data/dataset.csv"):
+                # Set to 0 for file error
+                result[1] = 0
+                raise Exception("File doesn't exist")
+            elif self.journal_enabled:
+                self.append_journal(self.path + "/data/dataset.csv", records)
+                result[0] = True
+            else:
+                current_customers = self.cached_frame(self.path + "/data/dataset.csv").copy()
+                self.write_atomic(self.path + "/data/dataset.csv", self.apply_records(current_customers, records))
+                result[0] = True
+        finally:
+            return result
+
+    def delete(self, updated_customers: pd.DataFrame) -> list:
+        """ Stores the Customer dataset with the delete rows to the database.
+
+        Parameters
+        ----------
+        updated_customers : pandas.Dataframe
+            A dataframe, containing the updated customer datasets.
+
+        Return
+        ----------
+        list
+        """
+
+        current_customers = self.cached_frame(self.path + "/data/dataset.csv")
+        return self.delete_rows(current_customers[~current_customers["id"].isin(updated_customers["id"])])
+
+    def delete_rows(self, deleted_rows: pd.DataFrame) -> list:
+        """ Deletes single customer datasets, identified by their "id", from the database.
+
+        Parameters
+        ----------
+        deleted_rows : pandas.Dataframe
+            A dataframe, containing only the customer datasets to delete.
+
+        Return
+        ----------
+        list
+        """
+
+        # Stores the result codes
+        # Element 0:
+        #   False, if an error happened
+        #   True, if no error happend
+        # Element 1:
+        #   Only used in conjunction with "False"
+        #   Defines the type of error
+        result = [False, -1]
+
+        records = [{"op": "delete", "id": int(deleted_id)} for deleted_id in deleted_rows["id"]]
+
+        try:
+            if not os.path.isfile(self.path + "/data/dataset.csv"):
+                # Set to 0 for file error
+                result[1] = 0
+                raise Exception("File doesn't exist")
+
+            with self.lock:
+                self.id_allocator(self.path + "/data/dataset.csv").release(deleted_rows["id"])
+
+                if self.journal_enabled:
+                    self.append_journal(self.path + "/data/dataset.csv", records)
+                else:
+                    current_customers = self.cached_frame(self.path + "/data/dataset.csv").copy()
+                    self.write_atomic(self.path + "/data/dataset.csv", self.apply_records(current_customers, records))
+                result[0] = True
+        finally:
+            return result
+
+    def delete_values(self, column: str, values: list) -> list:
+        """ Deletes all customer datasets with any of the given values in the given column at once.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "number".
+        values : list
+            The values of the customer datasets to delete.
+
+        Return
+        ----------
+        list
+        """
+
+        with self.lock:
+            return self.delete_rows(self.read_many(column, values))
+
+    def to_record(self, row: pd.Series) -> dict:
+        """ Converts a Dataframe row into a JSON serializable dict.
+
+        Parameters
+        ----------
+        row : pandas.Series
+            The row of the Dataframe.
+
+        Return
+        ----------
+        dict
+        """
+
+        record = {}
+        for key, value in row.items():
+            if pd.isna(value):
+                value = None
+            elif isinstance(value, pd.Timestamp):
+                value = value.strftime(DATE_FORMAT)
+            elif isinstance(value, np.generic):
+                value = value.item()
+            record[key] = value
+        return record
+
+    def append_journal(self, path: str, records: list) -> None:
+        """ Appends change records to the journal of a file.
+        The cached Dataframe of the file is patched with the same records.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        records : list
+            The change records, one dict per added, updated or deleted dataset.
+
+        Return
+        ----------
+        None
+        """
+
+        if not records:
+            return
+
+        with self.lock:
+            signature = self.dataset_signature(path)
+
+            with open(path + ".journal", "ab") as journal:
+                # Terminate a torn record, which was left behind by an interrupted write
+                if journal.tell() > 0:
+                    with open(path + ".journal", "rb") as check:
+                        check.seek(-1, os.SEEK_END)
+                        if check.read(1) != b"\n":
+                            journal.write(b"\n")
+                for record in records:
+                    journal.write(json.dumps(record).encode("utf-8") + b"\n")
+                journal.flush()
+                os.fsync(journal.fileno())
+
+            # Patch the cache and its indexes, instead of parsing the file again on the next read
+            if path in self.cache and self.cache[path][0] == signature:
+                changed_ids = set(int(record["id"]) for record in records)
+                self.index_rows(path, self.cache[path][1], changed_ids, remove=True)
+                df = self.apply_records(self.cache[path][1], records)
+                self.index_rows(path, df, changed_ids)
+                self.cache[path] = (self.dataset_signature(path), df)
+            else:
+                self.invalidate(path)
+
+            self.sync_allocator(path, signature)
+
+            journal_size = self.dataset_signature(path)[1][1]
+
+            if journal_size >= self.compaction_threshold and (
+                    self.compaction_thread is None or not self.compaction_thread.is_alive()
+                ):
+                self.compaction_thread = threading.Thread(target=self.compact, args=(path,), daemon=True)
+                self.compaction_thread.start()
+
+    def apply_records(self, df: pd.DataFrame, records: list) -> pd.DataFrame:
+        """ Applies change records to a Dataframe, whose rows are labeled with their "id".
+        The last record of an ID wins. Updated rows keep their position and are changed in place,
+        added rows are appended.
+
+        Parameters
+        ----------
+        df : pandas.Dataframe
+            The Dataframe to apply the records to.
+        records : list
+            The change records.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        # Final state of each changed ID, "None" for deleted datasets
+        changes = {}
+        for record in records:
+            changes[int(record["id"])] = record.get("row")
+
+        if not changes or "id" not in df.columns:
+            return df
+
+        existing_ids = [changed_id for changed_id in changes if changed_id in df.index]
+        drop_ids = [changed_id for changed_id in existing_ids if changes[changed_id] is None]
+        update_ids = [changed_id for changed_id in existing_ids if changes[changed_id] is not None]
+        # IDs which are not part of the Dataframe yet
+        new_rows = [row for changed_id, row in changes.items() if row is not None and changed_id not in df.index]
+
+        if update_ids:
+            updates = self.coerce_like(pd.DataFrame([changes[update_id] for update_id in update_ids], columns=df.columns), df)
+            for column in df.columns:
+                values = updates[column].to_numpy()
+                try:
+                    df.loc[update_ids, column] = values
+                except (TypeError, ValueError):
+                    if isinstance(df[column].dtype, pd.CategoricalDtype):
+                        # Versions, which are not used by any other customer yet
+                        new_categories = pd.Index(pd.unique(values[pd.notna(values)])).difference(df[column].cat.categories)
+                        df[column] = df[column].cat.add_categories(new_categories)
+                    elif column in INTEGER_COLUMNS:
+                        # Invalid numbers are missing, the other numbers stay integers
+                        df[column] = df[column].astype("Int64")
+                    else:
+                        # Values, which don't fit into the type of the column
+                        df[column] = df[column].astype(object)
+                    df.loc[update_ids, column] = values
+
+        if drop_ids:
+            df = df.drop(drop_ids)
+
+        if new_rows:
+            added = self.coerce_like(pd.DataFrame(new_rows, columns=df.columns), df)
+            added.index = pd.Index(added["id"].to_numpy())
+            categories = [column for column in df.columns if isinstance(df[column].dtype, pd.CategoricalDtype)]
+            df = pd.concat([df, added])
+            for column in categories:
+                df[column] = df[column].astype("category")
+
+        return df
+
+    def column_index(self, path: str, column: str) -> dict:
+        """ Returns the hash index of a column of the cached Dataframe, e.g. {name: id}.
+        The index is built on first use and afterwards patched with every journal write.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        column : str
+            The name of the column.
+
+        Return
+        ----------
+        dict
+        """
+
+        with self.lock:
+            df = self.cached_frame(path)
+            indexes = self.indexes.setdefault(path, {})
+
+            if column not in indexes:
+                index = {}
+                for value, row_id in zip(text_keys(df[column]), df["id"]):
+                    if value in index:
+                        # Values, which are not unique, point to a tuple of IDs
+                        previous = index[value]
+                        index[value] = (previous if isinstance(previous, tuple) else (previous,)) + (row_id,)
+                    else:
+                        index[value] = row_id
+                indexes[column] = index
+            return indexes[column]
+
+    def index_rows(self, path: str, df: pd.DataFrame, ids: set, remove: bool = False) -> None:
+        """ Adds rows to or removes rows from the built hash indexes of a file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        df : pandas.Dataframe
+            The Dataframe, which contains the rows.
+        ids : set
+            The IDs of the rows. IDs, which aren't part of the Dataframe, are skipped.
+        remove : bool
+            Removes the rows from the indexes, instead of adding them.
+
+        Return
+        ----------
+        None
+        """
+
+        for column, index in self.indexes.get(path, {}).items():
+            for row_id in ids:
+                if row_id not in df.index:
+                    continue
+                value = df.at[row_id, column]
+                # Same text as in column_index()
+                value = "" if pd.isna(value) else str(value)
+                previous = index.get(value)
+                previous = previous if isinstance(previous, tuple) else (() if previous is None else (previous,))
+
+                if remove:
+                    remaining = tuple(previous_id for previous_id in previous if previous_id != row_id)
+                else:
+                    remaining = previous + (row_id,)
+
+                if not remaining:
+                    index.pop(value, None)
+                else:
+                    index[value] = remaining[0] if len(remaining) == 1 else remaining
+
+    def coerce_like(self, df: pd.DataFrame, template: pd.DataFrame) -> pd.DataFrame:
+        """ Converts the columns of a Dataframe to the types of a template Dataframe.
+
+        Parameters
+        ----------
+        df : pandas.Dataframe
+            The Dataframe to convert.
+        template : pandas.Dataframe
+            The Dataframe with the target column types.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        for column in df.columns:
+            if column not in template.columns:
+                continue
+            if pd.api.types.is_datetime64_any_dtype(template[column]):
+                df[column] = parse_dates(df[column])
+            elif isinstance(template[column].dtype, pd.CategoricalDtype):
+                # Empty input fields are stored as missing versions
+                df[column] = df[column].where(df[column] != "")
+            elif column in INTEGER_COLUMNS:
+                df[column] = to_integers(df[[column]])[column]
+            elif pd.api.types.is_numeric_dtype(template[column]):
+                try:
+                    df[column] = pd.to_numeric(df[column]).astype(template[column].dtype)
+                except (ValueError, TypeError):
+                    pass
+        return df
+
+    def replay(self, path: str, df: pd.DataFrame) -> pd.DataFrame:
+        """ Applies the records of the journal of a file to its Dataframe.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        df : pandas.Dataframe
+            The parsed content of the file.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        return self.apply_records(df, self.journal_records(path))
+
+    def journal_records(self, path: str) -> list:
+        """ Reads the change records of the journal of a file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        list
+        """
+
+        records = []
+        if not os.path.isfile(path + ".journal"):
+            return records
+
+        with open(path + ".journal", "rb") as journal:
+            for line in journal:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Skip a torn record of an interrupted write
+                    continue
+        return records
+
+    def iter_chunks(self, path: str, chunksize: int = 50000):
+        """ Yields all datasets of the given file in Dataframes of at most "chunksize" rows.
+        The file is streamed, so a scan only needs the memory of one chunk and can stop early.
+        Changes from the journal are applied to the chunks, added datasets are yielded last.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        chunksize : int
+            The maximum number of rows per chunk.
+
+        Return
+        ----------
+        generator
+        """
+
+        with self.lock:
+            signature = self.dataset_signature(path)
+            cached = signature[0] is not None and path in self.cache and self.cache[path][0] == signature
+            df = self.cache[path][1] if cached else None
+
+        # Already parsed files are sliced instead of being read again
+        if df is not None:
+            for start in range(0, df.shape[0], chunksize):
+                yield df.iloc[start:start + chunksize].reset_index(drop=True)
+            return
+
+        if not os.path.isfile(path):
+            return
+
+        # Final state of each changed ID, "None" for deleted datasets
+        changes = {}
+        for record in self.journal_records(path):
+            changes[int(record["id"])] = record.get("row")
+
+        if os.path.basename(path) == "dataset.csv":
+            reader = read_customers(path, chunksize=chunksize)
+        else:
+            reader = pd.read_csv(path, chunksize=chunksize)
+
+        template = None
+        with closing(reader):
+            for chunk in reader:
+                template = chunk.iloc[0:0]
+                if changes and "id" in chunk.columns:
+                    chunk.index = pd.Index(chunk["id"].to_numpy())
+                    changed_ids = chunk["id"][chunk["id"].isin(list(changes.keys()))]
+                    chunk = self.apply_records(chunk, [
+                        {"id": changed_id, "row": changes.pop(int(changed_id))} for changed_id in changed_ids
+                    ])
+                yield chunk.reset_index(drop=True)
+
+        # Datasets, which were added after the file was written
+        added = [{"id": added_id, "row": row} for added_id, row in changes.items() if row is not None]
+        if added and template is not None:
+            yield self.apply_records(template.copy(), added).reset_index(drop=True)
+
+    def compact(self, path: str) -> None:
+        """ Folds the journal of a file back into the file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        None
+        """
+
+        with self.lock:
+            if not os.path.isfile(path + ".journal"):
+                return
+            df = self.cached_frame(path)
+            indexes = self.indexes.get(path)
+            self.write_atomic(path, df)
+            self.write_snapshot(path, df, self.file_signature(path))
+
+            # The content didn't change, so the Dataframe and its indexes stay valid
+            self.cache[path] = (self.dataset_signature(path), df)
+            if indexes is not None:
+                self.indexes[path] = indexes
+
+    def write_atomic(self, path: str, df: pd.DataFrame) -> None:
+        """ Replaces a file with the given Dataframe, without leaving a torn file behind.
+        The journal of the file is removed, as its records are part of the Dataframe.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        df : pandas.Dataframe
+            The new content of the file.
+
+        Return
+        ----------
+        None
+        """
+
+        with self.lock:
+            signature = self.dataset_signature(path)
+
+            with open(path + ".tmp", "w", newline="") as file:
+                to_text(df).to_csv(file, header=True, index=False)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(path + ".tmp", path)
+
+            # A crash before this point only replays records, which are already part of the file
+            if os.path.isfile(path + ".journal"):
+                os.remove(path + ".journal")
+
+            self.invalidate(path)
+            self.sync_allocator(path, signature)
+
+    def id_allocator(self, path: str) -> IdAllocator:
+        """ Returns the ID allocator of a file.
+        The allocator is only rebuilt from the stored IDs, if the file was changed by someone else.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        IdAllocator
+        """
+
+        with self.lock:
+            if path not in self.allocators:
+                self.allocators[path] = IdAllocator(path + ".ids")
+                self.allocators[path].load()
+
+            allocator = self.allocators[path]
+            signature = self.dataset_signature(path)
+
+            if allocator.signature != json.loads(json.dumps(signature)):
+                allocator.rebuild(self.cached_frame(path)["id"])
+                allocator.save(signature)
+            return allocator
+
+    def sync_allocator(self, path: str, signature: tuple) -> None:
+        """ Stores the ID allocator of a file with the signature after a write.
+        Does nothing, if the allocator didn't belong to the file before the write.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        signature : tuple
+            The signature of the file before the write.
+
+        Return
+        ----------
+        None
+        """
+
+        with self.lock:
+            allocator = self.allocators.get(path)
+            if allocator is not None and allocator.signature == json.loads(json.dumps(signature)):
+                allocator.save(self.dataset_signature(path))
+
+    def read_snapshot(self, path: str) -> pd.DataFrame:
+        """ Reads the Feather snapshot of a file, memory-mapped.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        pandas.Dataframe
+            None, if there is no snapshot of the current file content.
+        """
+
+        if feather is None or not self.snapshot_enabled:
+            return None
+
+        try:
+            with open(path + ".feather.json", "r") as file:
+                meta = json.load(file)
+            # The snapshot belongs to the current file and wasn't replaced since
+            if (
+                    meta["csv"] != json.loads(json.dumps(self.file_signature(path))) or
+                    meta["snapshot"] != json.loads(json.dumps(self.file_signature(path + ".feather")))
+                ):
+                return None
+            return feather.read_table(path + ".feather", memory_map=True).to_pandas()
+        except Exception:
+            return None
+
+    def write_snapshot(self, path: str, df: pd.DataFrame, signature: tuple) -> None:
+        """ Stores a Dataframe as Feather snapshot of a file.
+        Errors are ignored, as the file can always be parsed again.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        df : pandas.Dataframe
+            The content of the file.
+        signature : tuple
+            The signature of the file, the Dataframe was read from.
+
+        Return
+        ----------
+        None
+        """
+
+        if feather is None or not self.snapshot_enabled or signature is None:
+            return
+
+        try:
+            df.reset_index(drop=True).to_feather(path + ".feather.tmp")
+            os.replace(path + ".feather.tmp", path + ".feather")
+
+            with open(path + ".feather.json.tmp", "w") as file:
+                json.dump({"csv": signature, "snapshot": self.file_signature(path + ".feather")}, file)
+            os.replace(path + ".feather.json.tmp", path + ".feather.json")
+        except Exception:
+            print("no snapshot")
@@ -0,0 +1,311 @@
+# Standard classes / libraries
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import Qt, QModelIndex
+from datetime import date
+
+# Custom classes / libraries
+from classes.TableModel import *
+from classes.helper import replace_nan
+from classes.schema import *
+from classes.versions import version_array, version_order
+
+# Version columns of the customer datasets by table column. They are sorted by version instead of text.
+VERSION_TABLE_COLUMNS = {2 : "cucm", 3 : "imp", 4 : "cuc", 5 : "exp"}
+
+def customer_columns(df: pd.DataFrame) -> dict:
+    """ Returns the table columns of customer datasets.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The customer datasets.
+
+    Return
+    ----------
+    dict
+    """
+
+    return {
+        "Kundenname" : df["name"].map(str).to_list(),
+        "Kundennummer" : text_keys(df["number"]).to_list(),
+        "CUCM - Version" : replace_nan(df["cucm"].map(str).to_list()),
+        "IMP - Version" : replace_nan(df["imp"].map(str).to_list()),
+        "CUC - Version" : replace_nan(df["cuc"].map(str).to_list()),
+        "EXP - Version" : replace_nan(df["exp"].map(str).to_list()),
+        "Vertragsende" : format_dates(df["contract-expire"]).map(str).to_list()
+    }
+
+def prepare_customers(customer_data: pd.DataFrame) -> dict:
+    """ Prepares everything a CustomerModel needs, without creating Qt objects.
+    The preparation can run on a worker thread, the model is then created on the GUI thread.
+
+    Parameters
+    ----------
+    customer_data : pandas.DataFrame
+        All customer datasets.
+
+    Return
+    ----------
+    dict
+        The keyword arguments of a CustomerModel.
+    """
+
+    columns = customer_columns(customer_data)
+
+    return {
+        "customer_data" : customer_data,
+        "columns" : columns,
+        "expiry" : expiry_classes(customer_data["contract-expire"]),
+        # The tables are sorted by the customer name first
+        "sort_orders" : {0 : np.argsort(np.asarray(columns["Kundenname"], dtype=str), kind="stable")}
+    }
+
+class CustomerModel(TableModel):
+    """
+    A class used to hold the customer datasets for all views of the application.
+
+    The Controller owns a single instance. Added, updated and deleted customers are
+    patched into the model, which announces the changed rows, so the open views
+    update themselves without reading the database again.
+
+    Methods
+    -------
+    table_columns(pandas.DataFrame)
+        Returns the table columns of customer datasets.
+    data(QModelIndex, int)
+        Returns the value of a table cell for the given role.
+    rows_of(list)
+        Returns the table rows of the customers with the given IDs.
+    ids_of(str, list)
+        Returns the IDs of the customers with any of the given values in a column.
+    customer_rows(list)
+        Returns the customer datasets with the given IDs.
+    insert_customers(pandas.DataFrame)
+        Adds new customers at the end of the table.
+    update_customers(pandas.DataFrame)
+        Replaces the values of changed customers.
+    remove_customers(list)
+        Removes customers from the table.
+    delete_rows(numpy.ndarray)
+        Deletes rows from the column arrays and the customer datasets.
+    sorted_rows(int)
+        Returns the rows in the ascending order of a column.
+    """
+
+    def __init__(self, customer_data: pd.DataFrame, columns: dict = None, expiry: np.ndarray = None, sort_orders: dict = None) -> None:
+        """
+        Parameters
+        ----------
+        customer_data : pandas.DataFrame
+            All customer datasets.
+        columns : dict
+            The table columns of the datasets, if they are prepared already.
+        expiry : numpy.ndarray
+            The expiry classes of the datasets of today, if they are prepared already.
+        sort_orders : dict
+            The ascending row orders of table columns, if they are prepared already.
+        """
+
+        TableModel.__init__(self, columns if columns is not None else self.table_columns(customer_data))
+        if expiry is not None:
+            self.expiry = expiry
+            self.expiry_day = date.today()
+        if sort_orders is not None:
+            self.sort_orders = dict(sort_orders)
+
+        # The typed customer datasets, labelled by their ID, in the order of the table rows
+        self.customers = customer_data.set_index(pd.Index(customer_data["id"]), drop=False)
+
+    def table_columns(self, df: pd.DataFrame) -> dict:
+        """ Returns the table columns of customer datasets.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The customer datasets.
+
+        Return
+        ----------
+        dict
+        """
+
+        return customer_columns(df)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """ Returns the value of a table cell for the given role.
+        The ID of the customer is returned for the role "Qt.UserRole".
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The table cell.
+        role : int
+            The requested value, e.g. the text or the background color.
+
+        Return
+        ----------
+        object
+            None, if the cell has no value for the role.
+        """
+
+        if role == Qt.UserRole and index.isValid():
+            return int(self.customers["id"].iat[index.row()])
+        return TableModel.data(self, index, role)
+
+    def rows_of(self, ids: list) -> np.ndarray:
+        """ Returns the table rows of the customers with the given IDs.
+        Unknown IDs are skipped.
+
+        Parameters
+        ----------
+        ids : list
+            The IDs of the customers.
+
+        Return
+        ----------
+        numpy.ndarray
+        """
+
+        rows = self.customers.index.get_indexer(pd.Index(ids, dtype="int64"))
+        return rows[rows >= 0]
+
+    def ids_of(self, column: str, values: list) -> list:
+        """ Returns the IDs of the customers with any of the given values in a column.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "number".
+        values : list
+            The values to look for.
+
+        Return
+        ----------
+        list
+        """
+
+        if column in INTEGER_COLUMNS:
+            # Compared as integers, so neither the type of the column nor the text of the values matters
+            keys = to_integers(pd.DataFrame({column : pd.Series(values, dtype=object)}))[column].dropna()
+            found = self.customers[column].isin(keys.astype("int64"))
+        else:
+            found = text_keys(self.customers[column]).isin([str(value) for value in values])
+        return self.customers["id"][found].to_list()
+
+    def customer_rows(self, ids: list) -> pd.DataFrame:
+        """ Returns the customer datasets with the given IDs.
+
+        Parameters
+        ----------
+        ids : list
+            The IDs of the customers.
+
+        Return
+        ----------
+        pandas.DataFrame
+        """
+
+        return self.customers.loc[ids].reset_index(drop=True)
+
+    def insert_customers(self, new_customers: pd.DataFrame) -> None:
+        """ Adds new customers at the end of the table.
+
+        Parameters
+        ----------
+        new_customers : pandas.DataFrame
+            The new customer datasets with their IDs, typed or as text values.
+
+        Return
+        ----------
+        None
+        """
+
+        rows = apply_schema(new_customers[CUSTOMER_COLUMNS].copy())
+        rows.index = pd.Index(rows["id"])
+
+        # The typed datasets are updated first, so the views can look up the IDs of the new rows
+        self.customers = apply_schema(pd.concat([self.customers, rows]))
+        self.append_rows(self.table_columns(rows))
+
+    def update_customers(self, updated_customers: pd.DataFrame) -> None:
+        """ Replaces the values of changed customers.
+
+        Parameters
+        ----------
+        updated_customers : pandas.DataFrame
+            The changed customer datasets with their IDs, typed or as text values.
+
+        Return
+        ----------
+        None
+        """
+
+        rows = apply_schema(updated_customers[CUSTOMER_COLUMNS].copy())
+        rows.index = pd.Index(rows["id"])
+        rows = rows[rows.index.isin(self.customers.index)]
+
+        for column in CUSTOMER_COLUMNS:
+            if isinstance(self.customers[column].dtype, pd.CategoricalDtype):
+                # New versions are added to the categories first
+                new_versions = pd.Index(rows[column].dropna().unique()).difference(self.customers[column].cat.categories)
+                if len(new_versions):
+                    self.customers[column] = self.customers[column].cat.add_categories(new_versions)
+                self.customers.loc[rows.index, column] = rows[column].astype(object)
+            else:
+                if column in INTEGER_COLUMNS and rows[column].hasnans:
+                    # Invalid numbers are missing, the other numbers stay integers
+                    self.customers[column] = self.customers[column].astype("Int64")
+                self.customers.loc[rows.index, column] = rows[column]
+
+        self.set_rows(self.rows_of(rows.index).tolist(), self.table_columns(rows))
+
+    def remove_customers(self, ids: list) -> None:
+        """ Removes customers from the table.
+
+        Parameters
+        ----------
+        ids : list
+            The IDs of the customers.
+
+        Return
+        ----------
+        None
+        """
+
+        self.remove_rows(self.rows_of(ids))
+
+    def delete_rows(self, keep: np.ndarray) -> None:
+        """ Deletes rows from the column arrays and the customer datasets.
+
+        Parameters
+        ----------
+        keep : numpy.ndarray
+            A bool for every table row, False for the deleted rows.
+
+        Return
+        ----------
+        None
+        """
+
+        TableModel.delete_rows(self, keep)
+        self.customers = self.customers[keep]
+
+    def sorted_rows(self, column: int) -> np.ndarray:
+        """ Returns the rows in the ascending order of a column.
+        The version columns are sorted by version, e.g. "9.1.2.10000-11" before "11.5.1.18000-21",
+        the other columns by the text of the cells.
+
+        Parameters
+        ----------
+        column : int
+            The table column.
+
+        Return
+        ----------
+        numpy.ndarray
+        """
+
+        if column in VERSION_TABLE_COLUMNS and column not in self.sort_orders:
+            self.sort_orders[column] = version_order(version_array(self.customers[VERSION_TABLE_COLUMNS[column]]))
+        return TableModel.sorted_rows(self, column)
@@ -0,0 +1,618 @@
+# Standard classes / libraries
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import Qt, QModelIndex, QTimer
+
+# Custom classes / libraries
+from classes.TableModel import *
+from classes.advisories import *
+
+class ExposureModel(TableModel):
+    """
+    A class used to hold the security advisories, which affect the products of the customers.
+
+    The matches are kept per customer, together with the name and the product versions,
+    they were matched for. The model follows the shared customer model: added, changed
+    and deleted customers are collected and re-evaluated at once, when the event loop
+    gets back control. Only the products of a customer, whose version changed, are matched
+    again. The rows of every customer are looked up by its ID and the kept values are
+    overwritten in place, so a refresh doesn't scan all matches or copy all customers.
+    New advisories only re-evaluate the products, whose advisories changed.
+
+    A summary of every affected customer is kept alongside the table rows and updated
+    with them, so the security issues of a customer are looked up by the customer ID,
+    without scanning all matches.
+
+    Methods
+    -------
+    table_columns(pandas.DataFrame)
+        Returns the table columns of matched advisories.
+    data(QModelIndex, int)
+        Returns the value of a table cell for the given role.
+    group_rows(numpy.ndarray)
+        Returns the positions of every customer ID.
+    customer_table_rows()
+        Returns the table rows of every customer.
+    customer_summary(int)
+        Returns the summary of the security issues of a customer.
+    customer_exposures(int)
+        Returns the matches of a customer.
+    exposure_arrays(pandas.DataFrame)
+        Returns the columns of matches as arrays.
+    exposure_rows(numpy.ndarray)
+        Returns the matches of table rows.
+    object_columns(pandas.DataFrame)
+        Converts the text columns of summaries into Python objects.
+    customer_rows_changed(QModelIndex, int, int)
+        Marks the customers of changed rows of the customer model to be re-evaluated.
+    customer_rows_compacted(numpy.ndarray)
+        Marks the customers of removed rows of the customer model to be re-evaluated.
+    customer_data_changed(QModelIndex, QModelIndex, list)
+        Marks the customers of changed cells of the customer model to be re-evaluated.
+    customers_reset()
+        Marks all customers to be re-evaluated, after the customer model was reset.
+    invalidate(list)
+        Marks customers to be re-evaluated.
+    refresh()
+        Re-evaluates the marked customers.
+    set_advisories(AdvisoryIndex)
+        Replaces the advisories and re-evaluates the products, whose advisories changed.
+    reevaluate(dict)
+        Replaces the matches of products of customers.
+    drop_rows(numpy.ndarray)
+        Removes table rows, a few by moving the last rows of the table into their place.
+    release_rows(numpy.ndarray)
+        Takes table rows from their customers in the row lookup, before they are overwritten.
+    assign_rows(numpy.ndarray)
+        Adds table rows to their customers in the row lookup, after they were written.
+    update_summary(pandas.Index)
+        Updates the summaries of re-evaluated customers.
+    delete_rows(numpy.ndarray)
+        Deletes rows from the column arrays and the matches.
+    """
+
+    # Customer values, which the matches depend on
+    evaluated_columns = ["name"] + VERSION_COLUMNS
+    # Number of outdated rows, which are overwritten with new matches, instead of being removed
+    max_rows_in_place = 1000
+
+    def __init__(self, customer_model, advisory_index) -> None:
+        """
+        Parameters
+        ----------
+        customer_model : CustomerModel
+            The shared customer model.
+        advisory_index : AdvisoryIndex
+            The advisories to match with.
+        """
+
+        exposures = advisory_index.match(customer_model.customers)
+        TableModel.__init__(self, self.table_columns(exposures))
+
+        self.customer_model = customer_model
+        self.advisory_index = advisory_index
+        # The matches in the order of the table rows, {column: numpy.ndarray}. Like the column
+        # arrays, they are the first rows of buffers with spare room.
+        self.exposure_buffers = self.exposure_arrays(exposures)
+        self.exposures = dict(zip(EXPOSURE_COLUMNS, self.exposure_buffers))
+
+        # Table rows of every customer, {customer ID: numpy.ndarray}, see "customer_table_rows"
+        self.row_lookup = self.group_rows(exposures["id"].to_numpy())
+        # Summary of every affected customer, labelled by the customer ID
+        self.summary = self.object_columns(summarize_exposures(exposures))
+
+        # Customer values, the matches were computed for, labelled by the customer ID.
+        # The columns hold Python objects, so single customers are overwritten in place.
+        self.evaluated = customer_model.customers[self.evaluated_columns].astype(object)
+
+        # IDs of the customers, which changed since the last refresh
+        self.pending = set()
+        self.refresh_scheduled = False
+
+        customer_model.rowsInserted.connect(self.customer_rows_changed)
+        customer_model.rowsAboutToBeRemoved.connect(self.customer_rows_changed)
+        customer_model.rows_about_to_be_compacted.connect(self.customer_rows_compacted)
+        customer_model.dataChanged.connect(self.customer_data_changed)
+        customer_model.modelReset.connect(self.customers_reset)
+
+    def table_columns(self, exposures: pd.DataFrame) -> dict:
+        """ Returns the table columns of matched advisories.
+
+        Parameters
+        ----------
+        exposures : pandas.DataFrame
+            The matches, see "AdvisoryIndex.match".
+
+        Return
+        ----------
+        dict
+        """
+
+        return exposure_columns(exposures)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """ Returns the value of a table cell for the given role.
+        The ID of the customer is returned for the role "Qt.UserRole".
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The table cell.
+        role : int
+            The requested value, e.g. the text.
+
+        Return
+        ----------
+        object
+            None, if the cell has no value for the role.
+        """
+
+        if role == Qt.UserRole and index.isValid():
+            return int(self.exposures["id"][index.row()])
+        return TableModel.data(self, index, role)
+
+    def group_rows(self, ids: np.ndarray) -> dict:
+        """ Returns the positions of every customer ID.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray
+            The customer IDs, e.g. of the table rows.
+
+        Return
+        ----------
+        dict
+            {customer ID: numpy.ndarray}, the positions in ascending order.
+        """
+
+        # The positions of every customer are a slice of the positions ordered by customer
+        order = np.argsort(ids, kind="stable")
+        ids = ids[order]
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else np.zeros(0, dtype=np.int64)
+        ends = np.r_[starts[1:], len(ids)]
+        return {customer_id: order[start:end] for customer_id, start, end in zip(ids[starts].tolist(), starts.tolist(), ends.tolist())}
+
+    def customer_table_rows(self) -> dict:
+        """ Returns the table rows of every customer.
+        The lookup is built on first use after rows were deleted, afterwards it is patched with the changed rows.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        dict
+            {customer ID: numpy.ndarray}, the rows in ascending order.
+        """
+
+        if self.row_lookup is None:
+            self.row_lookup = self.group_rows(self.exposures["id"])
+        return self.row_lookup
+
+    def customer_summary(self, customer_id: int) -> pd.Series:
+        """ Returns the summary of the security issues of a customer.
+
+        Parameters
+        ----------
+        customer_id : int
+            The ID of the customer.
+
+        Return
+        ----------
+        pandas.Series
+            The values SUMMARY_COLUMNS, None if the customer isn't affected.
+        """
+
+        if customer_id not in self.summary.index:
+            return None
+        return self.summary.loc[customer_id]
+
+    def customer_exposures(self, customer_id: int) -> pd.DataFrame:
+        """ Returns the matches of a customer.
+
+        Parameters
+        ----------
+        customer_id : int
+            The ID of the customer.
+
+        Return
+        ----------
+        pandas.DataFrame
+            The columns EXPOSURE_COLUMNS.
+        """
+
+        rows = self.customer_table_rows().get(customer_id, np.zeros(0, dtype=np.int64))
+        return self.exposure_rows(rows)
+
+    def exposure_arrays(self, exposures: pd.DataFrame) -> list:
+        """ Returns the columns of matches as writable arrays, the text columns as Python objects.
+
+        Parameters
+        ----------
+        exposures : pandas.DataFrame
+            The matches, see "AdvisoryIndex.match".
+
+        Return
+        ----------
+        list
+            An array for every column of EXPOSURE_COLUMNS.
+        """
+
+        return [exposures[column].to_numpy(dtype=np.int64 if column == "id" else object, copy=True) for column in EXPOSURE_COLUMNS]
+
+    def exposure_rows(self, rows: np.ndarray) -> pd.DataFrame:
+        """ Returns the matches of table rows.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The table rows.
+
+        Return
+        ----------
+        pandas.DataFrame
+            The columns EXPOSURE_COLUMNS.
+        """
+
+        return pd.DataFrame({column: values[rows] for column, values in self.exposures.items()}, columns=EXPOSURE_COLUMNS)
+
+    def object_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """ Converts the text columns of summaries into Python objects.
+        Single rows of object columns are overwritten in place, text columns are copied as a whole.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The summaries, see "summarize_exposures".
+
+        Return
+        ----------
+        pandas.DataFrame
+        """
+
+        return df.astype({column: object for column in df.columns if not pd.api.types.is_numeric_dtype(df[column])})
+
+    def customer_rows_changed(self, parent: QModelIndex, first: int, last: int) -> None:
+        """ Marks the customers of changed rows of the customer model to be re-evaluated.
+
+        Parameters
+        ----------
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+        first : int
+            The first changed row.
+        last : int
+            The last changed row.
+
+        Return
+        ----------
+        None
+        """
+
+        self.invalidate(self.customer_model.customers["id"].iloc[first:last + 1].to_list())
+
+    def customer_rows_compacted(self, keep: np.ndarray) -> None:
+        """ Marks the customers of removed rows of the customer model to be re-evaluated.
+
+        Parameters
+        ----------
+        keep : numpy.ndarray
+            A bool for every row of the customer model, False for the removed rows.
+
+        Return
+        ----------
+        None
+        """
+
+        self.invalidate(self.customer_model.customers["id"].to_numpy()[~keep].tolist())
+
+    def customer_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: list = []) -> None:
+        """ Marks the customers of changed cells of the customer model to be re-evaluated.
+
+        Parameters
+        ----------
+        top_left : PyQt5.QtCore.QModelIndex
+            The first changed cell.
+        bottom_right : PyQt5.QtCore.QModelIndex
+            The last changed cell.
+        roles : list
+            Not used, the changed roles.
+
+        Return
+        ----------
+        None
+        """
+
+        self.customer_rows_changed(QModelIndex(), top_left.row(), bottom_right.row())
+
+    def customers_reset(self) -> None:
+        """ Marks all customers to be re-evaluated, after the customer model was reset.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        self.invalidate(self.evaluated.index.union(self.customer_model.customers.index))
+
+    def invalidate(self, ids: list) -> None:
+        """ Marks customers to be re-evaluated.
+        The refresh runs once, when the event loop gets back control, no matter how many customers changed.
+
+        Parameters
+        ----------
+        ids : list
+            The IDs of the customers.
+
+        Return
+        ----------
+        None
+        """
+
+        self.pending.update(ids)
+        if not self.refresh_scheduled:
+            self.refresh_scheduled = True
+            QTimer.singleShot(0, self.refresh)
+
+    def refresh(self) -> None:
+        """ Re-evaluates the marked customers.
+        Deleted customers lose their matches, new customers are matched with all products,
+        changed customers only with the products, whose versions changed.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        ids = pd.Index(sorted(self.pending), dtype="int64")
+        self.pending = set()
+        self.refresh_scheduled = False
+        if not len(ids):
+            return
+
+        # The IDs are looked up in the hash tables of the indexes, the other customers aren't touched
+        customers = self.customer_model.customers
+        current = customers.loc[ids[customers.index.get_indexer(ids) >= 0], self.evaluated_columns]
+        known = self.evaluated.loc[ids[self.evaluated.index.get_indexer(ids) >= 0]]
+
+        kept = current.index.intersection(known.index)
+        # Deleted and new customers, and customers with a new name, are evaluated for all products
+        renamed = kept[current.loc[kept, "name"].astype(str).to_numpy() != known.loc[kept, "name"].astype(str).to_numpy()]
+        all_products = known.index.symmetric_difference(current.index).union(renamed)
+
+        stale = {}
+        for product in VERSION_COLUMNS:
+            changed = current.loc[kept, product].astype(str).to_numpy() != known.loc[kept, product].astype(str).to_numpy()
+            stale[product] = all_products.union(kept[changed])
+        self.reevaluate(stale)
+
+        # Kept customers are overwritten in place, only deleted and new customers change the index
+        self.evaluated.loc[kept] = current.loc[kept].to_numpy(dtype=object)
+        deleted = known.index.difference(current.index)
+        if len(deleted):
+            self.evaluated = self.evaluated.drop(deleted)
+        added = current.index.difference(known.index)
+        if len(added):
+            self.evaluated = pd.concat([self.evaluated, current.loc[added].astype(object)])
+
+    def set_advisories(self, advisory_index) -> None:
+        """ Replaces the advisories and re-evaluates the products, whose advisories changed.
+
+        Parameters
+        ----------
+        advisory_index : AdvisoryIndex
+            The new advisories.
+
+        Return
+        ----------
+        None
+        """
+
+        changed = [
+            product for product in VERSION_COLUMNS
+            if not advisory_index.product_advisories(product).equals(self.advisory_index.product_advisories(product))
+        ]
+        self.advisory_index = advisory_index
+        self.reevaluate({product: self.evaluated.index for product in changed})
+
+    def reevaluate(self, stale: dict) -> None:
+        """ Replaces the matches of products of customers.
+        New matches take the rows of outdated ones, additional ones are shown at the end of the table,
+        until it is sorted again.
+
+        Parameters
+        ----------
+        stale : dict
+            The IDs of the customers to re-evaluate, by product, {version column: pandas.Index}.
+
+        Return
+        ----------
+        None
+        """
+
+        stale = {product: ids for product, ids in stale.items() if len(ids)}
+        if not stale:
+            return
+        customer_ids = pd.Index([], dtype="int64").append(list(stale.values())).unique()
+
+        # The rows of the customers are looked up first, only their products are compared
+        table_rows = self.customer_table_rows()
+        candidates = [table_rows[customer_id] for customer_id in customer_ids.tolist() if customer_id in table_rows]
+        candidates = np.sort(np.concatenate(candidates)) if candidates else np.zeros(0, dtype=np.int64)
+        candidate_ids = self.exposures["id"][candidates]
+        candidate_products = self.exposures["product"][candidates]
+        outdated = np.zeros(len(candidates), dtype=bool)
+        for product, ids in stale.items():
+            outdated |= (candidate_products == product) & np.isin(candidate_ids, ids)
+        outdated = candidates[outdated]
+
+        # Products of the same customers are matched at once, deleted customers are not matched again
+        customers = self.customer_model.customers
+        groups = {}
+        for product, ids in stale.items():
+            groups.setdefault(tuple(ids[customers.index.get_indexer(ids) >= 0]), []).append(product)
+        matches = [
+            self.advisory_index.match(customers.loc[list(ids)], products)
+            for ids, products in groups.items() if ids
+        ]
+        matches = pd.concat(matches, ignore_index=True) if matches else self.exposure_rows(np.zeros(0, dtype=np.int64))
+        new_values = self.exposure_arrays(matches)
+
+        # Small changes overwrite the outdated rows, removing and adding rows copies all column arrays
+        reused = min(len(outdated), len(matches)) if len(outdated) <= self.max_rows_in_place else 0
+        if reused:
+            self.release_rows(outdated[:reused])
+            for values, new in zip(self.exposures.values(), new_values):
+                values[outdated[:reused]] = new[:reused]
+            self.assign_rows(outdated[:reused])
+            self.set_rows(outdated[:reused].tolist(), self.table_columns(matches.iloc[:reused]))
+        self.drop_rows(outdated[reused:])
+
+        if len(matches) > reused:
+            # The matches are updated first, like the customer datasets of the customer model
+            first = len(self.exposures["id"])
+            self.exposure_buffers = append_values(self.exposure_buffers, first, [new[reused:] for new in new_values])
+            self.exposures = {column: buffer[:first + len(matches) - reused] for column, buffer in zip(EXPOSURE_COLUMNS, self.exposure_buffers)}
+            self.assign_rows(np.arange(first, first + len(matches) - reused))
+            self.append_rows(self.table_columns(matches.iloc[reused:]))
+
+        self.update_summary(customer_ids)
+
+    def drop_rows(self, rows: np.ndarray) -> None:
+        """ Removes table rows. A few rows are overwritten with the last rows of the table,
+        which are removed instead, so the arrays are shortened and not copied.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The table rows.
+
+        Return
+        ----------
+        None
+        """
+
+        if len(rows) > self.max_rows_in_place:
+            self.remove_rows(rows)
+            return
+
+        size = self.rowCount()
+        tail = np.arange(size - len(rows), size)
+        holes = np.setdiff1d(rows, tail)
+        moved = np.setdiff1d(tail, rows)
+        if len(holes):
+            self.release_rows(holes)
+            self.release_rows(moved)
+            for values in self.exposures.values():
+                values[holes] = values[moved]
+            self.assign_rows(holes)
+            self.set_rows(holes.tolist(), {label: column[moved] for label, column in zip(self.headers, self.columns)})
+        self.remove_rows(tail)
+
+    def release_rows(self, rows: np.ndarray) -> None:
+        """ Takes table rows from their customers in the row lookup, before they are overwritten.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The table rows.
+
+        Return
+        ----------
+        None
+        """
+
+        if self.row_lookup is None:
+            return
+
+        for customer_id, positions in self.group_rows(self.exposures["id"][rows]).items():
+            remaining = np.setdiff1d(self.row_lookup.get(customer_id, np.zeros(0, dtype=np.int64)), rows[positions])
+            if len(remaining):
+                self.row_lookup[customer_id] = remaining
+            else:
+                self.row_lookup.pop(customer_id, None)
+
+    def assign_rows(self, rows: np.ndarray) -> None:
+        """ Adds table rows to their customers in the row lookup, after they were written.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The table rows.
+
+        Return
+        ----------
+        None
+        """
+
+        if self.row_lookup is None:
+            return
+
+        for customer_id, positions in self.group_rows(self.exposures["id"][rows]).items():
+            self.row_lookup[customer_id] = np.sort(np.r_[self.row_lookup.get(customer_id, np.zeros(0, dtype=np.int64)), rows[positions]])
+
+    def update_summary(self, customer_ids: pd.Index) -> None:
+        """ Updates the summaries of re-evaluated customers.
+        Customers, which stay affected, are overwritten in place.
+
+        Parameters
+        ----------
+        customer_ids : pandas.Index
+            The IDs of the re-evaluated customers.
+
+        Return
+        ----------
+        None
+        """
+
+        table_rows = self.customer_table_rows()
+        rows = [table_rows[customer_id] for customer_id in customer_ids.tolist() if customer_id in table_rows]
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        summary = self.object_columns(summarize_exposures(self.exposure_rows(rows)))
+
+        known = self.summary.index.get_indexer(summary.index) >= 0
+        kept = summary.index[known]
+        for column in SUMMARY_COLUMNS:
+            self.summary.loc[kept, column] = summary.loc[kept, column]
+
+        # Only customers, which are no longer or newly affected, change the index
+        unaffected = customer_ids[self.summary.index.get_indexer(customer_ids) >= 0].difference(summary.index)
+        if len(unaffected):
+            self.summary = self.summary.drop(unaffected)
+        if not known.all():
+            self.summary = pd.concat([self.summary, summary[~known]])
+
+    def delete_rows(self, keep: np.ndarray) -> None:
+        """ Deletes rows from the column arrays and the matches.
+        Rows at the end are taken from the row lookup, otherwise the rows behind the deleted rows
+        move up and the row lookup is built again, when it is used next.
+
+        Parameters
+        ----------
+        keep : numpy.ndarray
+            A bool for every table row, False for the deleted rows.
+
+        Return
+        ----------
+        None
+        """
+
+        size = int(np.count_nonzero(keep))
+        TableModel.delete_rows(self, keep)
+
+        if keep[:size].all():
+            self.release_rows(np.arange(size, len(keep)))
+            self.exposures = {column: values[:size] for column, values in self.exposures.items()}
+        else:
+            self.exposures = {column: values[keep] for column, values in self.exposures.items()}
+            self.exposure_buffers = list(self.exposures.values())
+            self.row_lookup = None
@@ -0,0 +1,140 @@
+# Standard classes / libraries
+import numpy as np
+import heapq
+import json
+import os
+
+class IdAllocator:
+    """
+    A class used to hand out unused customer IDs, without scanning the stored IDs.
+
+    The allocator keeps the highest ID ever handed out and a free list of released IDs.
+    Released IDs are reused first, lowest ID first. The state is stored in a file next
+    to the dataset, together with the signature of the dataset it belongs to.
+
+    Methods
+    -------
+    load()
+        Reads the state from the state file.
+    save(tuple)
+        Writes the state and the signature of the dataset to the state file.
+    rebuild(pandas.Series)
+        Recreates the state from the stored IDs.
+    allocate(int)
+        Returns unused IDs and marks them as used.
+    release(list)
+        Marks IDs as unused again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Parameters
+        ----------
+        path : str
+            The path of the state file.
+        """
+
+        self.path = path
+        self.high_water = 0
+        self.free = []
+        # Signature of the dataset, the state belongs to
+        self.signature = None
+
+    def load(self) -> None:
+        """ Reads the state from the state file.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        try:
+            with open(self.path, "r") as file:
+                state = json.load(file)
+            self.high_water = int(state["high_water"])
+            self.free = [int(free_id) for free_id in state["free"]]
+            heapq.heapify(self.free)
+            self.signature = state["signature"]
+        except (OSError, ValueError, KeyError):
+            self.signature = None
+
+    def save(self, signature: tuple) -> None:
+        """ Writes the state and the signature of the dataset to the state file.
+
+        Parameters
+        ----------
+        signature : tuple
+            The signature of the dataset after the last write.
+
+        Return
+        ----------
+        None
+        """
+
+        # Stored like it is read back from the JSON file
+        self.signature = json.loads(json.dumps(signature))
+
+        with open(self.path + ".tmp", "w") as file:
+            json.dump({"high_water": self.high_water, "free": self.free, "signature": self.signature}, file)
+        os.replace(self.path + ".tmp", self.path)
+
+    def rebuild(self, ids) -> None:
+        """ Recreates the state from the stored IDs.
+        Only needed, if the dataset was changed outside of the application.
+
+        Parameters
+        ----------
+        ids : pandas.Series
+            The IDs of all stored datasets.
+
+        Return
+        ----------
+        None
+        """
+
+        ids = np.asarray(ids.dropna(), dtype=np.int64)
+        self.high_water = int(ids.max()) if len(ids) else 0
+        self.free = np.setdiff1d(np.arange(1, self.high_water + 1), ids).tolist()
+        heapq.heapify(self.free)
+
+    def allocate(self, count: int = 1) -> list:
+        """ Returns unused IDs and marks them as used.
+
+        Parameters
+        ----------
+        count : int
+            The number of IDs.
+
+        Return
+        ----------
+        list
+        """
+
+        new_ids = []
+        while self.free and len(new_ids) < count:
+            new_ids.append(heapq.heappop(self.free))
+
+        remaining = count - len(new_ids)
+        new_ids.extend(range(self.high_water + 1, self.high_water + remaining + 1))
+        self.high_water += remaining
+        return new_ids
+
+    def release(self, ids: list) -> None:
+        """ Marks IDs as unused again.
+
+        Parameters
+        ----------
+        ids : list
+            The IDs of the deleted datasets.
+
+        Return
+        ----------
+        None
+        """
+
+        for released_id in ids:
+            heapq.heappush(self.free, int(released_id))
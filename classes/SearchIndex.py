@@ -0,0 +1,257 @@
+# Standard classes / libraries
+import pandas as pd
+import numpy as np
+
+class SearchIndex:
+    """
+    A class used to look up the rows of table columns, which contain a search text.
+
+    Every column is indexed by its distinct lower case values. Search terms with at
+    least three characters are looked up in a trigram index and match anywhere in a
+    value, shorter terms are looked up in a sorted prefix index and match the start
+    of a value. Rows, which were edited or added after building the index, are kept
+    in a small overlay and checked directly, until the index is rebuilt.
+
+    Methods
+    -------
+    search(str)
+        Returns a mask of the rows, which contain all words of the search text.
+    update_row(int, list)
+        Replaces the indexed values of a row or adds a new row.
+    remove_rows(int, int)
+        Removes a range of rows, the rows behind it move up.
+    compact_rows(numpy.ndarray)
+        Removes scattered rows at once, the remaining rows move up.
+    needs_rebuild()
+        Returns, if the overlay got too large and the index should be rebuilt.
+    """
+
+    # Number of overlay rows, from which on a rebuild of the index is recommended
+    rebuild_threshold = 10000
+
+    def __init__(self, columns: list) -> None:
+        """
+        Parameters
+        ----------
+        columns : list
+            The values of every column, one value per row.
+        """
+
+        self.size = len(columns[0]) if columns else 0
+        self.columns = [self.index_column(values) for values in columns]
+        # Edited or added rows: {row: [lower case value of every column]}
+        self.overlay = {}
+
+    def index_column(self, values) -> dict:
+        """ Builds the prefix and the trigram index of a column.
+
+        Parameters
+        ----------
+        values : list
+            The values of the column.
+
+        Return
+        ----------
+        dict
+        """
+
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object).map(str).str.lower())
+        uniques = np.asarray(uniques, dtype=str)
+
+        # Prefix index: the distinct values in sorted order
+        prefix_order = np.argsort(uniques, kind="stable")
+
+        # Trigram index: every trigram of the distinct values, as a single number,
+        # pointing to the distinct values containing it
+        points = uniques.reshape(-1, 1).view(np.uint32).astype(np.int64) if len(uniques) else np.zeros((0, 1), np.int64)
+        if points.shape[1] >= 3:
+            grams = (points[:, :-2] << 42) | (points[:, 1:-1] << 21) | points[:, 2:]
+            value_ids, positions = np.nonzero(points[:, 2:] != 0)
+            grams = grams[value_ids, positions]
+        else:
+            value_ids, grams = np.zeros(0, np.int64), np.zeros(0, np.int64)
+
+        # Postings of the same trigram are stored next to each other, a value may occur twice in a posting
+        order = np.argsort(grams)
+        grams = grams[order]
+        gram_starts = np.flatnonzero(np.r_[True, grams[1:] != grams[:-1]]) if len(grams) else np.zeros(0, np.int64)
+
+        return {
+            "codes" : codes,
+            "uniques" : uniques,
+            "prefix_order" : prefix_order,
+            "prefix_sorted" : uniques[prefix_order],
+            "gram_keys" : grams[gram_starts],
+            "gram_starts" : np.append(gram_starts, len(grams)),
+            "gram_values" : value_ids[order]
+        }
+
+    def lookup(self, column: dict, term: str) -> np.ndarray:
+        """ Returns the distinct values of a column, which match a search term.
+
+        Parameters
+        ----------
+        column : dict
+            The index of the column.
+        term : str
+            The lower case search term.
+
+        Return
+        ----------
+        numpy.ndarray
+            The positions of the matching distinct values.
+        """
+
+        if len(term) < 3:
+            start = np.searchsorted(column["prefix_sorted"], term, side="left")
+            end = np.searchsorted(column["prefix_sorted"], term + "\U0010ffff", side="left")
+            return column["prefix_order"][start:end]
+
+        points = np.array([ord(char) for char in term], dtype=np.int64)
+        grams = np.unique((points[:-2] << 42) | (points[1:-1] << 21) | points[2:])
+
+        # The distinct values with the rarest trigram of the term are the candidates
+        postings = []
+        for gram in grams:
+            position = np.searchsorted(column["gram_keys"], gram)
+            if position == len(column["gram_keys"]) or column["gram_keys"][position] != gram:
+                return np.zeros(0, dtype=np.int64)
+            postings.append(column["gram_values"][column["gram_starts"][position]:column["gram_starts"][position + 1]])
+
+        found = np.zeros(len(column["uniques"]), dtype=bool)
+        found[min(postings, key=len)] = True
+        candidates = np.flatnonzero(found)
+
+        # The trigrams of a term with three characters are the term itself
+        if len(term) == 3:
+            return candidates
+
+        # Checks, if the candidates contain the whole term
+        values = column["uniques"] if len(candidates) == len(column["uniques"]) else column["uniques"][candidates]
+        return candidates[np.char.find(values, term) >= 0]
+
+    def matches(self, value: str, term: str) -> bool:
+        """ Checks a single lower case value against a search term, like the index does.
+
+        Parameters
+        ----------
+        value : str
+            The lower case value.
+        term : str
+            The lower case search term.
+
+        Return
+        ----------
+        bool
+        """
+
+        return term in value if len(term) >= 3 else value.startswith(term)
+
+    def search(self, text: str) -> np.ndarray:
+        """ Returns a mask of the rows, which contain all words of the search text.
+        A word may occur in any of the columns.
+
+        Parameters
+        ----------
+        text : str
+            The search text.
+
+        Return
+        ----------
+        numpy.ndarray
+            A bool for every row.
+        """
+
+        size = max([self.size] + [row + 1 for row in self.overlay])
+        mask = np.ones(size, dtype=bool)
+
+        for term in text.lower().split():
+            found = np.zeros(size, dtype=bool)
+            for column in self.columns:
+                hits = np.zeros(len(column["uniques"]), dtype=bool)
+                hits[self.lookup(column, term)] = True
+                found[:self.size] |= hits[column["codes"]]
+
+            for row, values in self.overlay.items():
+                found[row] = any(self.matches(value, term) for value in values)
+            mask &= found
+
+        return mask
+
+    def update_row(self, row: int, values: list) -> None:
+        """ Replaces the indexed values of a row or adds a new row.
+
+        Parameters
+        ----------
+        row : int
+            The row.
+        values : list
+            The new value of every column.
+
+        Return
+        ----------
+        None
+        """
+
+        self.overlay[row] = [str(value).lower() for value in values]
+
+    def remove_rows(self, first: int, count: int) -> None:
+        """ Removes a range of rows, the rows behind it move up.
+
+        Parameters
+        ----------
+        first : int
+            The first removed row.
+        count : int
+            The number of removed rows.
+
+        Return
+        ----------
+        None
+        """
+
+        last = first + count - 1
+        if first < self.size:
+            for column in self.columns:
+                column["codes"] = np.delete(column["codes"], np.s_[first:min(last + 1, self.size)])
+            self.size = len(self.columns[0]["codes"]) if self.columns else 0
+
+        self.overlay = {
+            row - count if row > last else row : values
+            for row, values in self.overlay.items()
+            if not first <= row <= last
+        }
+
+    def compact_rows(self, keep: np.ndarray) -> None:
+        """ Removes scattered rows at once, the remaining rows move up.
+
+        Parameters
+        ----------
+        keep : numpy.ndarray
+            A bool for every row, False for the removed rows.
+
+        Return
+        ----------
+        None
+        """
+
+        new_rows = np.cumsum(keep) - 1
+        for column in self.columns:
+            column["codes"] = column["codes"][keep[:self.size]]
+        self.size = int(np.count_nonzero(keep[:self.size]))
+
+        self.overlay = {int(new_rows[row]) : values for row, values in self.overlay.items() if keep[row]}
+
+    def needs_rebuild(self) -> bool:
+        """ Returns, if the overlay got too large and the index should be rebuilt.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        bool
+        """
+
+        return len(self.overlay) > self.rebuild_threshold
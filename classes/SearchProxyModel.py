@@ -0,0 +1,657 @@
+# Standard classes / libraries
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractProxyModel, QModelIndex, pyqtSignal
+
+# Custom classes / libraries
+from classes.SearchIndex import *
+
+class SearchProxyModel(QAbstractProxyModel):
+    """
+    A class used to show the rows of a TableModel sorted and filtered by a search text.
+
+    Several views can share one TableModel, every view has its own proxy model with
+    its own sort order, search text and unsaved edits. The matching rows are looked up
+    in a SearchIndex over the searchable columns. The index is built on the first
+    search and afterwards patched with every changed, added or removed row. The rows
+    are mapped with arrays, so sorting and filtering don't call Python code per row.
+
+    Methods
+    -------
+    setSourceModel(TableModel)
+        Sets the model with the table rows.
+    set_filter(str)
+        Shows only the rows, which contain all words of the search text.
+    refilter()
+        Looks up the rows matching the search text and maps them to the rows of the proxy model.
+    map_rows()
+        Maps the visible rows of the source model to the rows of the proxy model.
+    mapToSource(QModelIndex)
+        Returns the cell of the source model.
+    mapFromSource(QModelIndex)
+        Returns the cell of the proxy model, an invalid index if the row is hidden.
+    data(QModelIndex, int)
+        Returns the value of a table cell, edited values before the values of the source model.
+    setData(QModelIndex, object, int)
+        Keeps the edited value of a table cell, until the edits are saved or dropped.
+    clear_edits()
+        Drops all edited values.
+    sort(int, Qt.SortOrder)
+        Sorts the rows by a table column.
+    source_data_changed(QModelIndex, QModelIndex, list)
+        Patches the search index with the changed rows and forwards the change of the cells.
+    source_rows_about_to_be_removed(QModelIndex, int, int)
+        Removes the visible rows among the removed source rows.
+    source_rows_removed(QModelIndex, int, int)
+        Moves up the source rows behind the removed source rows.
+    source_rows_about_to_be_compacted(numpy.ndarray)
+        Announces, that the rows are mapped again, before many scattered source rows are removed.
+    source_rows_compacted(numpy.ndarray)
+        Drops the removed source rows and moves up the others, in a single pass.
+    source_rows_inserted(QModelIndex, int, int)
+        Adds the new rows to the search index and shows them, if they match the search text.
+    """
+
+    # Emitted with the proxy cell, after its value was edited
+    cell_edited = pyqtSignal(QModelIndex)
+
+    def __init__(self, search_columns: list, editable: bool = False, extra_columns: list = []) -> None:
+        """
+        Parameters
+        ----------
+        search_columns : list
+            The header labels of the searchable columns.
+        editable : bool
+            If the table cells can be edited.
+        extra_columns : list
+            The header labels of the columns, which are added behind the columns of the
+            source model and have no values, e.g. the column with the "Delete buttons".
+        """
+
+        QAbstractProxyModel.__init__(self)
+
+        self.search_columns = search_columns
+        self.editable = editable
+        self.extra_columns = extra_columns
+        self.search_index = None
+        self.text = ""
+        # Matching source rows, None if no search text is set
+        self.mask = None
+        # All source rows in the sort order
+        self.order = np.zeros(0, dtype=np.int64)
+        # Source row of every proxy row and proxy row of every source row (-1 if hidden)
+        self.rows = np.zeros(0, dtype=np.int64)
+        self.proxy_rows = np.zeros(0, dtype=np.int64)
+        # Edited cells, which are not saved yet: {source row: {column: value}}
+        self.edits = {}
+
+    def setSourceModel(self, model) -> None:
+        """ Sets the model with the table rows.
+
+        Parameters
+        ----------
+        model : TableModel
+            The source model.
+
+        Return
+        ----------
+        None
+        """
+
+        self.beginResetModel()
+        QAbstractProxyModel.setSourceModel(self, model)
+
+        model.dataChanged.connect(self.source_data_changed)
+        model.rowsAboutToBeRemoved.connect(self.source_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self.source_rows_removed)
+        model.rows_about_to_be_compacted.connect(self.source_rows_about_to_be_compacted)
+        model.rows_compacted.connect(self.source_rows_compacted)
+        model.rowsInserted.connect(self.source_rows_inserted)
+        model.modelReset.connect(self.source_reset)
+
+        self.order = np.arange(model.rowCount())
+        self.refilter()
+        self.endResetModel()
+
+    def set_filter(self, text: str) -> None:
+        """ Shows only the rows, which contain all words of the search text.
+
+        Parameters
+        ----------
+        text : str
+            The search text, "" to show all rows.
+
+        Return
+        ----------
+        None
+        """
+
+        self.beginResetModel()
+        self.text = text
+        self.refilter()
+        self.endResetModel()
+
+    def refilter(self) -> None:
+        """ Looks up the rows matching the search text and maps them to the rows of the proxy model.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        if not self.text.strip():
+            self.mask = None
+        else:
+            if self.search_index is None or self.search_index.needs_rebuild():
+                self.search_index = SearchIndex(self.search_values())
+            self.mask = self.search_index.search(self.text)
+        self.map_rows()
+
+    def search_values(self, source_row: int = None) -> list:
+        """ Returns the values of the searchable columns of the source model.
+
+        Parameters
+        ----------
+        source_row : int
+            The source row, None for the whole columns.
+
+        Return
+        ----------
+        list
+        """
+
+        model = self.sourceModel()
+        columns = [model.columns[model.headers.index(label)] for label in self.search_columns if label in model.headers]
+        return columns if source_row is None else [column[source_row] for column in columns]
+
+    def map_rows(self) -> None:
+        """ Maps the visible rows of the source model to the rows of the proxy model.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        self.rows = self.order if self.mask is None else self.order[self.mask[self.order]]
+        self.proxy_rows = np.full(len(self.order), -1, dtype=np.int64)
+        self.proxy_rows[self.rows] = np.arange(len(self.rows))
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """ Returns the cell of the proxy model.
+
+        Parameters
+        ----------
+        row : int
+            The proxy row.
+        column : int
+            The table column.
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+
+        Return
+        ----------
+        PyQt5.QtCore.QModelIndex
+        """
+
+        if parent.isValid() or not (0 <= row < len(self.rows)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        """ Returns an invalid index, the table has no child rows.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The cell of the proxy model.
+
+        Return
+        ----------
+        PyQt5.QtCore.QModelIndex
+        """
+
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """ Returns the number of visible rows.
+
+        Parameters
+        ----------
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+
+        Return
+        ----------
+        int
+        """
+
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """ Returns the number of table columns, including the extra columns.
+
+        Parameters
+        ----------
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+
+        Return
+        ----------
+        int
+        """
+
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount() + len(self.extra_columns)
+
+    def is_extra(self, column: int) -> bool:
+        """ Returns, if a column is one of the extra columns.
+
+        Parameters
+        ----------
+        column : int
+            The table column.
+
+        Return
+        ----------
+        bool
+        """
+
+        return column >= self.sourceModel().columnCount()
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """ Returns the header labels, the rows are numbered in the order shown.
+
+        Parameters
+        ----------
+        section : int
+            The column or row.
+        orientation : PyQt5.QtCore.Qt.Orientation
+            The horizontal or the vertical header.
+        role : int
+            The requested value.
+
+        Return
+        ----------
+        object
+        """
+
+        if orientation == Qt.Vertical:
+            return section + 1 if role == Qt.DisplayRole else None
+        if self.sourceModel() is None:
+            return None
+        if self.is_extra(section):
+            return self.extra_columns[section - self.sourceModel().columnCount()] if role == Qt.DisplayRole else None
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def mapToSource(self, index: QModelIndex) -> QModelIndex:
+        """ Returns the cell of the source model, an invalid index for the extra columns.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The cell of the proxy model.
+
+        Return
+        ----------
+        PyQt5.QtCore.QModelIndex
+        """
+
+        if not index.isValid() or self.is_extra(index.column()):
+            return QModelIndex()
+        return self.sourceModel().index(int(self.rows[index.row()]), index.column())
+
+    def mapFromSource(self, index: QModelIndex) -> QModelIndex:
+        """ Returns the cell of the proxy model, an invalid index if the row is hidden.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The cell of the source model.
+
+        Return
+        ----------
+        PyQt5.QtCore.QModelIndex
+        """
+
+        if not index.isValid() or self.proxy_rows[index.row()] < 0:
+            return QModelIndex()
+        return self.index(int(self.proxy_rows[index.row()]), index.column())
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """ Returns the value of a table cell, edited values before the values of the source model.
+        The values of the source model are also returned for the cells of the extra columns.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The cell of the proxy model.
+        role : int
+            The requested value, e.g. the text or the background color.
+
+        Return
+        ----------
+        object
+        """
+
+        if not index.isValid():
+            return None
+
+        source_row = int(self.rows[index.row()])
+        if role in (Qt.DisplayRole, Qt.EditRole) and index.column() in self.edits.get(source_row, {}):
+            return self.edits[source_row][index.column()]
+        if self.is_extra(index.column()):
+            # The cells of the extra columns hand out the values of the row, e.g. the ID of the customer
+            return self.sourceModel().index(source_row, 0).data(role) if role == Qt.UserRole else None
+        return self.sourceModel().index(source_row, index.column()).data(role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """ Returns, that the table cells can be selected and, if set, edited.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The cell of the proxy model.
+
+        Return
+        ----------
+        PyQt5.QtCore.Qt.ItemFlags
+        """
+
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self.editable and not self.is_extra(index.column()):
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        """ Keeps the edited value of a table cell, until the edits are saved or dropped.
+        The source model is not changed, so the other views keep showing the saved values.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The cell of the proxy model.
+        value : object
+            The new value.
+        role : int
+            Only "Qt.EditRole" is accepted.
+
+        Return
+        ----------
+        bool
+        """
+
+        if not self.editable or role != Qt.EditRole or not index.isValid() or self.is_extra(index.column()):
+            return False
+
+        self.edits.setdefault(int(self.rows[index.row()]), {})[index.column()] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.cell_edited.emit(index)
+        return True
+
+    def clear_edits(self) -> None:
+        """ Drops all edited values, the cells show the values of the source model again.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        edited_rows, self.edits = list(self.edits), {}
+        for source_row in edited_rows:
+            index = self.mapFromSource(self.sourceModel().index(source_row, 0))
+            if index.isValid():
+                self.dataChanged.emit(index, index.siblingAtColumn(self.columnCount() - 1))
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """ Sorts the rows by a table column, by the text of the cells.
+        The extra columns are not sorted.
+
+        Parameters
+        ----------
+        column : int
+            The table column.
+        order : PyQt5.QtCore.Qt.SortOrder
+            Ascending or descending.
+
+        Return
+        ----------
+        None
+        """
+
+        if self.sourceModel() is None or not (0 <= column < self.sourceModel().columnCount()):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        # Source rows of the persistent cells, e.g. the selection
+        persistent = self.persistentIndexList()
+        persistent_rows = [int(self.rows[index.row()]) for index in persistent]
+
+        self.order = self.sourceModel().sorted_rows(column)
+        if order == Qt.DescendingOrder:
+            self.order = self.order[::-1]
+        self.map_rows()
+
+        self.changePersistentIndexList(
+            persistent,
+            [self.mapFromSource(self.sourceModel().index(row, index.column())) for index, row in zip(persistent, persistent_rows)]
+        )
+        self.layoutChanged.emit()
+
+    def source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: list = []) -> None:
+        """ Patches the search index with the changed rows and forwards the change of the cells.
+
+        Parameters
+        ----------
+        top_left : PyQt5.QtCore.QModelIndex
+            The first changed cell of the source model.
+        bottom_right : PyQt5.QtCore.QModelIndex
+            The last changed cell of the source model.
+        roles : list
+            The changed roles.
+
+        Return
+        ----------
+        None
+        """
+
+        for source_row in range(top_left.row(), bottom_right.row() + 1):
+            if self.search_index is not None:
+                self.search_index.update_row(source_row, self.search_values(source_row))
+
+            # Changed rows stay visible, until the search text changes
+            index = self.mapFromSource(self.sourceModel().index(source_row, top_left.column()))
+            if index.isValid():
+                self.dataChanged.emit(index, index.siblingAtColumn(bottom_right.column()), roles)
+
+    def source_rows_about_to_be_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        """ Removes the visible rows among the removed source rows.
+        The rows are sorted, so they are removed as several ranges of proxy rows.
+
+        Parameters
+        ----------
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+        first : int
+            The first removed source row.
+        last : int
+            The last removed source row.
+
+        Return
+        ----------
+        None
+        """
+
+        visible = np.sort(self.proxy_rows[first:last + 1])
+        visible = visible[visible >= 0]
+        if not len(visible):
+            return
+
+        # Ranges of adjacent proxy rows, bottom range first, so the rows in front don't move
+        starts = np.flatnonzero(np.r_[True, np.diff(visible) != 1])
+        ends = np.r_[starts[1:], len(visible)] - 1
+        for start, end in zip(starts[::-1], ends[::-1]):
+            self.beginRemoveRows(QModelIndex(), int(visible[start]), int(visible[end]))
+            self.rows = np.delete(self.rows, np.s_[int(visible[start]):int(visible[end]) + 1])
+            self.endRemoveRows()
+
+        self.proxy_rows = np.full(len(self.order), -1, dtype=np.int64)
+        self.proxy_rows[self.rows] = np.arange(len(self.rows))
+
+    def source_rows_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        """ Moves up the source rows behind the removed source rows.
+
+        Parameters
+        ----------
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+        first : int
+            The first removed source row.
+        last : int
+            The last removed source row.
+
+        Return
+        ----------
+        None
+        """
+
+        count = last - first + 1
+
+        self.order = self.order[(self.order < first) | (self.order > last)]
+        self.order[self.order > last] -= count
+        if self.mask is not None:
+            self.mask = np.delete(self.mask, np.s_[first:last + 1])
+        if self.search_index is not None:
+            self.search_index.remove_rows(first, count)
+        self.edits = {
+            row - count if row > last else row : cells
+            for row, cells in self.edits.items()
+            if not first <= row <= last
+        }
+
+        # The proxy rows don't change, only their source rows
+        self.map_rows()
+
+    def source_rows_about_to_be_compacted(self, keep: np.ndarray) -> None:
+        """ Announces, that the rows are mapped again, before many scattered source rows are removed.
+
+        Parameters
+        ----------
+        keep : numpy.ndarray
+            A bool for every source row, False for the removed rows.
+
+        Return
+        ----------
+        None
+        """
+
+        self.layoutAboutToBeChanged.emit()
+
+    def source_rows_compacted(self, keep: np.ndarray) -> None:
+        """ Drops the removed source rows and moves up the others, in a single pass.
+        The remaining rows keep their order and their visibility.
+
+        Parameters
+        ----------
+        keep : numpy.ndarray
+            A bool for every source row before the removal, False for the removed rows.
+
+        Return
+        ----------
+        None
+        """
+
+        # Source rows of the persistent cells, e.g. the selection
+        persistent = self.persistentIndexList()
+        persistent_rows = [int(self.rows[index.row()]) for index in persistent]
+
+        new_rows = np.cumsum(keep) - 1
+        self.order = new_rows[self.order[keep[self.order]]]
+        if self.mask is not None:
+            self.mask = self.mask[keep]
+        if self.search_index is not None:
+            self.search_index.compact_rows(keep)
+        self.edits = {int(new_rows[row]) : cells for row, cells in self.edits.items() if keep[row]}
+        self.map_rows()
+
+        self.changePersistentIndexList(
+            persistent,
+            [
+                self.index(int(self.proxy_rows[new_rows[row]]), index.column()) if keep[row] else QModelIndex()
+                for index, row in zip(persistent, persistent_rows)
+            ]
+        )
+        self.layoutChanged.emit()
+
+    def source_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        """ Adds the new rows to the search index and shows them, if they match the search text.
+        The new rows are shown at the end of the table, until the table is sorted again.
+
+        Parameters
+        ----------
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+        first : int
+            The first inserted source row.
+        last : int
+            The last inserted source row.
+
+        Return
+        ----------
+        None
+        """
+
+        # Rows are only inserted in the middle, if the source model is reordered, so the rows are mapped from scratch
+        if first != len(self.order):
+            self.source_reset()
+            return
+
+        new_rows = np.arange(first, last + 1)
+        self.order = np.r_[self.order, new_rows]
+
+        if self.search_index is not None:
+            for source_row in new_rows:
+                self.search_index.update_row(int(source_row), self.search_values(int(source_row)))
+        if self.mask is not None:
+            # The rows, which are already shown or hidden, keep their state
+            self.mask = np.r_[self.mask, self.search_index.search(self.text)[first:last + 1]]
+            new_rows = new_rows[self.mask[new_rows]]
+
+        self.proxy_rows = np.r_[self.proxy_rows, np.full(last - first + 1, -1, dtype=np.int64)]
+        if len(new_rows):
+            start = len(self.rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(new_rows) - 1)
+            self.rows = np.r_[self.rows, new_rows]
+            self.proxy_rows[new_rows] = np.arange(start, len(self.rows))
+            self.endInsertRows()
+
+    def source_reset(self) -> None:
+        """ Drops the search index and the edits and maps the rows of the reset source model.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        self.beginResetModel()
+        self.search_index = None
+        self.edits = {}
+        self.order = np.arange(self.sourceModel().rowCount())
+        self.refilter()
+        self.endResetModel()
@@ -1,68 +1,73 @@
-# Standard classes / libraries
-from PyQt5.QtWidgets import QWidget, QGridLayout
-
-# Custom classes / libraries
-from classes.Table import *
-from classes.CustomerSecurityView import *
-
-class SecurityIssuesView(QWidget):
-    """
-    A mockup to show a possible implementation of the security issue overview.
-
-    Methods
-    -------
-    itemclicked()
-        Displays a filtered table based on the clicked customer name.
-    """
-
-    def __init__(self) -> None:
-        """ Initiats the Add customer view.
-
-        Parameters
-        ----------
-        None
-        
-        Return
-        ----------
-        none
-        """
-
-        QWidget.__init__(self)
-
-        self.setWindowTitle("Known Security Issues")
-        self.resize(850, 400)
-        self.move(0, 100)
-        
-        layout = QGridLayout()
-
-        # QTableWidget data
-        data = {
-            "Kundenname" : ["Max Mustermann GmbH", "Max Mustermann GmbH", "Test AG", "Software-Devs GmbH"],
-            "Betroffenes Produkt" : ["CUCM", "IMP", "CUCM", "Expressway"],
-            "Produktversion" : ["12.5.1.17900-64", "12.5.1.15900-66", "14.0.1.10000-20", "X12.7.0"],
-            "Behobene Version" : ["12.5.1.18901-1", "12.5.1.18900-6", "14.0.1.13900-155", "X14.3.1"]
-        }
-
-        # Create a new table widget
-        tab_customers = Table(data, 4, 4)
-        tab_customers.itemClicked.connect(self.itemclicked)
-        layout.addWidget(tab_customers)
-
-        # Arrange the layout of the widgets
-        self.setLayout(layout)
-    
-    def itemclicked(self, item: QWidget) -> None:
-        """ Initiats the Add customer view.
-
-        Parameters
-        ----------
-        item : QWidget
-            The item of the clicked table cell.
-        
-        Return
-        ----------
-        none
-        """
-
-        self.test = CustomerSecurityView(item.text())
+# Standard classes / libraries
+from PyQt5.QtCore import Qt, QModelIndex
+from PyQt5.QtWidgets import QWidget, QGridLayout
+
+# Custom classes / libraries
+from classes.Table import *
+from classes.CustomerSecurityView import *
+from classes.ExposureModel import *
+
+class SecurityIssuesView(QWidget):
+    """
+    A class used to show the known security issues of all customers.
+
+    Every row is a product of a customer, which is affected by a security advisory.
+    The rows follow the shared customer model, see "ExposureModel".
+
+    Methods
+    -------
+    itemclicked()
+        Displays the security issues of the clicked customer.
+    """
+
+    def __init__(self, exposure_model: ExposureModel) -> None:
+        """ Initiats the security issues view.
+
+        Parameters
+        ----------
+        exposure_model : ExposureModel
+            The affected products of the customers.
+        
+        Return
+        ----------
+        none
+        """
+
+        QWidget.__init__(self)
+
+        self.setWindowTitle("Known Security Issues")
+        self.resize(850, 400)
+        self.move(0, 100)
+        
+        layout = QGridLayout()
+
+        self.exposure_model = exposure_model
+
+        # Create a new table widget
+        tab_customers = Table(exposure_model)
+        tab_customers.clicked.connect(self.itemclicked)
+        layout.addWidget(tab_customers)
+
+        # Arrange the layout of the widgets
+        self.setLayout(layout)
+    
+    def itemclicked(self, index: QModelIndex) -> None:
+        """ Displays the security issues of the customer of the clicked row.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The clicked table cell.
+        
+        Return
+        ----------
+        none
+        """
+
+        # The summary and the matches are kept by customer, so nothing is filtered here
+        customer_id = index.data(Qt.UserRole)
+        self.test = CustomerSecurityView(
+            self.exposure_model.customer_summary(customer_id),
+            self.exposure_model.customer_exposures(customer_id)
+        )
         self.test.show()
\ No newline at end of file
@@ -0,0 +1,608 @@
+# Standard classes / libraries
+import pandas as pd
+import numpy as np
+import os
+import sqlite3
+import threading
+
+# Custom classes / libraries
+from interfaces.DatabaseAccess import *
+from classes.helper import changed_rows
+from classes.schema import *
+
+class SqliteAccess(DatabaseAccess):
+    """
+    A class used to provide database access objects, backed by an embedded SQLite database.
+
+    Every CSV file of the application is stored in a table named after the file, e.g.
+    "data/dataset.csv" in the table "dataset". On first access, a missing table is
+    migrated once from the CSV file. The contract expiry dates are stored as ISO dates,
+    so the index on "contract-expire" can be used for date ranges.
+
+    Methods
+    -------
+    read(str, str)
+        Reads the customer datasets with the given value in the given column.
+    read_many(str, list)
+        Reads the customer datasets with any of the given values in the given column.
+    exists(str, list)
+        Checks for every value, if a customer dataset with this value in the given column exists.
+    read_all(str)
+        Reads all datasets of the given file and returns them in a Dataframe.
+    iter_chunks(str, int)
+        Yields all datasets of the given file in Dataframes of at most "chunksize" rows.
+    write()
+        Not used.
+    add(pandas.Dataframe)
+        Adds a new Customer dataset to the database.
+    update(pandas.Dataframe)
+        Updates the customer datasets in the database.
+    update_rows(pandas.Dataframe)
+        Updates single customer datasets, identified by their "id", in the database.
+    delete(pandas.Dataframe)
+        Removes the customer datasets, which are missing in the given Dataframe, from the database.
+    delete_rows(pandas.Dataframe)
+        Deletes single customer datasets, identified by their "id", from the database.
+    delete_values(str, list)
+        Deletes all customer datasets with any of the given values in the given column at once.
+    connect()
+        Returns the connection to the database file.
+    table_name(str)
+        Returns the table name of a file.
+    migrate(str)
+        Creates the table of a file and copies the datasets of the file into it.
+    allocate_ids(sqlite3.Connection, int)
+        Returns unused IDs and marks them as used.
+    """
+
+    # Database file, relative to the application directory
+    database_file = "data/customers.db"
+
+    customer_table = """
+        CREATE TABLE IF NOT EXISTS dataset (
+            "id" INTEGER PRIMARY KEY,
+            "name" TEXT,
+            "number" INTEGER NOT NULL,
+            "cucm" TEXT,
+            "imp" TEXT,
+            "cuc" TEXT,
+            "exp" TEXT,
+            "contract-expire" TEXT
+        )
+    """
+
+    # Released IDs, which are handed out again before the highest ID is increased
+    free_id_table = """
+        CREATE TABLE IF NOT EXISTS dataset_free_ids (
+            "id" INTEGER PRIMARY KEY
+        )
+    """
+
+    customer_indexes = [
+        'CREATE UNIQUE INDEX IF NOT EXISTS dataset_number ON dataset ("number")',
+        'CREATE INDEX IF NOT EXISTS dataset_name ON dataset ("name")',
+        'CREATE INDEX IF NOT EXISTS dataset_contract_expire ON dataset ("contract-expire")'
+    ]
+
+    def __new__(cls):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(SqliteAccess, cls).__new__(cls)
+            cls.instance.connection = None
+            # The connection is shared, the statements are serialized
+            cls.instance.lock = threading.RLock()
+        return cls.instance
+
+    def connect(self) -> sqlite3.Connection:
+        """ Returns the connection to the database file.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        sqlite3.Connection
+        """
+
+        if self.connection is None:
+            self.connection = sqlite3.connect(
+                os.path.join(self.path, self.database_file),
+                check_same_thread=False
+            )
+        return self.connection
+
+    def table_name(self, path: str) -> str:
+        """ Returns the table name of a file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        str
+        """
+
+        return os.path.splitext(os.path.basename(path))[0]
+
+    def migrate(self, path: str) -> None:
+        """ Creates the table of a file and copies the datasets of the file into it.
+        Does nothing, if the table already exists.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        None
+        """
+
+        table = self.table_name(path)
+
+        with self.lock:
+            connection = self.connect()
+
+            exists = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            if exists:
+                if table == "dataset":
+                    # Databases, which were created before the free list existed
+                    with connection:
+                        connection.execute(self.free_id_table)
+                return
+
+            if not os.path.isfile(path):
+                df = None
+            elif table == "dataset":
+                df = read_customers(path)
+            else:
+                df = pd.read_csv(path)
+
+            try:
+                with connection:
+                    # The sqlite3 module doesn't open a transaction for "CREATE" statements by itself
+                    connection.execute("BEGIN")
+                    if table == "dataset":
+                        connection.execute(self.customer_table)
+                        connection.execute(self.free_id_table)
+                        for index in self.customer_indexes:
+                            connection.execute(index)
+                        if df is not None:
+                            df["contract-expire"] = to_iso_dates(df["contract-expire"])
+                            df.to_sql(table, connection, if_exists="append", index=False)
+
+                            # IDs below the highest ID, which are not used yet
+                            ids = df["id"].dropna().astype(int).to_numpy()
+                            free_ids = np.setdiff1d(np.arange(1, ids.max() + 1 if len(ids) else 1), ids)
+                            connection.executemany(
+                                "INSERT INTO dataset_free_ids (id) VALUES (?)",
+                                [(int(free_id),) for free_id in free_ids]
+                            )
+                    elif df is not None:
+                        df.to_sql(table, connection, index=False)
+            except Exception:
+                # pandas commits after "to_sql", so the tables are dropped, too. Otherwise an empty or
+                # partly filled table would be taken as migrated and the migration would never be retried.
+                connection.execute('DROP TABLE IF EXISTS "{}"'.format(table))
+                if table == "dataset":
+                    connection.execute("DROP TABLE IF EXISTS dataset_free_ids")
+                raise
+
+    def read(self, column: str, value: str) -> pd.DataFrame:
+        """ Reads the customer datasets with the given value in the given column.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "name" or "number".
+        value : str
+            The value to look for.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        self.migrate(self.path + "/data/dataset.csv")
+
+        with self.lock:
+            df = pd.read_sql_query(
+                'SELECT * FROM dataset WHERE "{}" = ?'.format(column),
+                self.connect(),
+                params=(value,)
+            )
+        df["contract-expire"] = from_iso_dates(df["contract-expire"])
+        return apply_schema(df)
+
+    def read_many(self, column: str, values: list) -> pd.DataFrame:
+        """ Reads the customer datasets with any of the given values in the given column.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "name" or "number".
+        values : list
+            The values to look for.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        self.migrate(self.path + "/data/dataset.csv")
+
+        values = [str(value) for value in values]
+        chunks = []
+
+        with self.lock:
+            connection = self.connect()
+            # SQLite limits the number of parameters of a statement
+            for start in range(0, len(values), 500):
+                batch = values[start:start + 500]
+                chunks.append(pd.read_sql_query(
+                    'SELECT * FROM dataset WHERE "{}" IN ({})'.format(column, ", ".join("?" * len(batch))),
+                    connection,
+                    params=batch
+                ))
+            if not chunks:
+                chunks.append(pd.read_sql_query("SELECT * FROM dataset LIMIT 0", connection))
+
+        df = pd.concat(chunks, ignore_index=True)
+        df["contract-expire"] = from_iso_dates(df["contract-expire"])
+        return apply_schema(df)
+
+    def exists(self, column: str, values: list) -> np.ndarray:
+        """ Checks for every value, if a customer dataset with this value in the given column exists.
+        The values are looked up in batches, using the indexes of the table.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "name" or "number".
+        values : list
+            The values to look for.
+
+        Return
+        ----------
+        numpy.ndarray
+            A bool for every value.
+        """
+
+        self.migrate(self.path + "/data/dataset.csv")
+
+        values = [str(value) for value in values]
+        stored = set()
+
+        with self.lock:
+            connection = self.connect()
+            # SQLite limits the number of parameters of a statement
+            for start in range(0, len(values), 500):
+                batch = values[start:start + 500]
+                cursor = connection.execute(
+                    'SELECT DISTINCT "{0}" FROM dataset WHERE "{0}" IN ({1})'.format(column, ", ".join("?" * len(batch))),
+                    batch
+                )
+                stored.update(str(value) for (value,) in cursor)
+
+        return np.array([value in stored for value in values], dtype=bool)
+
+    def read_all(self, path: str) -> pd.DataFrame:
+        """ Reads all datasets of the given file and returns them in a Dataframe.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Return
+        ----------
+        pandas.Dataframe
+        """
+
+        df = pd.DataFrame({})
+
+        try:
+            self.migrate(path)
+            table = self.table_name(path)
+            with self.lock:
+                df = pd.read_sql_query('SELECT * FROM "{}" ORDER BY rowid'.format(table), self.connect())
+            if table == "dataset":
+                df["contract-expire"] = from_iso_dates(df["contract-expire"])
+                df = apply_schema(df)
+        except:
+            print("no database")
+        finally:
+            return df
+
+    def iter_chunks(self, path: str, chunksize: int = 50000):
+        """ Yields all datasets of the given file in Dataframes of at most "chunksize" rows.
+        The rows are fetched batch by batch, so a scan can stop early.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        chunksize : int
+            The maximum number of rows per chunk.
+
+        Return
+        ----------
+        generator
+        """
+
+        self.migrate(path)
+        table = self.table_name(path)
+
+        with self.lock:
+            cursor = self.connect().execute('SELECT * FROM "{}" ORDER BY rowid'.format(table))
+            columns = [description[0] for description in cursor.description]
+
+        try:
+            while True:
+                with self.lock:
+                    rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+
+                chunk = pd.DataFrame(rows, columns=columns)
+                if table == "dataset":
+                    chunk["contract-expire"] = from_iso_dates(chunk["contract-expire"])
+                    chunk = apply_schema(chunk)
+                yield chunk
+        finally:
+            cursor.close()
+
+    def write(self):
+        pass
+
+    def add(self, new_customer: pd.DataFrame) -> list:
+        """ Adds a new Customer dataset to the database.
+
+        Parameters
+        ----------
+        new_customer : pandas.Dataframe
+            A dataframe, containing the customer data.
+
+        Return
+        ----------
+        list
+        """
+
+        # Stores the result codes
+        # Element 0:
+        #   False, if an error happened
+        #   True, if no error happend
+        # Element 1:
+        #   Only used in conjunction with "False"
+        #   Defines the type of error
+        result = [False, -1]
+
+        try:
+            self.migrate(self.path + "/data/dataset.csv")
+            with self.lock:
+                connection = self.connect()
+                with connection:
+                    rows = apply_schema(new_customer.copy())
+                    rows["contract-expire"] = to_iso_dates(rows["contract-expire"])
+
+                    # Allocated in the transaction of the insert, so a failed insert releases the IDs with the rollback
+                    rows["id"] = self.allocate_ids(connection, rows.shape[0])
+                    rows.to_sql("dataset", connection, if_exists="append", index=False)
+
+            # The caller only sees the IDs of stored datasets
+            new_customer["id"] = rows["id"].to_numpy()
+            result[0] = True
+        except Exception:
+            # Set to 0 for database error
+            result[1] = 0
+        finally:
+            return result
+
+    def update(self, updated_customers: pd.DataFrame) -> list:
+        """ Updates the customer datasets in the database.
+        Only the rows, which differ from the stored datasets, are written.
+
+        Parameters
+        ----------
+        updated_customers : pandas.Dataframe
+            A dataframe, containing the updated customer datasets.
+
+        Return
+        ----------
+        list
+        """
+
+        return self.update_rows(changed_rows(self.read_all(self.path + "/data/dataset.csv"), updated_customers))
+
+    def update_rows(self, updated_rows: pd.DataFrame) -> list:
+        """ Updates single customer datasets, identified by their "id", in the database.
+
+        Parameters
+        ----------
+        updated_rows : pandas.Dataframe
+            A dataframe, containing only the changed customer datasets.
+
+        Return
+        ----------
+        list
+        """
+
+        # Stores the result codes
+        # Element 0:
+        #   False, if an error happened
+        #   True, if no error happend
+        # Element 1:
+        #   Only used in conjunction with "False"
+        #   Defines the type of error
+        result = [False, -1]
+
+        try:
+            self.migrate(self.path + "/data/dataset.csv")
+            rows = updated_rows.copy()
+            rows["contract-expire"] = to_iso_dates(rows["contract-expire"])
+            columns = [column for column in rows.columns if column != "id"]
+
+            with self.lock:
+                connection = self.connect()
+                with connection:
+                    connection.executemany(
+                        "UPDATE dataset SET {} WHERE id = ?".format(
+                            ", ".join('"{}" = ?'.format(column) for column in columns)
+                        ),
+                        [
+                            [None if pd.isna(value) else str(value) for value in row[columns]] + [int(row["id"])]
+                            for _, row in rows.iterrows()
+                        ]
+                    )
+            result[0] = True
+        except Exception:
+            # Set to 0 for database error
+            result[1] = 0
+        finally:
+            return result
+
+    def delete(self, updated_customers: pd.DataFrame) -> list:
+        """ Removes the customer datasets, which are missing in the given Dataframe, from the database.
+
+        Parameters
+        ----------
+        updated_customers : pandas.Dataframe
+            A dataframe, containing the updated customer datasets.
+
+        Return
+        ----------
+        list
+        """
+
+        try:
+            self.migrate(self.path + "/data/dataset.csv")
+            with self.lock:
+                stored_ids = pd.read_sql_query("SELECT id FROM dataset", self.connect())
+        except Exception:
+            # Set to 0 for database error
+            return [False, 0]
+
+        return self.delete_rows(stored_ids[~stored_ids["id"].isin(updated_customers["id"])])
+
+    def delete_rows(self, deleted_rows: pd.DataFrame) -> list:
+        """ Deletes single customer datasets, identified by their "id", from the database.
+
+        Parameters
+        ----------
+        deleted_rows : pandas.Dataframe
+            A dataframe, containing only the customer datasets to delete.
+
+        Return
+        ----------
+        list
+        """
+
+        # Stores the result codes
+        # Element 0:
+        #   False, if an error happened
+        #   True, if no error happend
+        # Element 1:
+        #   Only used in conjunction with "False"
+        #   Defines the type of error
+        result = [False, -1]
+
+        deleted_ids = [(int(deleted_id),) for deleted_id in deleted_rows["id"]]
+
+        try:
+            self.migrate(self.path + "/data/dataset.csv")
+            with self.lock:
+                connection = self.connect()
+                with connection:
+                    connection.executemany("DELETE FROM dataset WHERE id = ?", deleted_ids)
+                    connection.executemany("INSERT OR IGNORE INTO dataset_free_ids (id) VALUES (?)", deleted_ids)
+            result[0] = True
+        except Exception:
+            # Set to 0 for database error
+            result[1] = 0
+        finally:
+            return result
+
+    def delete_values(self, column: str, values: list) -> list:
+        """ Deletes all customer datasets with any of the given values in the given column at once.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column, e.g. "number".
+        values : list
+            The values of the customer datasets to delete.
+
+        Return
+        ----------
+        list
+        """
+
+        with self.lock:
+            return self.delete_rows(self.read_many(column, values))
+
+    def allocate_ids(self, connection: sqlite3.Connection, count: int) -> list:
+        """ Returns unused IDs and marks them as used.
+        Released IDs are reused first, afterwards the highest ID is increased.
+        Both lookups use the primary keys, so the stored IDs are never scanned.
+
+        Parameters
+        ----------
+        connection : sqlite3.Connection
+            The connection with the open transaction of the insert.
+        count : int
+            The number of IDs.
+
+        Return
+        ----------
+        list
+        """
+
+        new_ids = [
+            row[0] for row in connection.execute(
+                "SELECT id FROM dataset_free_ids ORDER BY id LIMIT ?", (count,)
+            ).fetchall()
+        ]
+        connection.executemany("DELETE FROM dataset_free_ids WHERE id = ?", [(new_id,) for new_id in new_ids])
+
+        high_water = connection.execute(
+            "SELECT MAX(high) FROM (SELECT MAX(id) AS high FROM dataset UNION ALL SELECT MAX(id) FROM dataset_free_ids)"
+        ).fetchone()[0] or 0
+        remaining = count - len(new_ids)
+        new_ids.extend(range(high_water + 1, high_water + remaining + 1))
+        return new_ids
+
+def to_iso_dates(dates: pd.Series) -> pd.Series:
+    """ Converts "d/m/Y" dates or datetime values into ISO dates.
+
+    Parameters
+    ----------
+    dates : pandas.Series
+        The dates.
+
+    Return
+    ----------
+    pandas.Series
+    """
+
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = parse_dates(dates)
+    return dates.dt.strftime("%Y-%m-%d")
+
+def from_iso_dates(dates: pd.Series) -> pd.Series:
+    """ Converts ISO dates into datetime values.
+
+    Parameters
+    ----------
+    dates : pandas.Series
+        The ISO dates.
+
+    Return
+    ----------
+    pandas.Series
+    """
+
+    return pd.to_datetime(dates, format="%Y-%m-%d", errors="coerce")
@@ -0,0 +1,244 @@
+# Standard classes / libraries
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QEventLoop, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+class TaskSignals(QObject):
+    """
+    A class used to report the end of a StorageTask back to the GUI thread.
+    """
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+class StorageTask(QRunnable):
+    """
+    A class used to run a single storage call on the thread of a StorageWorker.
+
+    Methods
+    -------
+    run()
+        Calls the storage function and emits its result or its exception.
+    """
+
+    def __init__(self, function, args: tuple) -> None:
+        """
+        Parameters
+        ----------
+        function : function
+            The storage call, e.g. "db_access.read_all".
+        args : tuple
+            The arguments of the call.
+        """
+
+        QRunnable.__init__(self)
+        # The task is kept by the StorageWorker, until it is done
+        self.setAutoDelete(False)
+
+        self.function = function
+        self.args = args
+        self.signals = TaskSignals()
+        # Set on the worker thread, before the end of the task is emitted
+        self.result = None
+        self.error = None
+        # Cancelled tasks don't call their callbacks
+        self.cancelled = False
+
+    def run(self) -> None:
+        """ Calls the storage function and emits its result or its exception.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        try:
+            self.result = self.function(*self.args)
+        except Exception as error:
+            self.error = error
+            self.signals.failed.emit(error)
+        else:
+            self.signals.finished.emit(self.result)
+
+class StorageWorker(QObject):
+    """
+    A class used to run the storage calls of the Controller off the GUI thread.
+
+    The calls are run one after another on a single background thread, so
+    overlapping requests never access the storage backend at the same time. The
+    results are handed back to the GUI thread with queued signals. While calls are
+    pending, the application shows a busy cursor, except for calls in the background,
+    e.g. the prefetch of the customer datasets.
+
+    Methods
+    -------
+    submit(function, *args, on_finished=function, on_failed=function, busy=bool)
+        Queues a storage call and returns at once.
+    wait(StorageTask)
+        Waits for a queued storage call and returns its result, while the GUI keeps painting.
+    run(function, *args)
+        Runs a storage call and returns its result, while the GUI keeps painting.
+    cancel(StorageTask)
+        Drops a queued storage call or ignores the result of a running one.
+    task_done(StorageTask)
+        Drops a finished task and restores the cursor, when no calls are pending.
+    shutdown()
+        Drops the queued calls and waits for the running one, when the application quits.
+    """
+
+    busy_changed = pyqtSignal(bool)
+    # Emitted on the GUI thread with every finished task
+    task_finished = pyqtSignal(object)
+
+    def __init__(self) -> None:
+        QObject.__init__(self)
+
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)
+        # Queued and running tasks, and the ones among them, which show the busy cursor
+        self.tasks = set()
+        self.busy_tasks = set()
+
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
+
+    def submit(self, function, *args, on_finished=None, on_failed=None, busy: bool = True) -> StorageTask:
+        """ Queues a storage call and returns at once.
+        The callbacks are called on the GUI thread.
+
+        Parameters
+        ----------
+        function : function
+            The storage call.
+        *args
+            The arguments of the call.
+        on_finished : function
+            Called with the result of the call.
+        on_failed : function
+            Called with the exception of the call.
+        busy : bool
+            If the busy cursor is shown, while the call is pending.
+
+        Return
+        ----------
+        StorageTask
+        """
+
+        task = StorageTask(function, args)
+        if on_finished is not None:
+            task.signals.finished.connect(lambda result: None if task.cancelled else on_finished(result))
+        if on_failed is not None:
+            task.signals.failed.connect(lambda error: None if task.cancelled else on_failed(error))
+        task.signals.finished.connect(lambda result: self.task_done(task))
+        task.signals.failed.connect(lambda error: self.task_done(task))
+
+        self.tasks.add(task)
+        if busy:
+            self.busy_tasks.add(task)
+            if len(self.busy_tasks) == 1:
+                QApplication.setOverrideCursor(Qt.WaitCursor)
+                self.busy_changed.emit(True)
+
+        self.pool.start(task)
+        return task
+
+    def wait(self, task: StorageTask):
+        """ Waits for a queued storage call and returns its result, while the GUI keeps painting.
+        User input is held back, until the call is done, so the call can't be started twice.
+
+        Parameters
+        ----------
+        task : StorageTask
+            The task of the call.
+
+        Return
+        ----------
+        object
+            The result of the call. Exceptions of the call are raised again.
+        """
+
+        loop = QEventLoop()
+        self.task_finished.connect(loop.quit)
+        while task in self.tasks:
+            loop.exec_(QEventLoop.ExcludeUserInputEvents)
+        self.task_finished.disconnect(loop.quit)
+
+        if task.error is not None:
+            raise task.error
+        return task.result
+
+    def run(self, function, *args):
+        """ Runs a storage call and returns its result, while the GUI keeps painting.
+
+        Parameters
+        ----------
+        function : function
+            The storage call.
+        *args
+            The arguments of the call.
+
+        Return
+        ----------
+        object
+            The result of the call. Exceptions of the call are raised again.
+        """
+
+        return self.wait(self.submit(function, *args))
+
+    def cancel(self, task: StorageTask) -> None:
+        """ Drops a queued storage call or ignores the result of a running one.
+        A running call can't be interrupted, it ends on the worker thread without calling its callbacks.
+
+        Parameters
+        ----------
+        task : StorageTask
+            The task of the call.
+
+        Return
+        ----------
+        None
+        """
+
+        task.cancelled = True
+        if self.pool.tryTake(task):
+            self.task_done(task)
+
+    def task_done(self, task: StorageTask) -> None:
+        """ Drops a finished task and restores the cursor, when no calls are pending.
+
+        Parameters
+        ----------
+        task : StorageTask
+            The finished task.
+
+        Return
+        ----------
+        None
+        """
+
+        self.tasks.discard(task)
+        if task in self.busy_tasks:
+            self.busy_tasks.discard(task)
+            if not self.busy_tasks:
+                QApplication.restoreOverrideCursor()
+                self.busy_changed.emit(False)
+
+        self.task_finished.emit(task)
+
+    def shutdown(self) -> None:
+        """ Drops the queued calls and waits for the running one, when the application quits.
+        The running call would report to objects, which are already deleted, otherwise.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        self.pool.clear()
+        self.pool.waitForDone()
@@ -1,76 +1,103 @@
-# Standard classes / libraries
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem
-from PyQt5.QtGui import QColor
-from datetime import datetime
-
-class Table(QTableWidget):
-    """
-    A class used to provide QTableWidget objects with predefined table content.
-
-    Methods
-    -------
-    set_data()
-        Sets the values of the table cells.
-    """
-
-    def __init__(self, data: dict, *args) -> None:
-        """ Initiats the Add customer view.
-
-        Parameters
-        ----------
-        data : dict
-            The customer datasets.
-
-        Return
-        ----------
-        none
-        """
-
-        QTableWidget.__init__(self, *args)
-
-        self.data = data
-        self.set_data()
-        self.setSortingEnabled(True)
-        self.sortByColumn(0, Qt.AscendingOrder)
-        self.resizeColumnsToContents()
-        self.resizeRowsToContents()
- 
-    def set_data(self) -> None:
-        """ Sets the values of the table cells.
-
-        Parameters
-        ----------
-        none
-        
-        Return
-        ----------
-        none
-        """
-
-        table_headers = []
-        
-        for col_nr, key in enumerate(self.data.keys()):
-            # Adds each key of the dict
-            table_headers.append(key)
-            for row_nr, content in enumerate(self.data[key]):
-                newitem = QTableWidgetItem(content)
-                self.setItem(row_nr, col_nr, newitem)
-        
-        if "Vertragsende" in self.data:
-            expire_dates = self.data["Vertragsende"]
-
-            # Mark the customer name cells with a color, corresponding to the contract expiry date
-            for idx, expire_date in enumerate(expire_dates):
-                # "Red" if contract is expired
-                if (datetime.strptime(expire_date, "%d/%m/%Y") - datetime.now()).days <= 0:
-                    self.item(idx, 0).setBackground(QColor("#ff6961"))
-                # "Yellow" if the contract expires in the next year
-                elif (datetime.strptime(expire_date, "%d/%m/%Y") - datetime.now()).days <= 365:
-                    self.item(idx, 0).setBackground(QColor("#fdfd96"))
-                # "Green" if contract runs longer than a year
-                else:
-                    self.item(idx, 0).setBackground(QColor("#77dd77"))
-
-        # Adds the headers to the table
-        self.setHorizontalHeaderLabels(table_headers)
\ No newline at end of file
+# Standard classes / libraries
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QTableView, QHeaderView
+
+# Custom classes / libraries
+from classes.TableModel import *
+from classes.SearchProxyModel import *
+
+class Table(QTableView):
+    """
+    A class used to provide QTableView objects with predefined table content.
+
+    The cells are served on demand by a TableModel, so only the visible rows are
+    rendered, no matter how many datasets the table holds. A SearchProxyModel in
+    between sorts the rows and filters them by a search text, so several tables can
+    share one TableModel.
+
+    Methods
+    -------
+    set_data()
+        Sets the model with the values of the table cells.
+    search(str)
+        Shows only the rows, which contain all words of the search text.
+    """
+
+    # Columns, which are looked up by the search
+    search_columns = [
+        "Kundenname",
+        "Kundennummer",
+        "CUCM - Version",
+        "IMP - Version",
+        "CUC - Version",
+        "EXP - Version"
+    ]
+
+    # Number of rows, which are measured to fit the column widths
+    measured_rows = 100
+
+    def __init__(self, data, editable: bool = False, extra_columns: list = []) -> None:
+        """ Initiats the table.
+
+        Parameters
+        ----------
+        data : dict or TableModel
+            The table columns, {header label: list of cell values}, or a shared model.
+        editable : bool
+            If the table cells can be edited.
+        extra_columns : list
+            The header labels of empty columns behind the columns of the model.
+
+        Return
+        ----------
+        none
+        """
+
+        QTableView.__init__(self)
+
+        self.data = data
+        self.editable = editable
+        self.extra_columns = extra_columns
+        self.set_data()
+
+        # All rows have the same height, so the rows don't have to be measured one by one
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # The column widths are measured on the first rows only, not on all of them
+        self.horizontalHeader().setResizeContentsPrecision(self.measured_rows)
+
+        self.setSortingEnabled(True)
+        self.sortByColumn(0, Qt.AscendingOrder)
+        # Only measures the visible rows
+        self.resizeColumnsToContents()
+
+    def set_data(self) -> None:
+        """ Sets the model with the values of the table cells.
+
+        Parameters
+        ----------
+        none
+        
+        Return
+        ----------
+        none
+        """
+
+        self.table_model = self.data if isinstance(self.data, TableModel) else TableModel(self.data)
+        self.search_model = SearchProxyModel(self.search_columns, self.editable, self.extra_columns)
+        self.search_model.setSourceModel(self.table_model)
+        self.setModel(self.search_model)
+
+    def search(self, text: str) -> None:
+        """ Shows only the rows, which contain all words of the search text.
+
+        Parameters
+        ----------
+        text : str
+            The search text, "" to show all rows.
+
+        Return
+        ----------
+        none
+        """
+
+        self.search_model.set_filter(text)
@@ -0,0 +1,365 @@
+# Standard classes / libraries
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor
+from datetime import date
+
+# Custom classes / libraries
+from classes.schema import *
+
+def append_values(buffers: list, size: int, values: list) -> list:
+    """ Writes rows behind the first rows of arrays with spare room at the end.
+    Full arrays are replaced by arrays twice as large, so appending rows one by one
+    copies every row only a few times in total.
+
+    Parameters
+    ----------
+    buffers : list
+        The arrays, the first rows of them are used.
+    size : int
+        The number of used rows.
+    values : list
+        The new rows of every array, in the order of the arrays.
+
+    Return
+    ----------
+    list
+        The arrays, which hold the used and the new rows.
+    """
+
+    count = len(values[0]) if values else 0
+    if buffers and size + count > len(buffers[0]):
+        capacity = 2 * (size + count)
+        buffers = [np.concatenate([buffer[:size], np.empty(capacity - size, dtype=buffer.dtype)]) for buffer in buffers]
+
+    for buffer, new_values in zip(buffers, values):
+        buffer[size:size + count] = new_values
+    return buffers
+
+class TableModel(QAbstractTableModel):
+    """
+    A class used to serve the cells of a Table view on demand from column arrays.
+
+    The model keeps one array per table column, the cells are read, when the view
+    paints them. Sorting and filtering are done by the proxy model of every view,
+    so several views can share one model. Many scattered rows are removed at once,
+    the views are told with a single "rows_compacted" signal instead of one per range.
+
+    Methods
+    -------
+    rowCount(QModelIndex)
+        Returns the number of table rows.
+    columnCount(QModelIndex)
+        Returns the number of table columns.
+    data(QModelIndex, int)
+        Returns the value of a table cell for the given role.
+    headerData(int, Qt.Orientation, int)
+        Returns the header labels.
+    flags(QModelIndex)
+        Returns, that the table cells can be selected.
+    append_rows(dict)
+        Adds rows at the end of the table.
+    set_rows(list, dict)
+        Replaces the values of table rows.
+    remove_rows(list)
+        Removes table rows.
+    delete_rows(numpy.ndarray)
+        Deletes rows from the column arrays.
+    sorted_rows(int)
+        Returns the rows in the ascending order of a column.
+    expiry_color(int)
+        Returns the color of a customer name cell, corresponding to the contract expiry date.
+    """
+
+    # "Red" if contract is expired, "Yellow" if the contract expires in the next year,
+    # "Green" if contract runs longer than a year
+    expiry_colors = {
+        EXPIRY_EXPIRED : QColor("#ff6961"),
+        EXPIRY_WITHIN_YEAR : QColor("#fdfd96"),
+        EXPIRY_LATER : QColor("#77dd77")
+    }
+
+    # Emitted with a bool for every row, which is False for the removed rows, before and after
+    # many scattered rows are removed at once
+    rows_about_to_be_compacted = pyqtSignal(object)
+    rows_compacted = pyqtSignal(object)
+
+    # Number of ranges of adjacent rows, up to which removed rows are announced range by range
+    max_removed_ranges = 10
+
+    def __init__(self, data: dict) -> None:
+        """
+        Parameters
+        ----------
+        data : dict
+            The table columns, {header label: list of cell values}.
+        """
+
+        QAbstractTableModel.__init__(self)
+
+        self.headers = list(data.keys())
+        # The column arrays are the first rows of buffers with spare room, so appended rows don't copy them
+        self.buffers = [np.asarray(values, dtype=object) for values in data.values()]
+        self.columns = list(self.buffers)
+
+        # Expiry class of every row and the day, they were computed for
+        self.expiry = None
+        self.expiry_day = None
+        # Ascending row order of the sorted columns, shared by the proxy models of all views
+        self.sort_orders = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """ Returns the number of table rows.
+
+        Parameters
+        ----------
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+
+        Return
+        ----------
+        int
+        """
+
+        return 0 if parent.isValid() or not self.columns else len(self.columns[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """ Returns the number of table columns.
+
+        Parameters
+        ----------
+        parent : PyQt5.QtCore.QModelIndex
+            Not used, the table has no child rows.
+
+        Return
+        ----------
+        int
+        """
+
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """ Returns the value of a table cell for the given role.
+        The row is returned for the role "Qt.UserRole".
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The table cell.
+        role : int
+            The requested value, e.g. the text or the background color.
+
+        Return
+        ----------
+        object
+            None, if the cell has no value for the role.
+        """
+
+        if not index.isValid():
+            return None
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self.columns[index.column()][index.row()]
+        if role == Qt.UserRole:
+            return index.row()
+        if role == Qt.BackgroundRole and index.column() == 0 and "Vertragsende" in self.headers:
+            return self.expiry_color(index.row())
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """ Returns the header labels.
+
+        Parameters
+        ----------
+        section : int
+            The column or row.
+        orientation : PyQt5.QtCore.Qt.Orientation
+            The horizontal or the vertical header.
+        role : int
+            The requested value.
+
+        Return
+        ----------
+        object
+        """
+
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return section + 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """ Returns, that the table cells can be selected.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The table cell.
+
+        Return
+        ----------
+        PyQt5.QtCore.Qt.ItemFlags
+        """
+
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def append_rows(self, data: dict) -> None:
+        """ Adds rows at the end of the table.
+
+        Parameters
+        ----------
+        data : dict
+            The new rows, {header label: list of cell values}.
+
+        Return
+        ----------
+        None
+        """
+
+        count = len(next(iter(data.values()))) if data else 0
+        if not count:
+            return
+
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self.buffers = append_values(self.buffers, first, [np.asarray(data[label], dtype=object) for label in self.headers])
+        self.columns = [buffer[:first + count] for buffer in self.buffers]
+        self.expiry = None
+        self.sort_orders = {}
+        self.endInsertRows()
+
+    def set_rows(self, rows: list, data: dict) -> None:
+        """ Replaces the values of table rows.
+
+        Parameters
+        ----------
+        rows : list
+            The table rows.
+        data : dict
+            The new values, {header label: list of cell values}, in the order of the rows.
+
+        Return
+        ----------
+        None
+        """
+
+        for label, column in zip(self.headers, self.columns):
+            column[rows] = np.asarray(data[label], dtype=object)
+        self.expiry = None
+        self.sort_orders = {}
+
+        for row in rows:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def remove_rows(self, rows: list) -> None:
+        """ Removes table rows. A few ranges of adjacent rows are announced on their own,
+        many scattered rows are removed at once and announced by "rows_compacted".
+
+        Parameters
+        ----------
+        rows : list
+            The table rows.
+
+        Return
+        ----------
+        None
+        """
+
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        if not len(rows):
+            return
+
+        # Ranges of adjacent rows, bottom range first, so the rows in front don't move
+        starts = np.flatnonzero(np.r_[True, np.diff(rows) != 1])
+        ends = np.r_[starts[1:], len(rows)] - 1
+
+        if len(starts) <= self.max_removed_ranges:
+            for start, end in zip(starts[::-1], ends[::-1]):
+                first, last = int(rows[start]), int(rows[end])
+                keep = np.ones(self.rowCount(), dtype=bool)
+                keep[first:last + 1] = False
+                self.beginRemoveRows(QModelIndex(), first, last)
+                self.delete_rows(keep)
+                self.endRemoveRows()
+            return
+
+        # Every range would copy all column arrays, so all rows are compacted in one go
+        keep = np.ones(self.rowCount(), dtype=bool)
+        keep[rows] = False
+        self.rows_about_to_be_compacted.emit(keep)
+        self.layoutAboutToBeChanged.emit()
+
+        persistent = self.persistentIndexList()
+        new_rows = np.cumsum(keep) - 1
+        self.delete_rows(keep)
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(int(new_rows[index.row()]), index.column()) if keep[index.row()] else QModelIndex() for index in persistent]
+        )
+
+        self.layoutChanged.emit()
+        self.rows_compacted.emit(keep)
+
+    def delete_rows(self, keep: np.ndarray) -> None:
+        """ Deletes rows from the column arrays.
+
+        Parameters
+        ----------
+        keep : numpy.ndarray
+            A bool for every table row, False for the deleted rows.
+
+        Return
+        ----------
+        None
+        """
+
+        size = int(np.count_nonzero(keep))
+        if keep[:size].all():
+            # Only rows at the end are deleted, the arrays are shortened and keep their spare room
+            self.columns = [column[:size] for column in self.columns]
+        else:
+            self.columns = [column[keep] for column in self.columns]
+            self.buffers = list(self.columns)
+        self.expiry = None
+        self.sort_orders = {}
+
+    def sorted_rows(self, column: int) -> np.ndarray:
+        """ Returns the rows in the ascending order of a column, by the text of the cells.
+        The order is kept, until the rows change.
+
+        Parameters
+        ----------
+        column : int
+            The table column.
+
+        Return
+        ----------
+        numpy.ndarray
+        """
+
+        if column not in self.sort_orders:
+            self.sort_orders[column] = np.argsort(np.asarray(self.columns[column], dtype=str), kind="stable")
+        return self.sort_orders[column]
+
+    def expiry_color(self, row: int) -> QColor:
+        """ Returns the color of a customer name cell, corresponding to the contract expiry date.
+
+        Parameters
+        ----------
+        row : int
+            The table row.
+
+        Return
+        ----------
+        PyQt5.QtGui.QColor
+            None, if the row has no valid expiry date.
+        """
+
+        # The classes of all rows are computed at once and kept, until the dates or the day change
+        if self.expiry is None or self.expiry_day != date.today():
+            self.expiry_day = date.today()
+            self.expiry = expiry_classes(pd.Series(self.columns[self.headers.index("Vertragsende")]))
+
+        return self.expiry_colors.get(self.expiry[row])
@@ -1,166 +1,229 @@
-# Standard classes / libraries
-import sys
-import pandas as pd
-from PyQt5.QtCore import pyqtSignal, QPersistentModelIndex
-from PyQt5.QtWidgets import QWidget, QGridLayout, QPushButton, QMessageBox
-
-# Custom classes / libraries
-from classes.Table import *
-from classes.helper import replace_nan
-
-class UpdateCustomerView(QWidget):
-    """
-    A class used to represent the Update Customer View.
-
-    Methods
-    -------
-    raise_main()
-        Switches back to the main menu.
-    update_row()
-        Stores the updated customers table in the database.
-    logout()
-        Logs the user out of the application, to return to the LoginView.
-    """
-
-    switch_main = pyqtSignal()
-    switch_logout = pyqtSignal()
-
-    def __init__(self, cb_update_customer, customer_data: pd.DataFrame) -> None:
-        """ Initiats the Update customer view.
-
-        Parameters
-        ----------
-        cb_update_customer : function
-            The callback function of the Controller class.
-        customer_data : pandas.Dataframe
-            Contains all the customer datasets.
-
-        Return
-        ----------
-        none
-        """
-
-        QWidget.__init__(self)
-
-        self.setWindowTitle("Einen Kunden bearbeiten")
-        self.resize(850, 400)
-        self.cb_update_customer = cb_update_customer
-
-        layout = QGridLayout()
-
-        self.df_customer_data = customer_data
-
-        # QTableWidget data
-        data = {
-            "Kundenname" : self.df_customer_data["name"].map(str).to_list(),
-            "Kundennummer" : self.df_customer_data["number"].map(str).to_list(),
-            "CUCM - Version" : replace_nan(self.df_customer_data["cucm"].map(str).to_list()),
-            "IMP - Version" : replace_nan(self.df_customer_data["imp"].map(str).to_list()),
-            "CUC - Version" : replace_nan(self.df_customer_data["cuc"].map(str).to_list()),
-            "EXP - Version" : replace_nan(self.df_customer_data["exp"].map(str).to_list()),
-            "Vertragsende" : self.df_customer_data["contract-expire"].map(str).to_list()
-        }
-
-        # Create a new table widget
-        self.tab_customers = Table(data, self.df_customer_data.shape[0], self.df_customer_data.shape[1]-1)
-        self.tab_customers.resizeColumnsToContents()
-        self.tab_customers.resizeRowsToContents()
-        layout.addWidget(self.tab_customers)
-
-        # Button to save the updated Table contents to the database.
-        btn_update = QPushButton("Änderungen speichern")
-        btn_update.clicked.connect(self.update_row)
-        layout.addWidget(btn_update)
-        
-        # Button to navigate back to the MainView
-        btn_main = QPushButton("Zurück")
-        btn_main.clicked.connect(self.raise_main)
-        layout.addWidget(btn_main)
-
-        # Button to close the application
-        btn_logout = QPushButton("Logout")
-        btn_logout.clicked.connect(self.logout)
-        layout.addWidget(btn_logout)
-
-        # Button to close the application
-        btn_quit = QPushButton("Beenden")
-        btn_quit.clicked.connect(sys.exit)
-        layout.addWidget(btn_quit)
-
-        # Arrange the layout of the widgets
-        self.setLayout(layout)
-
-    def raise_main(self) -> None:
-        """ Switches back to the main menu.
-        
-        Parameters
-        ----------
-        none
-
-        Return
-        ----------
-        none
-        """
-
-        self.switch_main.emit()
-
-    def update_row(self) -> None:
-        """ Stores the updated customers table in the database.
-
-        Parameters
-        ----------
-        None
-
-        Return
-        ----------
-        None
-        """
-
-        # Gets all the values from the Table widgets cells and updates the dataframe.
-        for row_nr in range(0, self.tab_customers.rowCount()):
-            for col_nr in range(0, self.tab_customers.columnCount()):
-                self.df_customer_data.at[row_nr, list(self.df_customer_data.columns.values)[col_nr+1]] = self.tab_customers.item(row_nr, col_nr).text()
-
-        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
-        ack = False
-        while not ack:
-            choice = QMessageBox.question(
-                None,
-                " ",
-                "Die geänderten Daten speichern?",
-                QMessageBox.Ok,
-                QMessageBox.Cancel
-            )
-            if choice == QMessageBox.Ok:
-                ack = True
-                self.cb_update_customer(self.df_customer_data)
-            if choice == QMessageBox.Cancel:
-                break
-
-    def logout(self) -> None:
-        """ Logs the user out of the application, to return to the LoginView.
-        
-        Parameters
-        ----------
-        none
-
-        Return
-        ----------
-        none
-        """
-
-        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
-        ack = False
-        while not ack:
-            choice = QMessageBox.question(
-                None,
-                " ",
-                "Bitte den Logout bestätigen.",
-                QMessageBox.Ok,
-                QMessageBox.Cancel
-            )
-            if choice == QMessageBox.Ok:
-                ack = True
-                self.switch_logout.emit()
-            if choice == QMessageBox.Cancel:
+# Standard classes / libraries
+import sys
+from PyQt5.QtCore import Qt, pyqtSignal, QModelIndex
+from PyQt5.QtWidgets import QWidget, QGridLayout, QPushButton, QMessageBox, QLineEdit
+
+# Custom classes / libraries
+from classes.Table import *
+from classes.CustomerModel import *
+
+class UpdateCustomerView(QWidget):
+    """
+    A class used to represent the Update Customer View.
+
+    Methods
+    -------
+    raise_main()
+        Switches back to the main menu.
+    cell_changed(index=QModelIndex)
+        Remembers the new value of an edited table cell.
+    update_row()
+        Stores the changed customer datasets in the database.
+    invalid_cells()
+        Returns the header labels of the edited columns with invalid values.
+    logout()
+        Logs the user out of the application, to return to the LoginView.
+    """
+
+    switch_main = pyqtSignal()
+    switch_logout = pyqtSignal()
+
+    def __init__(self, cb_update_customer, customer_model: CustomerModel) -> None:
+        """ Initiats the Update customer view.
+
+        Parameters
+        ----------
+        cb_update_customer : function
+            The callback function of the Controller class.
+        customer_model : CustomerModel
+            The customer datasets, shared with the other views.
+
+        Return
+        ----------
+        none
+        """
+
+        QWidget.__init__(self)
+
+        self.setWindowTitle("Einen Kunden bearbeiten")
+        self.resize(850, 400)
+        self.cb_update_customer = cb_update_customer
+        self.customer_model = customer_model
+
+        layout = QGridLayout()
+
+        # Names of the dataframe columns, in the order of the table columns
+        self.columns = CUSTOMER_COLUMNS[1:]
+        # Edited cells, which are not saved yet: {customer ID: {column name: value}}
+        self.dirty_cells = {}
+
+        # Search box to filter the customers by name, number and versions
+        ent_search = QLineEdit(self)
+        ent_search.setPlaceholderText("Suchen: Kundenname, Kundennummer oder Version")
+        layout.addWidget(ent_search)
+
+        # Create a new table widget
+        # The edits are kept by the table, until they are saved, the other views show the saved values
+        self.tab_customers = Table(customer_model, editable=True)
+        self.tab_customers.search_model.cell_edited.connect(self.cell_changed)
+        ent_search.textChanged.connect(self.tab_customers.search)
+        layout.addWidget(self.tab_customers)
+
+        # Button to save the updated Table contents to the database.
+        btn_update = QPushButton("Änderungen speichern")
+        btn_update.clicked.connect(self.update_row)
+        layout.addWidget(btn_update)
+        
+        # Button to navigate back to the MainView
+        btn_main = QPushButton("Zurück")
+        btn_main.clicked.connect(self.raise_main)
+        layout.addWidget(btn_main)
+
+        # Button to close the application
+        btn_logout = QPushButton("Logout")
+        btn_logout.clicked.connect(self.logout)
+        layout.addWidget(btn_logout)
+
+        # Button to close the application
+        btn_quit = QPushButton("Beenden")
+        btn_quit.clicked.connect(sys.exit)
+        layout.addWidget(btn_quit)
+
+        # Arrange the layout of the widgets
+        self.setLayout(layout)
+
+    def raise_main(self) -> None:
+        """ Switches back to the main menu.
+        
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        self.switch_main.emit()
+
+    def cell_changed(self, index: QModelIndex) -> None:
+        """ Remembers the new value of an edited table cell.
+
+        Parameters
+        ----------
+        index : PyQt5.QtCore.QModelIndex
+            The edited cell of the Table widget.
+
+        Return
+        ----------
+        None
+        """
+
+        customer_id = index.data(Qt.UserRole)
+        self.dirty_cells.setdefault(customer_id, {})[self.columns[index.column()]] = index.data()
+
+    def update_row(self) -> None:
+        """ Stores the changed customer datasets in the database.
+        Only the rows with edited cells are passed to the Controller.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        if not self.dirty_cells:
+            return
+
+        # Edited cells must follow the same rules as the input fields of the AddCustomerView
+        invalid = self.invalid_cells()
+        if invalid:
+            ack = False
+            while not ack:
+                choice = QMessageBox.critical(
+                    None,
+                    " ",
+                    "Die Kundendaten konnten nicht geändert werden!\nUngültige Eingabe: {}".format(", ".join(invalid)),
+                    QMessageBox.Ok
+                )
+                if choice:
+                    ack = True
+            return
+
+        # Takes the stored datasets of the edited customers and applies the edited cells.
+        customer_ids = list(self.dirty_cells.keys())
+        updated_rows = self.customer_model.customer_rows(customer_ids).astype(object)
+        for label, customer_id in zip(updated_rows.index, customer_ids):
+            for column, value in self.dirty_cells[customer_id].items():
+                updated_rows.at[label, column] = value
+
+        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
+        ack = False
+        while not ack:
+            choice = QMessageBox.question(
+                None,
+                " ",
+                "Die geänderten Daten speichern?",
+                QMessageBox.Ok,
+                QMessageBox.Cancel
+            )
+            if choice == QMessageBox.Ok:
+                ack = True
+                if self.cb_update_customer(updated_rows):
+                    # The shared model holds the saved values now
+                    self.dirty_cells = {}
+                    self.tab_customers.search_model.clear_edits()
+            if choice == QMessageBox.Cancel:
+                break
+
+    def invalid_cells(self) -> list:
+        """ Returns the header labels of the edited columns with invalid values.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        list
+            The labels in the order of the table columns, empty if all edited cells are valid.
+        """
+
+        invalid = set()
+        for cells in self.dirty_cells.values():
+            for column, value in cells.items():
+                if not valid_field(column, "" if value is None else str(value)):
+                    invalid.add(self.columns.index(column))
+
+        return [self.customer_model.headerData(column, Qt.Horizontal) for column in sorted(invalid)]
+
+    def logout(self) -> None:
+        """ Logs the user out of the application, to return to the LoginView.
+        
+        Parameters
+        ----------
+        none
+
+        Return
+        ----------
+        none
+        """
+
+        # Runs and displays the MessageBox, as long as the user acknowledges the popup window
+        ack = False
+        while not ack:
+            choice = QMessageBox.question(
+                None,
+                " ",
+                "Bitte den Logout bestätigen.",
+                QMessageBox.Ok,
+                QMessageBox.Cancel
+            )
+            if choice == QMessageBox.Ok:
+                ack = True
+                self.switch_logout.emit()
+            if choice == QMessageBox.Cancel:
                 ack = True
\ No newline at end of file
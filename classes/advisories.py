@@ -0,0 +1,133 @@
+# Standard classes / libraries
+import pandas as pd
+
+# Custom classes / libraries
+from classes.schema import VERSION_COLUMNS
+from classes.versions import version_array, version_order
+
+# Columns of the security advisories, see "classes.feeds". A product version is affected,
+# if it is at least the first affected version and older than the fixed version.
+# An empty first affected version means "all older versions", an empty fixed version "not fixed yet".
+# The severity is one of SEVERITY_RANKS, empty if it is unknown.
+ADVISORY_COLUMNS = ["advisory", "title", "product", "first_affected", "fixed", "severity"]
+
+# Columns of the matched advisories, one row per affected product of a customer, see "AdvisoryIndex.match"
+EXPOSURE_COLUMNS = ["id", "name", "product", "version", "advisory", "title", "fixed", "severity"]
+
+# Columns of the summary of every affected customer, see "summarize_exposures"
+SUMMARY_COLUMNS = ["name", "products", "severity", "count", "fixed"]
+
+# Severities of the advisories, like the CVSS base severity, from the lowest to the highest
+SEVERITY_RANKS = {
+    "" : 0,
+    "low" : 1,
+    "medium" : 2,
+    "high" : 3,
+    "critical" : 4
+}
+
+# Labels of the severities in the views
+SEVERITY_LABELS = {
+    "" : "unbekannt",
+    "low" : "Niedrig",
+    "medium" : "Mittel",
+    "high" : "Hoch",
+    "critical" : "Kritisch"
+}
+
+# Labels of the products in the views, by the version column of the customer datasets
+PRODUCT_LABELS = {
+    "cucm" : "CUCM",
+    "imp" : "IMP",
+    "cuc" : "CUC",
+    "exp" : "Expressway"
+}
+
+def normalize_advisories(df: pd.DataFrame) -> pd.DataFrame:
+    """ Brings advisories of any source into the columns ADVISORY_COLUMNS as text values.
+    Missing columns are left empty, advisories of unknown products are skipped.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The advisories, e.g. a chunk of an advisory file.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    df = df.reindex(columns=ADVISORY_COLUMNS).fillna("").astype(str)
+    for column in ADVISORY_COLUMNS:
+        df[column] = df[column].str.strip()
+    df["product"] = df["product"].str.lower()
+    df["severity"] = df["severity"].str.lower()
+    df.loc[~df["severity"].isin(list(SEVERITY_RANKS)), "severity"] = ""
+    return df[df["product"].isin(VERSION_COLUMNS)].reset_index(drop=True)
+
+def exposure_columns(exposures: pd.DataFrame) -> dict:
+    """ Returns the table columns of matched advisories.
+
+    Parameters
+    ----------
+    exposures : pandas.DataFrame
+        The affected products of the customers, see "AdvisoryIndex.match".
+
+    Return
+    ----------
+    dict
+    """
+
+    return {
+        "Kundenname" : exposures["name"].map(str).to_list(),
+        "Betroffenes Produkt" : exposures["product"].map(PRODUCT_LABELS).to_list(),
+        "Produktversion" : exposures["version"].to_list(),
+        "Behobene Version" : exposures["fixed"].replace("", "nicht behoben").to_list(),
+        "Advisory" : exposures["advisory"].to_list(),
+        "Schweregrad" : exposures["severity"].map(SEVERITY_LABELS).to_list(),
+        "Beschreibung" : exposures["title"].to_list()
+    }
+
+def summarize_exposures(exposures: pd.DataFrame) -> pd.DataFrame:
+    """ Summarizes the matched advisories of every customer: the affected products,
+    the highest severity, the number of matches and the fixed versions.
+    All customers are summarized at once, without a loop over the customers.
+
+    Parameters
+    ----------
+    exposures : pandas.DataFrame
+        The affected products of the customers, see "AdvisoryIndex.match".
+
+    Return
+    ----------
+    pandas.DataFrame
+        The columns SUMMARY_COLUMNS, labelled by the customer ID.
+    """
+
+    ids = pd.Index(exposures["id"].unique(), dtype="int64", name="id")
+    groups = exposures.groupby("id", sort=False)
+
+    # Every product is a bit, so the affected products of a customer are summed up to a single number
+    bits = {product: 1 << bit for bit, product in enumerate(VERSION_COLUMNS)}
+    products = exposures[["id", "product"]].drop_duplicates()
+    masks = products["product"].map(bits).groupby(products["id"], sort=False).sum()
+    mask_labels = {
+        mask: ", ".join(PRODUCT_LABELS[product] for product in VERSION_COLUMNS if mask & bits[product])
+        for mask in range(1 << len(VERSION_COLUMNS))
+    }
+
+    # The fixed versions of every customer in ascending order, e.g. "CUCM 14.0.1.10000-20, IMP 14.0.1.10000-20"
+    fixed = exposures.loc[exposures["fixed"] != "", ["id", "product", "fixed"]].drop_duplicates()
+    fixed = fixed.iloc[version_order(version_array(fixed["fixed"]))]
+    fixed_text = (fixed["product"].map(PRODUCT_LABELS).astype(object) + " " + fixed["fixed"].astype(object)).groupby(fixed["id"], sort=False).agg(", ".join)
+
+    ranks = exposures["severity"].map(SEVERITY_RANKS).fillna(0).astype(int)
+    severities = {rank: severity for severity, rank in SEVERITY_RANKS.items()}
+
+    return pd.DataFrame({
+        "name" : groups["name"].first().reindex(ids),
+        "products" : masks.reindex(ids).map(mask_labels),
+        "severity" : ranks.groupby(exposures["id"], sort=False).max().reindex(ids).map(severities),
+        "count" : groups.size().reindex(ids),
+        "fixed" : fixed_text.reindex(ids, fill_value="")
+    }, index=ids, columns=SUMMARY_COLUMNS)
@@ -0,0 +1,537 @@
+# Standard classes / libraries
+import os
+import re
+import sys
+import json
+import hashlib
+import pandas as pd
+
+# Optional: binary cache of the parsed feeds
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+# Custom classes / libraries
+from classes.advisories import *
+from classes.versions import version_key
+
+# File types of the advisory feeds: CSAF documents, JSON lines and CSV files with the columns ADVISORY_COLUMNS
+FEED_TYPES = (".json", ".jsonl", ".csv")
+
+# Directory of the parsed feeds, inside the feed directory
+CACHE_DIRECTORY = ".cache"
+
+# Part of the cache keys. It is increased, when the parsed format changes, so old cache files aren't read.
+CACHE_FORMAT = 2
+
+# Number of rows of JSON lines and CSV files, which are normalized at once
+CHUNK_ROWS = 10000
+
+# Product names of CSAF documents by version column. The more specific names come first,
+# e.g. "Cisco Unified Communications Manager IM and Presence Service" contains the name of CUCM.
+CSAF_PRODUCT_NAMES = [
+    ("im and presence", "imp"),
+    ("unity connection", "cuc"),
+    ("unified communications manager", "cucm"),
+    ("expressway", "exp")
+]
+
+def load_feeds(directory: str) -> pd.DataFrame:
+    """ Reads the advisories of all feeds in a directory.
+    Unchanged feeds are read from the cache, feeds, which can't be read, are skipped.
+
+    Parameters
+    ----------
+    directory : str
+        The feed directory.
+
+    Return
+    ----------
+    pandas.DataFrame
+        The advisories with the columns ADVISORY_COLUMNS.
+    """
+
+    paths = []
+    if os.path.isdir(directory):
+        paths = sorted(
+            entry.path for entry in os.scandir(directory)
+            if entry.is_file() and entry.name.lower().endswith(FEED_TYPES)
+        )
+
+    cache_directory = os.path.join(directory, CACHE_DIRECTORY)
+    frames = []
+    digests = set()
+    for path in paths:
+        try:
+            digest, df = cached_feed(path, cache_directory)
+        except Exception as error:
+            # A broken vendor file doesn't hide the advisories of the other feeds
+            print("Advisory feed skipped: {} ({})".format(path, error), file=sys.stderr)
+            continue
+        digests.add(digest)
+        frames.append(df)
+
+    remove_stale_cache(cache_directory, digests)
+
+    # The same advisory may be published by several feeds
+    return concat_advisories(frames).drop_duplicates(ignore_index=True)
+
+def concat_advisories(frames: list) -> pd.DataFrame:
+    """ Concatenates advisories, no frames give an empty frame with the columns ADVISORY_COLUMNS.
+
+    Parameters
+    ----------
+    frames : list
+        The advisories of several chunks or feeds.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    if not frames:
+        return pd.DataFrame(columns=ADVISORY_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+def file_digest(path: str) -> str:
+    """ Returns the cache key of a file, the SHA-256 hash of the cache format and the file content.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+
+    Return
+    ----------
+    str
+    """
+
+    digest = hashlib.sha256("{}\n".format(CACHE_FORMAT).encode())
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def cached_feed(path: str, cache_directory: str) -> tuple:
+    """ Returns the advisories of a feed, from the cache, if the feed was parsed before.
+
+    Parameters
+    ----------
+    path : str
+        The path of the feed.
+    cache_directory : str
+        The directory of the parsed feeds.
+
+    Return
+    ----------
+    tuple
+        The cache key and the advisories.
+    """
+
+    digest = file_digest(path)
+    cache_path = os.path.join(cache_directory, digest + ".feather")
+
+    if feather is not None and os.path.exists(cache_path):
+        try:
+            return digest, feather.read_table(cache_path).to_pandas()
+        except Exception:
+            # A damaged cache file is replaced
+            pass
+
+    df = read_feed(path)
+    write_cache(cache_path, df)
+    return digest, df
+
+def write_cache(cache_path: str, df: pd.DataFrame) -> None:
+    """ Stores parsed advisories in the cache.
+    Errors are ignored, as the feed can always be parsed again.
+
+    Parameters
+    ----------
+    cache_path : str
+        The path of the cache file.
+    df : pandas.DataFrame
+        The advisories.
+
+    Return
+    ----------
+    None
+    """
+
+    if feather is None:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        df.reset_index(drop=True).to_feather(cache_path + ".tmp")
+        os.replace(cache_path + ".tmp", cache_path)
+    except Exception:
+        print("no advisory cache", file=sys.stderr)
+
+def remove_stale_cache(cache_directory: str, digests: set) -> None:
+    """ Removes the cache files of feeds, which were changed or deleted.
+
+    Parameters
+    ----------
+    cache_directory : str
+        The directory of the parsed feeds.
+    digests : set
+        The cache keys of the current feeds.
+
+    Return
+    ----------
+    None
+    """
+
+    if not os.path.isdir(cache_directory):
+        return
+
+    for entry in os.scandir(cache_directory):
+        if entry.name.endswith(".feather") and entry.name[:-len(".feather")] not in digests:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+def read_feed(path: str) -> pd.DataFrame:
+    """ Parses the advisories of a feed, by the type of the file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the feed.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    name = path.lower()
+    if name.endswith(".jsonl"):
+        return read_jsonl_feed(path)
+    if name.endswith(".json"):
+        return read_csaf_feed(path)
+    return read_csv_feed(path)
+
+def read_csv_feed(path: str) -> pd.DataFrame:
+    """ Parses a CSV file with the columns ADVISORY_COLUMNS in chunks.
+
+    Parameters
+    ----------
+    path : str
+        The path of the feed.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    frames = []
+    with pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=CHUNK_ROWS) as reader:
+        for chunk in reader:
+            frames.append(normalize_advisories(chunk))
+    return concat_advisories(frames)
+
+def read_jsonl_feed(path: str) -> pd.DataFrame:
+    """ Parses a JSON lines file with one advisory per line, with the keys ADVISORY_COLUMNS.
+    The lines are read and normalized in chunks.
+
+    Parameters
+    ----------
+    path : str
+        The path of the feed.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    frames = []
+    records = []
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                records.append(json.loads(line))
+            if len(records) == CHUNK_ROWS:
+                frames.append(normalize_advisories(pd.DataFrame(records, dtype=object)))
+                records = []
+    if records:
+        frames.append(normalize_advisories(pd.DataFrame(records, dtype=object)))
+    return concat_advisories(frames)
+
+def read_csaf_feed(path: str) -> pd.DataFrame:
+    """ Parses a CSAF 2.0 document.
+    The vulnerabilities are streamed one by one, only their titles, product states and severities are kept.
+
+    The products are taken from the branches of the product tree. Discrete versions
+    are affected until the next fixed version of the vulnerability, version ranges
+    are read from "vers" strings with the constraints ">=", "<" and "*".
+
+    Parameters
+    ----------
+    path : str
+        The path of the feed.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    document = {}
+    product_tree = {}
+    vulnerabilities = []
+    with open(path, "r", encoding="utf-8") as file:
+        for key, value in iter_json_members(file, streamed=("vulnerabilities",)):
+            if key == "document":
+                document = value
+            elif key == "product_tree":
+                product_tree = value
+            elif key == "vulnerabilities":
+                vulnerabilities.append((
+                    value.get("title") or value.get("cve") or "",
+                    value.get("product_status", {}),
+                    csaf_severity(value.get("scores", []))
+                ))
+
+    products = csaf_products(product_tree)
+    advisory = document.get("tracking", {}).get("id") or os.path.basename(path)
+
+    rows = []
+    for title, status, severity in vulnerabilities:
+        # {version column: [affected versions, fixed versions, affected ranges]}
+        versions = {}
+        for category, kind in [("first_affected", 0), ("known_affected", 0), ("first_fixed", 1), ("fixed", 1)]:
+            for product_id in status.get(category, []):
+                if product_id not in products:
+                    continue
+                column, version, version_range = products[product_id]
+                entry = versions.setdefault(column, [[], [], []])
+                if version is not None:
+                    entry[kind].append(version)
+                elif version_range is not None and kind == 0:
+                    entry[2].extend(vers_ranges(version_range))
+
+        for column, (affected, fixed, ranges) in versions.items():
+            for first, fixed_version in version_segments(affected, fixed) + ranges:
+                rows.append([advisory, title or document.get("title", ""), column, first, fixed_version, severity])
+
+    return normalize_advisories(pd.DataFrame(rows, columns=ADVISORY_COLUMNS))
+
+def csaf_severity(scores: list) -> str:
+    """ Returns the highest CVSS base severity of the scores of a CSAF vulnerability.
+
+    Parameters
+    ----------
+    scores : list
+        The scores of the vulnerability.
+
+    Return
+    ----------
+    str
+        One of SEVERITY_RANKS, "" if no score has a known severity.
+    """
+
+    # CVSS v2 scores have no severity
+    severities = [str(score.get("cvss_v3", {}).get("baseSeverity", "")).lower() for score in scores]
+    return max((severity for severity in severities if severity in SEVERITY_RANKS), key=SEVERITY_RANKS.get, default="")
+
+def csaf_products(product_tree: dict) -> dict:
+    """ Returns the products of a CSAF product tree, which are known as version columns.
+
+    Parameters
+    ----------
+    product_tree : dict
+        The product tree of a CSAF document.
+
+    Return
+    ----------
+    dict
+        {product ID: (version column, version, version range)}, version or range is None.
+    """
+
+    # Path of branch categories and names of every product
+    paths = {}
+    branches = [([], branch) for branch in product_tree.get("branches", [])]
+    while branches:
+        path, branch = branches.pop()
+        path = path + [(branch.get("category"), str(branch.get("name", "")))]
+        if "product" in branch:
+            paths[branch["product"].get("product_id")] = path
+        branches.extend((path, child) for child in branch.get("branches", []))
+
+    products = {}
+    for product_id, path in paths.items():
+        names = " ".join(name for category, name in path if category in ("product_family", "product_name")).lower()
+        column = next((column for name, column in CSAF_PRODUCT_NAMES if name in names), None)
+        if column is None:
+            continue
+        version = next((name for category, name in path if category == "product_version"), None)
+        version_range = next((name for category, name in path if category == "product_version_range"), None)
+        if version is not None or version_range is not None:
+            products[product_id] = (column, version, version_range)
+    return products
+
+def version_segments(affected: list, fixed: list) -> list:
+    """ Returns the affected version ranges of discrete affected and fixed versions.
+    A range reaches from an affected version to the next fixed version, without a newer fixed
+    version it is not fixed yet.
+
+    Parameters
+    ----------
+    affected : list
+        The affected versions.
+    fixed : list
+        The fixed versions.
+
+    Return
+    ----------
+    list
+        The ranges, [(first affected version, fixed version or "")].
+    """
+
+    # Affected versions come before equal fixed versions
+    points = sorted(
+        (version_key(version), kind, version)
+        for kind, versions in [(0, affected), (1, fixed)] for version in versions
+        if version_key(version) is not None
+    )
+
+    segments = []
+    first = None
+    for key, kind, version in points:
+        if kind == 0 and first is None:
+            first = version
+        elif kind == 1 and first is not None:
+            segments.append((first, version))
+            first = None
+    if first is not None:
+        segments.append((first, ""))
+    return segments
+
+def vers_ranges(text: str) -> list:
+    """ Returns the version ranges of a "vers" string, e.g. "vers:generic/>=12.5.1|<12.5.1.16900-48".
+    Only the constraints ">=", "<" and "*" can be expressed as ranges, other strings have no ranges.
+
+    Parameters
+    ----------
+    text : str
+        The version range of a CSAF product.
+
+    Return
+    ----------
+    list
+        The ranges, [(first affected version or "", fixed version or "")].
+    """
+
+    match = re.fullmatch(r"\s*vers:[^/]+/(.+)", text)
+    if match is None:
+        return []
+
+    ranges = []
+    first = ""
+    for constraint in match.group(1).split("|"):
+        constraint = constraint.strip()
+        if constraint == "*":
+            return [("", "")]
+        if constraint.startswith(">="):
+            first = constraint[2:].strip()
+        elif constraint.startswith("<") and not constraint.startswith("<="):
+            ranges.append((first, constraint[1:].strip()))
+            first = ""
+        else:
+            return []
+    if first:
+        ranges.append((first, ""))
+    return ranges
+
+def iter_json_members(file, streamed: tuple = (), chunk_size: int = 1 << 16):
+    """ Yields the members of the JSON object in a file, without reading the whole file.
+    The elements of the streamed arrays are yielded one by one, e.g. the vulnerabilities
+    of a CSAF document. All other members are decoded as a whole.
+
+    Parameters
+    ----------
+    file : file object
+        The JSON file, opened as text.
+    streamed : tuple
+        The keys of the arrays, which are streamed.
+    chunk_size : int
+        The number of characters, which are read at once.
+
+    Return
+    ----------
+    generator
+        (key, value) of every member, (key, element) of every element of a streamed array.
+    """
+
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    end_of_file = False
+
+    def fill() -> None:
+        nonlocal buffer, position, end_of_file
+        chunk = file.read(chunk_size)
+        # The decoded part of the buffer is dropped
+        buffer = buffer[position:] + chunk
+        position = 0
+        end_of_file = not chunk
+
+    def peek() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if end_of_file:
+                raise ValueError("Unexpected end of the JSON document")
+            fill()
+
+    def take(expected: str) -> str:
+        nonlocal position
+        character = peek()
+        if character not in expected:
+            raise ValueError("Unexpected {!r} in the JSON document".format(character))
+        position += 1
+        return character
+
+    def decode():
+        nonlocal position
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+                # Objects, arrays and strings end with their closing character. A number is only complete,
+                # if a delimiter follows, a part of it may be decoded already, e.g. "-2." or "1.5e".
+                delimited = buffer[end] in ",]} \t\r\n" if end < len(buffer) else end_of_file
+                if isinstance(value, (dict, list, str)) or delimited:
+                    position = end
+                    return value
+            except json.JSONDecodeError:
+                if end_of_file:
+                    raise
+            fill()
+
+    take("{")
+    if peek() == "}":
+        return
+
+    while True:
+        key = decode()
+        take(":")
+        if key in streamed and peek() == "[":
+            take("[")
+            if peek() == "]":
+                take("]")
+            else:
+                while True:
+                    yield key, decode()
+                    if take(",]") == "]":
+                        break
+        else:
+            yield key, decode()
+
+        if take(",}") == "}":
+            return
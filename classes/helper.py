@@ -1,34 +1,119 @@
-# Standard classes / libraries
-import pandas as pd
-
-def get_row_index(df_column: list, value: str) -> int:
-    """ Returns the index of the value in the dataframe column.
-
-    Parameters
-    ----------
-    df_column : list
-        The column of a dataframe as a list.
-    value : str
-        The search value to look for in the dataframe column.
-    """
-
-    if value in df_column:
-        return df_column.index(value)
-
-def replace_nan(df_column: list) -> list:
-    """ Replaces all "NaN" in an empty Table widget cell with an empty string.
-    
-    Parameters
-    ----------
-    df_column : list
-        The column of a dataframe as a list.
-
-    Return
-    ----------
-    df_column : list
-    """
-
-    for i in range(len(df_column)):
-        if df_column[i] in ["nan"]:
-            df_column[i] = ""
-    return df_column
\ No newline at end of file
+# Standard classes / libraries
+import pandas as pd
+
+# Custom classes / libraries
+from classes.schema import to_text, text_keys
+
+def get_row_index(df_column: list, value: str) -> int:
+    """ Returns the index of the value in the dataframe column.
+
+    Parameters
+    ----------
+    df_column : list
+        The column of a dataframe as a list.
+    value : str
+        The search value to look for in the dataframe column.
+    """
+
+    if value in df_column:
+        return df_column.index(value)
+
+def replace_nan(df_column: list) -> list:
+    """ Replaces all "NaN" in an empty Table widget cell with an empty string.
+    
+    Parameters
+    ----------
+    df_column : list
+        The column of a dataframe as a list.
+
+    Return
+    ----------
+    df_column : list
+    """
+
+    for i in range(len(df_column)):
+        if df_column[i] in ["nan"]:
+            df_column[i] = ""
+    return df_column
+
+def changed_rows(current: pd.DataFrame, updated: pd.DataFrame) -> pd.DataFrame:
+    """ Returns the rows of the updated dataframe, which differ from the current dataframe.
+    The rows are matched by their "id". Rows with an unknown "id" are returned as well.
+
+    Parameters
+    ----------
+    current : pandas.DataFrame
+        The stored datasets.
+    updated : pandas.DataFrame
+        The updated datasets, containing all or only some of the stored datasets.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    columns = [column for column in updated.columns if column != "id" and column in current.columns]
+
+    before = current.drop_duplicates("id").set_index("id").reindex(updated["id"].to_numpy())[columns]
+    after = updated[columns]
+
+    # Dates are compared in the format of the CSV file, regardless if they are parsed or text
+    if "contract-expire" in columns:
+        before = to_text(before)
+        after = to_text(after)
+
+    # Compare the text representation, empty cells of the Table widget equal "NaN" values
+    before = before.astype(object).where(before.notna(), "").astype(str).to_numpy()
+    after = after.astype(object).where(after.notna(), "").astype(str).to_numpy()
+
+    return updated[(before != after).any(axis=1)]
+
+def find_first(chunks, column: str, value: str) -> pd.Series:
+    """ Returns the first row with the given value in the given column.
+    Stops reading the chunks at the first hit.
+
+    Parameters
+    ----------
+    chunks : iterator
+        The Dataframe chunks of the storage, e.g. of DatabaseAccess.iter_chunks().
+    column : str
+        The name of the column.
+    value : str
+        The value to look for.
+
+    Return
+    ----------
+    pandas.Series
+        None, if no row contains the value.
+    """
+
+    for chunk in chunks:
+        hits = chunk[text_keys(chunk[column]) == str(value)]
+        if not hits.empty:
+            chunks.close()
+            return hits.iloc[0]
+    return None
+
+def expiring_between(chunks, start, end) -> pd.DataFrame:
+    """ Returns the customers, whose contract expires between the two dates (both inclusive).
+    Only the matching rows of each chunk are kept.
+
+    Parameters
+    ----------
+    chunks : iterator
+        The Dataframe chunks of the customer datasets, e.g. of DatabaseAccess.iter_chunks().
+    start : datetime
+        The first day of the period.
+    end : datetime
+        The last day of the period.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    matches = []
+    for chunk in chunks:
+        expiry = chunk["contract-expire"]
+        matches.append(chunk[(expiry >= pd.Timestamp(start)) & (expiry <= pd.Timestamp(end))])
+    return pd.concat(matches, ignore_index=True) if matches else pd.DataFrame({})
@@ -0,0 +1,150 @@
+# Standard classes / libraries
+import pandas as pd
+import numpy as np
+import json
+
+# Custom classes / libraries
+from classes.schema import *
+
+def read_import_file(path: str) -> pd.DataFrame:
+    """ Reads the customers of an import file as text values.
+    Files ending with ".jsonl" are read as JSON lines, all other files as CSV files.
+
+    Parameters
+    ----------
+    path : str
+        The path of the import file.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    if path.lower().endswith(".jsonl"):
+        with open(path, "r") as file:
+            records = [json.loads(line) for line in file if line.strip()]
+        # Kept as objects, so numbers aren't turned into floats by missing values
+        df = pd.DataFrame(records, dtype=object)
+        df = df.where(df.notna(), "").astype(str)
+    else:
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+
+    # Missing columns are treated like empty input fields
+    return df.reindex(columns=list(FIELD_PATTERNS), fill_value="")
+
+def join_errors(errors: pd.Series, new_errors: np.ndarray) -> pd.Series:
+    """ Appends the new error messages to the error messages of every row.
+
+    Parameters
+    ----------
+    errors : pandas.Series
+        The error messages so far, "" for rows without errors.
+    new_errors : numpy.ndarray
+        The new error message of every row, "" for rows without errors.
+
+    Return
+    ----------
+    pandas.Series
+    """
+
+    separator = np.where((errors != "") & (new_errors != ""), "; ", "")
+    return errors + separator + new_errors
+
+def validate_customers(df: pd.DataFrame) -> pd.Series:
+    """ Checks all customers of a batch against the input rules of the AddCustomerView.
+    Every rule is checked for the whole column at once.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The customers as text values, as read by read_import_file().
+
+    Return
+    ----------
+    pandas.Series
+        The error messages of every row, "" for valid rows.
+    """
+
+    errors = pd.Series("", index=df.index, dtype=object)
+
+    for column, pattern in FIELD_PATTERNS.items():
+        values = df[column]
+        empty = values == ""
+
+        if column in REQUIRED_FIELDS:
+            errors = join_errors(errors, np.where(empty, "\"{}\" fehlt".format(column), ""))
+        invalid = ~empty & ~values.str.fullmatch(pattern)
+        errors = join_errors(errors, np.where(invalid, "\"{}\" ist ungültig".format(column), ""))
+
+    # The rule of the expiry dates also accepts days, which don't exist, e.g. "31/2/2025"
+    dates = df["contract-expire"]
+    not_a_date = dates.str.fullmatch(CONTRACT_EXPIRY_PATTERN) & parse_dates(dates).isna()
+    errors = join_errors(errors, np.where(not_a_date, "\"contract-expire\" ist kein Datum", ""))
+
+    return errors
+
+def import_customers(db_access, path: str) -> tuple:
+    """ Imports all valid customers of an import file with a single write.
+    The rows with errors are written to a report file next to the import file.
+
+    Parameters
+    ----------
+    db_access : DatabaseAccess
+        The storage backend of the customer datasets.
+    path : str
+        The path of the import file.
+
+    Return
+    ----------
+    tuple
+        The result codes of the write, the imported customers with their IDs and
+        the path of the report file, None if all rows were valid and "" if the report couldn't be written.
+    """
+
+    df = read_import_file(path)
+    errors = validate_customers(df)
+
+    # Numbers like "00042" and "42" are the same customer number
+    numbers = pd.to_numeric(df["number"].where(errors == ""), errors="coerce")
+    keys = {
+        "name" : df["name"],
+        "number" : numbers.map(lambda number: "" if pd.isna(number) else str(int(number)))
+    }
+
+    for column, label in [("name", "Kundenname"), ("number", "Kundennummer")]:
+        valid = errors == ""
+        values = keys[column][valid]
+
+        duplicated = pd.Series(False, index=df.index)
+        duplicated[valid] = values.duplicated().to_numpy()
+        errors = join_errors(errors, np.where(duplicated, "{} kommt mehrfach in der Datei vor".format(label), ""))
+
+        existing = pd.Series(False, index=df.index)
+        existing[valid] = db_access.exists(column, values.to_list())
+        errors = join_errors(errors, np.where(existing, "{} existiert bereits".format(label), ""))
+
+    valid = errors == ""
+    new_customers = df[valid].assign(number=keys["number"][valid]).reset_index(drop=True)
+    # Same column order as the stored datasets
+    new_customers.insert(0, "id", 0)
+
+    # The report is written first, a failed report must not hide customers, which are already saved
+    report_path = None
+    if not valid.all():
+        report = df[~valid].copy()
+        # Line numbers of the import file, CSV files start with a header line
+        report.insert(0, "line", df.index[~valid] + (1 if path.lower().endswith(".jsonl") else 2))
+        report["error"] = errors[~valid]
+        report_path = path + ".errors.csv"
+        try:
+            report.to_csv(report_path, index=False)
+        except OSError:
+            # E.g. the folder of the import file is read-only
+            report_path = ""
+
+    result = [True, -1]
+    if not new_customers.empty:
+        # The storage allocates the IDs of all new customers in one pass
+        result = db_access.add(new_customers)
+
+    return result, new_customers if result[0] else new_customers.iloc[0:0], report_path
@@ -0,0 +1,301 @@
+# Standard classes / libraries
+import pandas as pd
+import numpy as np
+import re
+
+# Columns of the customer datasets in "data/dataset.csv"
+CUSTOMER_COLUMNS = ["id", "name", "number", "cucm", "imp", "cuc", "exp", "contract-expire"]
+
+# Product version columns. Most customers share a few releases, so they are stored as categories.
+VERSION_COLUMNS = ["cucm", "imp", "cuc", "exp"]
+
+# Format of the contract expiry dates in the CSV file and in the views
+DATE_FORMAT = "%d/%m/%Y"
+
+# Integer columns of the customer datasets. A column with invalid values becomes a nullable "Int64" column.
+INTEGER_COLUMNS = ["id", "number"]
+
+# Column types of the customer datasets, the expiry dates are parsed separately
+CUSTOMER_DTYPES = {
+    "id" : "int64",
+    "number" : "int64",
+    "cucm" : "category",
+    "imp" : "category",
+    "cuc" : "category",
+    "exp" : "category"
+}
+
+# Column types, which read the integer columns as text, so invalid values can be converted afterwards
+TEXT_INTEGERS = {column : object for column in INTEGER_COLUMNS}
+
+# Classes of the contract expiry dates, e.g. for the colors of the customer tables
+EXPIRY_UNKNOWN = -1
+EXPIRY_EXPIRED = 0
+EXPIRY_WITHIN_YEAR = 1
+EXPIRY_LATER = 2
+
+# Input rules of the customer fields, shared by the input validators of the views and the bulk import
+NAME_PATTERN = r"^.{1,30}$"
+NUMBER_PATTERN = r"^[0-9]{1,5}$"
+UC_VERSION_PATTERN = r"^[0-9]{2}\.[0-9]\.[0-9]\.[0-9]{5}\-[0-9]{2}$"
+EXP_VERSION_PATTERN = r"^X[0-9]{1,2}\.[0-9]\.[0-9]{1,2}$"
+CONTRACT_EXPIRY_PATTERN = r"^[0-3]?[0-9]\/[0-3]?[0-9]\/20[2-9][3-9]$"
+
+FIELD_PATTERNS = {
+    "name" : NAME_PATTERN,
+    "number" : NUMBER_PATTERN,
+    "cucm" : UC_VERSION_PATTERN,
+    "imp" : UC_VERSION_PATTERN,
+    "cuc" : UC_VERSION_PATTERN,
+    "exp" : EXP_VERSION_PATTERN,
+    "contract-expire" : CONTRACT_EXPIRY_PATTERN
+}
+
+# Fields, which must be set for every customer. The version fields may stay empty.
+REQUIRED_FIELDS = ["name", "number", "contract-expire"]
+
+def valid_field(column: str, value: str) -> bool:
+    """ Checks a single customer field against the input rules of the AddCustomerView.
+
+    Parameters
+    ----------
+    column : str
+        The name of the column, e.g. "number".
+    value : str
+        The field as text, "" for an empty field.
+
+    Return
+    ----------
+    bool
+    """
+
+    if value == "":
+        return column not in REQUIRED_FIELDS
+    if column in FIELD_PATTERNS and not re.fullmatch(FIELD_PATTERNS[column], value):
+        return False
+
+    # The rule of the expiry dates also accepts days, which don't exist, e.g. "31/2/2025"
+    return column != "contract-expire" or not pd.isna(parse_dates(pd.Series([value])).iat[0])
+
+def read_customers(path: str, **kwargs):
+    """ Reads the customer datasets of a CSV file with the declared column types.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    **kwargs
+        Further arguments of pandas.read_csv, e.g. "chunksize".
+
+    Return
+    ----------
+    pandas.DataFrame
+        Or an iterator of Dataframes, if "chunksize" is given.
+    """
+
+    if "chunksize" in kwargs:
+        return read_customer_chunks(path, **kwargs)
+
+    # The expiry dates are read as categories, so every distinct date is only parsed once
+    try:
+        df = pd.read_csv(path, dtype={**CUSTOMER_DTYPES, "contract-expire" : "category"}, **kwargs)
+    except ValueError:
+        # A single invalid number must not make the whole file unreadable, so the numbers are converted afterwards
+        df = to_integers(pd.read_csv(path, dtype={**CUSTOMER_DTYPES, **TEXT_INTEGERS, "contract-expire" : "category"}, **kwargs))
+    return expiry_categories_to_dates(df)
+
+def read_customer_chunks(path: str, **kwargs):
+    """ Yields the customer datasets of a CSV file in chunks, with the declared column types.
+    The file is closed, as soon as the iteration is stopped.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    **kwargs
+        Further arguments of pandas.read_csv, including "chunksize".
+
+    Return
+    ----------
+    generator
+    """
+
+    # A failed chunk can't be read again, so the numbers are always converted afterwards
+    with pd.read_csv(path, dtype={**CUSTOMER_DTYPES, **TEXT_INTEGERS, "contract-expire" : "category"}, **kwargs) as reader:
+        for chunk in reader:
+            yield expiry_categories_to_dates(to_integers(chunk))
+
+def to_integers(df: pd.DataFrame) -> pd.DataFrame:
+    """ Converts the integer columns of customer datasets into integers.
+    Invalid values become missing, without changing the type of the valid values.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The customer datasets, e.g. with the integers as text.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    for column in INTEGER_COLUMNS:
+        if column in df.columns and not pd.api.types.is_integer_dtype(df[column]):
+            numbers = pd.to_numeric(df[column], errors="coerce")
+            # Fractions are as invalid as text
+            numbers = numbers.where(numbers == numbers.round())
+            df[column] = numbers.astype("int64") if numbers.notna().all() else numbers.astype("Int64")
+    return df
+
+def text_keys(values: pd.Series) -> pd.Series:
+    """ Returns values as text, like they are entered in the views. Missing values become empty texts.
+    Unlike "map(str)", the valid values of a nullable integer column are not shown as "1.0".
+
+    Parameters
+    ----------
+    values : pandas.Series
+        The values of a column.
+
+    Return
+    ----------
+    pandas.Series
+    """
+
+    if not values.hasnans:
+        return values.map(str)
+    return values.astype(object).where(values.notna(), "").map(str)
+
+def expiry_categories_to_dates(df: pd.DataFrame) -> pd.DataFrame:
+    """ Converts the categorical "contract-expire" column into datetime values.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The customer datasets, as read by read_customers().
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    dates = df["contract-expire"]
+    codes = dates.cat.codes.to_numpy()
+    parsed = parse_dates(pd.Series(dates.cat.categories, dtype=object)).to_numpy()
+
+    df["contract-expire"] = pd.Series(
+        np.where(codes >= 0, parsed[codes] if len(parsed) else np.datetime64("NaT"), np.datetime64("NaT")),
+        index=df.index
+    )
+    return df
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """ Converts the columns of customer datasets into the declared column types.
+    Columns, which already have the declared type, are left untouched.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The customer datasets, e.g. with the text values of the input widgets.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    # A single invalid number must not turn the valid numbers into floats
+    df = to_integers(df)
+
+    for column in VERSION_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            # Empty input fields are stored as missing versions
+            df[column] = df[column].where(df[column] != "").astype("category")
+
+    if "contract-expire" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["contract-expire"]):
+        df["contract-expire"] = parse_dates(df["contract-expire"])
+
+    return df
+
+def parse_dates(dates: pd.Series) -> pd.Series:
+    """ Converts "d/m/Y" dates into datetime values. Invalid dates become "NaT".
+
+    Parameters
+    ----------
+    dates : pandas.Series
+        The dates as text or datetime values.
+
+    Return
+    ----------
+    pandas.Series
+    """
+
+    return pd.to_datetime(dates, format=DATE_FORMAT, errors="coerce")
+
+def expiry_classes(dates: pd.Series, now: pd.Timestamp = None) -> np.ndarray:
+    """ Classifies the contract expiry dates as expired, expiring within a year or later.
+    All dates are compared to the same point in time.
+
+    Parameters
+    ----------
+    dates : pandas.Series
+        The dates as datetime or text values.
+    now : pandas.Timestamp
+        The point in time to compare with, the current time by default.
+
+    Return
+    ----------
+    numpy.ndarray
+        One of the EXPIRY_* classes for every date.
+    """
+
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = parse_dates(dates)
+    if now is None:
+        now = pd.Timestamp.now()
+
+    # Whole days left, rounded down like datetime.timedelta.days
+    days = ((dates - now) // pd.Timedelta(days=1)).to_numpy(dtype=float, na_value=np.nan)
+
+    classes = np.full(len(days), EXPIRY_LATER, dtype=np.int8)
+    classes[days <= 365] = EXPIRY_WITHIN_YEAR
+    classes[days <= 0] = EXPIRY_EXPIRED
+    classes[np.isnan(days)] = EXPIRY_UNKNOWN
+    return classes
+
+def format_dates(dates: pd.Series) -> pd.Series:
+    """ Converts datetime values into "d/m/Y" dates, e.g. "1/10/2025". Missing dates stay missing.
+
+    Parameters
+    ----------
+    dates : pandas.Series
+        The dates as datetime or text values.
+
+    Return
+    ----------
+    pandas.Series
+    """
+
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = parse_dates(dates)
+
+    # Most customers share a few expiry dates, so every distinct date is only formatted once
+    codes, uniques = pd.factorize(dates)
+    text = np.array(["{}/{}/{}".format(date.day, date.month, date.year) for date in uniques] + [np.nan], dtype=object)
+    return pd.Series(text[codes], index=dates.index, dtype=object)
+
+def to_text(df: pd.DataFrame) -> pd.DataFrame:
+    """ Returns a copy of the customer datasets, with the dates formatted like in the CSV file.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The customer datasets.
+
+    Return
+    ----------
+    pandas.DataFrame
+    """
+
+    df = df.copy()
+    if "contract-expire" in df.columns:
+        df["contract-expire"] = format_dates(df["contract-expire"])
+    return df
@@ -0,0 +1,216 @@
+# Standard classes / libraries
+import sys
+import time
+import threading
+from importlib.abc import MetaPathFinder
+
+# Modules, which are imported in the background, while the login window is shown.
+# The views import them on first use otherwise.
+WARM_UP_MODULES = [
+    "pandas",
+    "classes.helper",
+    "classes.CsvFileAccess",
+    "classes.SqliteAccess",
+    "classes.CustomerModel",
+    "classes.importer",
+    "classes.AdvisoryIndex",
+    "classes.feeds",
+    "classes.MainView",
+    "classes.ShowCustomersView",
+    "classes.AddCustomerView",
+    "classes.UpdateCustomerView",
+    "classes.DeleteCustomerView",
+    "classes.SecurityIssuesView"
+]
+
+def warm_up(modules: list = WARM_UP_MODULES) -> None:
+    """ Imports modules, so they are loaded, before they are needed.
+
+    Parameters
+    ----------
+    modules : list
+        The names of the modules.
+
+    Return
+    ----------
+    None
+    """
+
+    for name in modules:
+        __import__(name)
+
+class TimedLoader:
+    """
+    A class used to measure the time a module loader needs to load a module.
+    All other attributes are passed on to the original loader.
+    """
+
+    def __init__(self, loader, name: str, timer) -> None:
+        """
+        Parameters
+        ----------
+        loader : importlib.abc.Loader
+            The original loader of the module.
+        name : str
+            The name of the module.
+        timer : ImportTimer
+            Collects the times.
+        """
+
+        self.loader = loader
+        self.name = name
+        self.timer = timer
+
+    def __getattr__(self, attribute: str):
+        return getattr(self.loader, attribute)
+
+    def create_module(self, spec):
+        self.timer.start()
+        try:
+            return self.loader.create_module(spec)
+        finally:
+            self.timer.stop(self.name)
+
+    def exec_module(self, module) -> None:
+        self.timer.start()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.timer.stop(self.name)
+
+class ImportTimer(MetaPathFinder):
+    """
+    A class used to measure the import time of every module, for "--profile-startup".
+
+    The timer is put in front of the other finders of "sys.meta_path" and wraps the
+    loaders of the found modules. Like "python -X importtime", it reports the time of
+    every module with and without the modules it imports itself.
+
+    Methods
+    -------
+    install()
+        Starts measuring the imports.
+    find_spec(str, list, module)
+        Finds a module with the other finders and wraps its loader.
+    start()
+        Starts measuring the load of a module.
+    stop(str)
+        Stops measuring the load of a module.
+    report(str, int)
+        Prints the modules imported since the last report, the slowest first.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        # {module: [self time, cumulative time]}, in seconds
+        self.times = {}
+        self.reported = set()
+        self.lock = threading.Lock()
+        # Running loads of every thread: [start time, time of the nested loads]
+        self.local = threading.local()
+
+    def install(self) -> None:
+        """ Starts measuring the imports.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        sys.meta_path.insert(0, self)
+
+    def find_spec(self, name: str, path=None, target=None):
+        """ Finds a module with the other finders and wraps its loader.
+
+        Parameters
+        ----------
+        name : str
+            The name of the module.
+        path : list
+            The search path of a sub module.
+        target : module
+            The module, if it is reloaded.
+
+        Return
+        ----------
+        importlib.machinery.ModuleSpec
+            None, if no finder knows the module.
+        """
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = TimedLoader(spec.loader, name, self)
+                return spec
+        return None
+
+    def start(self) -> None:
+        """ Starts measuring the load of a module.
+
+        Parameters
+        ----------
+        None
+
+        Return
+        ----------
+        None
+        """
+
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        self.local.stack.append([time.perf_counter(), 0.0])
+
+    def stop(self, name: str) -> None:
+        """ Stops measuring the load of a module.
+
+        Parameters
+        ----------
+        name : str
+            The name of the module.
+
+        Return
+        ----------
+        None
+        """
+
+        started, nested = self.local.stack.pop()
+        cumulative = time.perf_counter() - started
+        if self.local.stack:
+            self.local.stack[-1][1] += cumulative
+
+        with self.lock:
+            times = self.times.setdefault(name, [0.0, 0.0])
+            times[0] += cumulative - nested
+            times[1] += cumulative
+
+    def report(self, title: str, limit: int = 25) -> None:
+        """ Prints the modules imported since the last report, the slowest first.
+
+        Parameters
+        ----------
+        title : str
+            The headline of the report.
+        limit : int
+            The number of modules, which are listed.
+
+        Return
+        ----------
+        None
+        """
+
+        with self.lock:
+            times = {name: value for name, value in self.times.items() if name not in self.reported}
+            self.reported.update(times)
+
+        print("{} ({:.0f} ms after start, {} modules imported)".format(
+            title, (time.perf_counter() - self.started) * 1000, len(times)), file=sys.stderr)
+        print("  self [ms] | cumulative [ms] | module", file=sys.stderr)
+        for name, (own, cumulative) in sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:limit]:
+            print("  {:9.1f} | {:15.1f} | {}".format(own * 1000, cumulative * 1000, name), file=sys.stderr)
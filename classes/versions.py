@@ -0,0 +1,211 @@
+# Standard classes / libraries
+import re
+import numpy as np
+import pandas as pd
+
+# Number of version components, which are compared: major, minor, maintenance, build and patch,
+# e.g. "11.5.1.18000-21" has five, "X14.0.9" is filled up to (14, 0, 9, 0, 0)
+VERSION_PARTS = 5
+
+# Components of a missing or unreadable version. They sort before every real version.
+MISSING_VERSION = (-1,) * VERSION_PARTS
+
+# Largest component, larger numbers are cut off, so the components fit into 32 bit
+MAX_COMPONENT = np.iinfo(np.int32).max
+
+# Parsed components of every version text, which has been seen. Most customers share a few
+# releases, so a column of thousands of versions only parses a few new texts.
+_parsed_versions = {}
+
+def version_key(version: str) -> tuple:
+    """ Returns the components of a version, which sort like the version.
+    The numbers of the version are compared one by one, e.g. "X14.0.9" becomes (14, 0, 9, 0, 0).
+
+    Parameters
+    ----------
+    version : str
+        The version, e.g. "11.5.1.18000-21".
+
+    Return
+    ----------
+    tuple
+        None, if the version contains no numbers.
+    """
+
+    key = _parsed_versions.get(version)
+    if key is None and version not in _parsed_versions:
+        parts = [min(int(part), MAX_COMPONENT) for part in re.findall(r"[0-9]+", str(version))][:VERSION_PARTS]
+        key = tuple(parts + [0] * (VERSION_PARTS - len(parts))) if parts else None
+        if isinstance(version, str):
+            _parsed_versions[version] = key
+    return key
+
+def version_array(versions) -> np.ndarray:
+    """ Returns the components of versions as an integer array with one row per version.
+    Missing and unreadable versions get the components MISSING_VERSION.
+
+    Parameters
+    ----------
+    versions : pandas.Series
+        The versions as text or categorical values, e.g. a version column of the customer datasets.
+        Lists and arrays are accepted as well.
+
+    Return
+    ----------
+    numpy.ndarray
+        An int32 array of the shape (number of versions, VERSION_PARTS).
+    """
+
+    # Every distinct version is only looked up once
+    codes, uniques = pd.factorize(pd.Series(versions, dtype=object) if not isinstance(versions, pd.Series) else versions)
+    parsed = np.array([version_key(version) or MISSING_VERSION for version in uniques] + [MISSING_VERSION], dtype=np.int32)
+    return parsed[codes]
+
+def version_missing(versions: np.ndarray) -> np.ndarray:
+    """ Returns, which versions of a version array are missing.
+
+    Parameters
+    ----------
+    versions : numpy.ndarray
+        The versions, see "version_array".
+
+    Return
+    ----------
+    numpy.ndarray
+        A bool array.
+    """
+
+    return versions[..., 0] < 0
+
+def compare_versions(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """ Compares versions component by component, like "cmp" of Python 2.
+    The arrays are broadcast, e.g. a whole column can be compared to a single version.
+
+    Parameters
+    ----------
+    left : numpy.ndarray
+        The versions, see "version_array".
+    right : numpy.ndarray
+        The versions to compare with, or the components of a single version.
+
+    Return
+    ----------
+    numpy.ndarray
+        -1, 0 or 1 for every version, if the left version is older, equal or newer.
+    """
+
+    signs = np.sign(np.asarray(left, dtype=np.int64) - np.asarray(right, dtype=np.int64))
+    # The first differing component decides, equal versions have no differing component
+    first = np.argmax(signs != 0, axis=-1)
+    return np.take_along_axis(signs, first[..., np.newaxis], axis=-1)[..., 0].astype(np.int8)
+
+def versions_older(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """ Returns, which versions are older than the versions to compare with ("<").
+    Missing versions are neither older nor newer than any version.
+
+    Parameters
+    ----------
+    left : numpy.ndarray
+        The versions, see "version_array".
+    right : numpy.ndarray
+        The versions to compare with, or the components of a single version.
+
+    Return
+    ----------
+    numpy.ndarray
+        A bool array.
+    """
+
+    return (compare_versions(left, right) < 0) & ~version_missing(left) & ~version_missing(np.asarray(right))
+
+def versions_at_least(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """ Returns, which versions are at least the versions to compare with (">=").
+    Missing versions are neither older nor newer than any version.
+
+    Parameters
+    ----------
+    left : numpy.ndarray
+        The versions, see "version_array".
+    right : numpy.ndarray
+        The versions to compare with, or the components of a single version.
+
+    Return
+    ----------
+    numpy.ndarray
+        A bool array.
+    """
+
+    return (compare_versions(left, right) >= 0) & ~version_missing(left) & ~version_missing(np.asarray(right))
+
+def versions_in_range(versions: np.ndarray, first: np.ndarray, fixed: np.ndarray) -> np.ndarray:
+    """ Returns, which versions are at least the first version and older than the fixed version.
+    A missing first version includes all older versions, a missing fixed version all newer ones.
+    Missing versions are in no range.
+
+    Parameters
+    ----------
+    versions : numpy.ndarray
+        The versions, see "version_array".
+    first : numpy.ndarray
+        The first versions of the ranges, or the components of a single version.
+    fixed : numpy.ndarray
+        The versions after the ranges, or the components of a single version.
+
+    Return
+    ----------
+    numpy.ndarray
+        A bool array.
+    """
+
+    first = np.asarray(first)
+    fixed = np.asarray(fixed)
+    return (
+        ~version_missing(versions)
+        & ((compare_versions(versions, first) >= 0) | version_missing(first))
+        & ((compare_versions(versions, fixed) < 0) | version_missing(fixed))
+    )
+
+def version_order(versions: np.ndarray) -> np.ndarray:
+    """ Returns the rows of a version array in ascending version order, missing versions first.
+    Equal versions keep their order.
+
+    Parameters
+    ----------
+    versions : numpy.ndarray
+        The versions, see "version_array".
+
+    Return
+    ----------
+    numpy.ndarray
+    """
+
+    # The last key of lexsort is the primary one
+    return np.lexsort(versions.T[::-1])
+
+def version_ranks(*arrays: np.ndarray) -> list:
+    """ Numbers the versions of several arrays by their order, equal versions get the same number.
+    The numbers of all arrays are comparable, so they can be searched like plain integers,
+    e.g. with numpy.searchsorted.
+
+    Parameters
+    ----------
+    *arrays : numpy.ndarray
+        The versions, see "version_array".
+
+    Return
+    ----------
+    list
+        An int64 array of ranks for every array.
+    """
+
+    versions = np.concatenate(arrays) if arrays else np.zeros((0, VERSION_PARTS), dtype=np.int32)
+    order = version_order(versions)
+    ordered = versions[order]
+
+    # A new rank starts at every version, which differs from the one before
+    changes = np.ones(len(ordered), dtype=np.int64)
+    changes[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+    ranks = np.empty(len(versions), dtype=np.int64)
+    ranks[order] = np.cumsum(changes) - 1
+
+    return np.split(ranks, np.cumsum([len(array) for array in arrays])[:-1])
@@ -1,28 +1,52 @@
-from abc import ABC, abstractmethod
-
-# Abstract Class
-class DatabaseAccess(ABC):
-    
-    @abstractmethod
-    def read(self):
-        pass
-
-    @abstractmethod
-    def read_all(self):
-        pass
-
-    @abstractmethod
-    def write(self):
-        pass
-
-    @abstractmethod
-    def add(self):
-        pass
-
-    @abstractmethod
-    def update(self):
-        pass
-
-    @abstractmethod
-    def delete(self):
+from abc import ABC, abstractmethod
+
+# Abstract Class
+class DatabaseAccess(ABC):
+    
+    @abstractmethod
+    def read(self):
+        pass
+
+    @abstractmethod
+    def read_many(self):
+        pass
+
+    @abstractmethod
+    def exists(self):
+        pass
+
+    @abstractmethod
+    def read_all(self):
+        pass
+
+    @abstractmethod
+    def iter_chunks(self):
+        pass
+
+    @abstractmethod
+    def write(self):
+        pass
+
+    @abstractmethod
+    def add(self):
+        pass
+
+    @abstractmethod
+    def update(self):
+        pass
+
+    @abstractmethod
+    def update_rows(self):
+        pass
+
+    @abstractmethod
+    def delete(self):
+        pass
+
+    @abstractmethod
+    def delete_rows(self):
+        pass
+
+    @abstractmethod
+    def delete_values(self):
         pass
\ No newline at end of file
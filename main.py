@@ -1,22 +1,37 @@
-# Standard classes / libraries
-import sys
-import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QFile, QTextStream
-
-# Custom classes / libraries
-from classes.Controller import Controller
-
-if __name__ == "__main__":
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-
-    app = QApplication(sys.argv)
-    
-    # set stylesheet
-    file = QFile(dir_path + "/styles/Ubuntu.qss")
-    file.open(QFile.ReadOnly | QFile.Text)
-    stream = QTextStream(file)
-    app.setStyleSheet(stream.readAll())
-
-    controller = Controller(dir_path)
-    sys.exit(app.exec_())
\ No newline at end of file
+# Standard classes / libraries
+import sys
+import os
+
+# "--profile-startup" reports the import time of every module, so it has to be set up before the other imports
+import_timer = None
+if "--profile-startup" in sys.argv:
+    sys.argv.remove("--profile-startup")
+    from classes.startup import ImportTimer
+    import_timer = ImportTimer()
+    import_timer.install()
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QFile, QTextStream, QTimer
+
+# Custom classes / libraries
+from classes.Controller import Controller
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+
+    app = QApplication(sys.argv)
+
+    # set stylesheet
+    file = QFile(dir_path + "/styles/Ubuntu.qss")
+    file.open(QFile.ReadOnly | QFile.Text)
+    stream = QTextStream(file)
+    app.setStyleSheet(stream.readAll())
+
+    controller = Controller(dir_path)
+
+    if import_timer is not None:
+        # The timer fires, after the event loop painted the login window
+        QTimer.singleShot(0, lambda: import_timer.report("Imports until the login window was painted"))
+        app.aboutToQuit.connect(lambda: import_timer.report("Imports after the login window was painted"))
+
+    sys.exit(app.exec_())